@@ -1,8 +1,12 @@
 from typing import Any
 
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.template.defaultfilters import filesizeformat
 from rest_framework import serializers
 
 from gchqnet.accounts.models import User
+from gchqnet.accounts.provisioning import DEFAULT_CHUNK_SIZE
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -32,3 +36,34 @@ class UserTokenSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["api_token"]
+
+
+class BadgeProvisioningRequestSerializer(serializers.Serializer):
+    manifest = serializers.FileField()
+    format = serializers.ChoiceField(choices=["csv", "json"], required=False)  # noqa: A003
+    chunk_size = serializers.IntegerField(min_value=1, max_value=5000, default=DEFAULT_CHUNK_SIZE)
+
+    def validate_manifest(self, manifest: UploadedFile) -> UploadedFile:
+        # The manifest is provisioned within the request, so larger manifests must use ./manage.py provision_badges.
+        if manifest.size is not None and manifest.size > settings.BADGE_MANIFEST_MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError(
+                f"The manifest must be at most {filesizeformat(settings.BADGE_MANIFEST_MAX_UPLOAD_SIZE)}. "
+                "Use ./manage.py provision_badges for larger manifests."
+            )
+        return manifest
+
+
+class BadgeProvisioningErrorSerializer(serializers.Serializer):
+    row = serializers.IntegerField()
+    mac_address = serializers.CharField()
+    error = serializers.CharField()
+
+
+class BadgeProvisioningResultSerializer(serializers.Serializer):
+    read = serializers.IntegerField()
+    created = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    invalid = serializers.IntegerField()
+    errors = BadgeProvisioningErrorSerializer(many=True)
+    elapsed = serializers.FloatField()
+    rate = serializers.FloatField()
@@ -1,15 +1,21 @@
+import io
+
 from django.conf import settings
 from drf_spectacular.utils import extend_schema
 from rest_framework import exceptions
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.decorators import api_view, parser_classes, permission_classes
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from gchqnet.accounts.models.user import User
+from gchqnet.accounts.provisioning import ManifestError, ManifestFormat, provision_badges, read_manifest
 from gchqnet.accounts.totp import CustomTOTP
 
 from .serializers import (
+    BadgeProvisioningRequestSerializer,
+    BadgeProvisioningResultSerializer,
     UserProfileSerializer,
     UserTokenRequestSerializer,
     UserTokenSerializer,
@@ -68,3 +74,37 @@ def get_auth_token(request: Request) -> Response:
         context={"request": request},
     )
     return Response(response.data)
+
+
+@extend_schema(
+    summary="Provision badges from a manifest",
+    exclude=settings.HIDE_PRIVATE_API_ENDPOINTS,
+    request={"multipart/form-data": BadgeProvisioningRequestSerializer},
+    responses={200: BadgeProvisioningResultSerializer},
+    tags=["Users"],
+)
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+@parser_classes([MultiPartParser])
+def provision_badge_manifest(request: Request) -> Response:
+    serializer = BadgeProvisioningRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    manifest = serializer.validated_data["manifest"]
+    manifest_format: ManifestFormat = "json" if manifest.name.endswith((".json", ".jsonl")) else "csv"
+    if "format" in serializer.validated_data:
+        manifest_format = serializer.validated_data["format"]
+
+    # Large uploads are written to a temporary file, so the manifest is streamed rather than read into memory.
+    stream = io.TextIOWrapper(manifest.file, encoding="utf-8", newline="")
+    try:
+        progress = provision_badges(
+            read_manifest(stream, manifest_format),
+            chunk_size=serializer.validated_data["chunk_size"],
+        )
+    except (ManifestError, UnicodeDecodeError) as e:
+        raise exceptions.ValidationError({"manifest": [str(e)]}) from e
+    finally:
+        stream.detach()
+
+    return Response(BadgeProvisioningResultSerializer(progress).data)
@@ -2,14 +2,20 @@ from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 
 from .models import User
+from .repository import get_user_for_api_token
 
 
 class UserTokenAuthentication(TokenAuthentication):
+    """
+    Authenticate API requests with the API token of a user.
+
+    Most requests are authenticated from the cache, without querying the database. See get_user_for_api_token.
+    """
+
     def authenticate_credentials(self, key: str) -> tuple[User, str]:
-        try:
-            user = User.objects.get(api_token=key)
-        except User.DoesNotExist:
-            raise exceptions.AuthenticationFailed("Invalid token.") from None
+        user = get_user_for_api_token(key)
+        if user is None:
+            raise exceptions.AuthenticationFailed("Invalid token.")
 
         if not user.is_active:
             raise exceptions.AuthenticationFailed("User inactive or deleted.")
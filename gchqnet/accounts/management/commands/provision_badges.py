@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from gchqnet.accounts.provisioning import (
+    DEFAULT_CHUNK_SIZE,
+    ManifestError,
+    ManifestFormat,
+    ProvisioningProgress,
+    provision_badges,
+    read_manifest,
+)
+
+
+class Command(BaseCommand):
+    help = "Create players for badges in a manufacturing manifest, before they first contact the server"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("manifest", type=str, help="A CSV or JSON manifest, or - to read CSV from stdin")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "json"],
+            default=None,
+            help="The format of the manifest. Defaults to the file extension",
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def _report(self, progress: ProvisioningProgress) -> None:
+        self.stdout.write(
+            f"Read {progress['read']} badges: {progress['created']} created, {progress['skipped']} already existed, "
+            f"{progress['invalid']} invalid ({progress['rate']:.0f} badges/s)"
+        )
+
+    def handle(
+        self,
+        *,
+        manifest: str,
+        format: ManifestFormat | None,  # noqa: A002
+        chunk_size: int,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        if chunk_size < 1:
+            raise CommandError("The chunk size must be at least 1")
+
+        manifest_format: ManifestFormat = format or ("json" if manifest.endswith((".json", ".jsonl")) else "csv")
+        try:
+            if manifest == "-":
+                progress = provision_badges(
+                    read_manifest(sys.stdin, manifest_format),
+                    chunk_size=chunk_size,
+                    on_progress=self._report if verbosity > 1 else None,
+                )
+            else:
+                with Path(manifest).open(newline="") as stream:
+                    progress = provision_badges(
+                        read_manifest(stream, manifest_format),
+                        chunk_size=chunk_size,
+                        on_progress=self._report if verbosity > 1 else None,
+                    )
+        except (OSError, ManifestError) as e:
+            raise CommandError(f"Unable to provision badges: {e}") from e
+
+        self._report(progress)
+        for error in progress["errors"]:
+            self.stderr.write(f"Row {error['row']} ({error['mac_address']}): {error['error']}")
+        if progress["invalid"] > len(progress["errors"]):
+            self.stderr.write(f"{progress['invalid'] - len(progress['errors'])} more invalid badges were not reported")
+        self.stdout.write(f"Finished in {progress['elapsed']:.1f}s")
@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings as django_settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from gchqnet.accounts.usernames.pool import refill_username_pool
+
+
+class Command(BaseCommand):
+    help = "Reserve free usernames for new players"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=None,
+            help="The number of usernames to keep in the pool. Defaults to USERNAME_POOL_SIZE",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep refilling the pool every INTERVAL seconds, rather than refilling it once",
+        )
+
+    def _refill(self, size: int) -> None:
+        stats = refill_username_pool(size)
+        self.stdout.write(
+            f"{stats['pool_size']} usernames in the pool, "
+            f"{stats['namespace_remaining']} of {stats['namespace_size']} usernames remaining"
+        )
+        if stats["namespace_remaining"] < size:
+            self.stderr.write("The username namespace is nearly full, usernames will be generated more slowly")
+
+    def handle(
+        self,
+        *,
+        size: int | None,
+        interval: float | None,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        size = size if size is not None else django_settings.USERNAME_POOL_SIZE
+        if interval is None:
+            self._refill(size)
+            return
+
+        while True:
+            self._refill(size)
+            time.sleep(interval)
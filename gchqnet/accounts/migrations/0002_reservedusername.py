@@ -0,0 +1,25 @@
+# Generated by Django 5.0.6 on 2026-10-18 21:02
+
+import django_prometheus.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReservedUsername",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("username", models.CharField(max_length=150, unique=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            bases=(
+                django_prometheus.models.ExportModelOperationsMixin("reserved_username"),
+                models.Model,
+            ),
+        ),
+    ]
@@ -1,8 +1,10 @@
 from .badge import Badge
+from .reserved_username import ReservedUsername
 from .user import User, UserManager, UserQuerySet
 
 __all__ = [
     "Badge",
+    "ReservedUsername",
     "User",
     "UserManager",
     "UserQuerySet",
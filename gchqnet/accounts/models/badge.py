@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Collection
+from typing import Any
 
 from django.core.validators import RegexValidator
 from django.db import models
@@ -29,9 +31,18 @@ class Badge(ExportModelOperationsMixin("badge"), models.Model):  # type: ignore[
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # The MAC address when the badge was loaded or last saved, so that the credentials cached for it can be discarded.
+    saved_mac_address: str | None = None
+
     def __str__(self) -> str:
         return self.mac_address
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Collection[str], values: Collection[Any]) -> Badge:
+        instance = super().from_db(db, field_names, values)
+        instance.saved_mac_address = instance.__dict__.get("mac_address")
+        return instance
+
     @property
     def model_name(self) -> str:
         return "EMF Tildagon (2024)"
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from django.db import models
+from django_prometheus.models import ExportModelOperationsMixin
+
+
+class ReservedUsername(ExportModelOperationsMixin("reserved_username"), models.Model):  # type: ignore[misc]
+    """
+    A username that is free, and reserved for a new player.
+
+    The pool is refilled in the background, so that a badge can be registered without searching for a free username.
+    A username is claimed by deleting its row.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    username = models.CharField(max_length=150, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.username
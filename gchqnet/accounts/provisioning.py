@@ -0,0 +1,190 @@
+"""
+Provision badges in bulk from a manufacturing manifest, before the event opens.
+
+Otherwise, a player and their badge are created when the badge first contacts the server, which happens for
+thousands of badges when the gates open. The manifest is read as a stream and written in chunks, each in its own
+transaction, so provisioning can be interrupted and run again: badges that already exist are skipped.
+
+A manifest is either a CSV file with mac_address and optionally secret columns, or JSON with an object for each badge
+with the same keys, as a list or as one object per line. Badges without a secret have it set on first contact.
+Badges with an invalid MAC address or secret are skipped, and reported with their row in the manifest.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Literal, TypedDict
+
+from django.db import IntegrityError, transaction
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.accounts.usernames.pool import claim_usernames, refill_username_pool
+from gchqnet.quest.repository.rankings import add_scoreboard_entries
+from gchqnet.quest.repository.scores import add_user_scores
+
+ManifestFormat = Literal["csv", "json"]
+
+MAC_ADDRESS_RE = re.compile(r"^([0-9A-F]{2}-){5}[0-9A-F]{2}$")
+DEFAULT_CHUNK_SIZE = 500
+# Every invalid badge is counted, but only the first are reported, so that a bad manifest does not fill the memory.
+MAX_REPORTED_ERRORS = 100
+SECRET_MAX_LENGTH = Badge._meta.get_field("secret").max_length
+
+
+class ManifestEntry(TypedDict):
+    row: int
+    mac_address: str
+    secret: str
+
+
+class ProvisioningError(TypedDict):
+    row: int
+    mac_address: str
+    error: str
+
+
+class ProvisioningProgress(TypedDict):
+    read: int
+    created: int
+    skipped: int
+    invalid: int
+    errors: list[ProvisioningError]
+    elapsed: float
+    rate: float
+
+
+class ManifestError(Exception):
+    pass
+
+
+def _normalise_mac_address(mac_address: str) -> str:
+    return mac_address.strip().upper().replace(":", "-")
+
+
+def _read_json_manifest(stream: IO[str]) -> Iterator[dict[str, str]]:
+    first_line = stream.readline()
+    if first_line.lstrip().startswith("["):
+        # A list must be read in one go.
+        yield from json.loads(first_line + stream.read())
+        return
+
+    for line in itertools.chain([first_line], stream):
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_manifest(stream: IO[str], manifest_format: ManifestFormat) -> Iterator[ManifestEntry]:
+    """Read the badges in a manifest, without validating them."""
+    try:
+        rows: Iterable[dict[str, str]] = (
+            csv.DictReader(stream) if manifest_format == "csv" else _read_json_manifest(stream)
+        )
+        for index, row in enumerate(rows, start=1):
+            if not isinstance(row, dict) or not row.get("mac_address"):
+                raise ManifestError(f"Each badge must have a mac_address: {row!r}")
+            yield ManifestEntry(
+                row=index,
+                mac_address=_normalise_mac_address(str(row["mac_address"])),
+                secret=str(row.get("secret") or ""),
+            )
+    except (csv.Error, ValueError) as e:
+        raise ManifestError(f"Unable to read the manifest: {e}") from e
+
+
+def _validate_entry(entry: ManifestEntry) -> str | None:
+    if not MAC_ADDRESS_RE.match(entry["mac_address"]):
+        return "Invalid MAC address"
+    if SECRET_MAX_LENGTH is not None and len(entry["secret"]) > SECRET_MAX_LENGTH:
+        return f"The secret is longer than {SECRET_MAX_LENGTH} characters"
+    return None
+
+
+def _chunked(entries: Iterable[ManifestEntry], chunk_size: int) -> Iterator[list[ManifestEntry]]:
+    iterator = iter(entries)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _claim_usernames(count: int) -> list[str]:
+    usernames = claim_usernames(count)
+    if len(usernames) < count:
+        refill_username_pool(count - len(usernames))
+        usernames += claim_usernames(count - len(usernames))
+    if len(usernames) < count:
+        raise ManifestError("There are not enough free usernames for the badges")
+    return usernames
+
+
+def _provision_chunk(entries: list[ManifestEntry]) -> tuple[int, int]:
+    """Create the badges in a chunk that do not exist yet, returning the number created and skipped."""
+    new_entries = {entry["mac_address"]: entry for entry in entries}
+    with transaction.atomic():
+        existing = Badge.objects.filter(mac_address__in=new_entries).values_list("mac_address", flat=True)
+        for mac_address in existing:
+            del new_entries[mac_address]
+        if not new_entries:
+            return 0, len(entries)
+
+        usernames = _claim_usernames(len(new_entries))
+        users = User.objects.bulk_create(User(username=username, display_name=username) for username in usernames)
+        Badge.objects.bulk_create(
+            Badge(mac_address=entry["mac_address"], secret=entry["secret"], user=user)
+            for entry, user in zip(new_entries.values(), users, strict=True)
+        )
+        # The scores and scoreboard entries are usually added when a player is saved, but bulk_create does not send
+        # signals.
+        add_user_scores(users)
+        add_scoreboard_entries(users)
+
+    return len(new_entries), len(entries) - len(new_entries)
+
+
+def provision_badges(
+    entries: Iterable[ManifestEntry],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Callable[[ProvisioningProgress], None] | None = None,
+) -> ProvisioningProgress:
+    """
+    Create a player for each badge in a manifest that does not exist yet.
+
+    Each chunk takes a constant number of queries. Badges with an invalid MAC address or secret are counted and
+    skipped, and the first MAX_REPORTED_ERRORS of them are reported.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be at least 1, not {chunk_size}")
+
+    start = time.perf_counter()
+    progress = ProvisioningProgress(read=0, created=0, skipped=0, invalid=0, errors=[], elapsed=0, rate=0)
+
+    for chunk in _chunked(entries, chunk_size):
+        valid = []
+        for entry in chunk:
+            if (error := _validate_entry(entry)) is None:
+                valid.append(entry)
+            elif len(progress["errors"]) < MAX_REPORTED_ERRORS:
+                progress["errors"].append(
+                    ProvisioningError(row=entry["row"], mac_address=entry["mac_address"], error=error)
+                )
+
+        try:
+            created, skipped = _provision_chunk(valid)
+        except IntegrityError:
+            # A badge in the chunk contacted the server while it was being provisioned.
+            created, skipped = _provision_chunk(valid)
+
+        progress["read"] += len(chunk)
+        progress["created"] += created
+        progress["skipped"] += skipped
+        progress["invalid"] += len(chunk) - len(valid)
+        progress["elapsed"] = time.perf_counter() - start
+        progress["rate"] = progress["read"] / progress["elapsed"] if progress["elapsed"] else 0
+        if on_progress is not None:
+            on_progress(progress)
+
+    return progress
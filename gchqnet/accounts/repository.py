@@ -1,9 +1,33 @@
-from typing import Literal, TypedDict
+import hashlib
+from typing import Any, Literal, TypedDict
+from uuid import UUID
 
-from django.utils.crypto import constant_time_compare
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django_prometheus.conf import NAMESPACE
+from prometheus_client import Counter
 
 from gchqnet.accounts.models import Badge, User
 from gchqnet.accounts.usernames import generate_username
+from gchqnet.accounts.usernames.pool import claim_username
+
+BADGE_CREDENTIALS_CACHE_TIMEOUT = 300
+API_TOKEN_CACHE_TIMEOUT = 60
+
+badge_credentials_cache_requests = Counter(
+    "gchqnet_badge_credentials_cache_requests_total",
+    "Number of badge credential lookups, by whether they were found in the cache.",
+    ["result"],
+    namespace=NAMESPACE,
+)
+
+api_token_cache_requests = Counter(
+    "gchqnet_api_token_cache_requests_total",
+    "Number of API token lookups, by whether they were found in the cache.",
+    ["result"],
+    namespace=NAMESPACE,
+)
 
 
 class BadgeCredentialsSuccessfulResult(TypedDict):
@@ -17,15 +41,78 @@ class BadgeCredentialsFailResult(TypedDict):
     result: Literal["failure"]
 
 
+class CachedBadgeCredentials(TypedDict):
+    badge_id: str
+    user_id: int
+    username: str
+    display_name: str
+    secret_hash: str
+    is_enabled: bool
+
+
+# The values of the fields of a user, by attname.
+CachedAPITokenUser = dict[str, Any]
+
+
+def _badge_credentials_cache_key(mac_address: str) -> str:
+    return f"accounts:badge-credentials:{mac_address}"
+
+
+def _hash_badge_secret(badge_secret: str) -> str:
+    return hashlib.sha256(badge_secret.encode()).hexdigest()
+
+
+def invalidate_badge_credentials(*mac_addresses: str) -> None:
+    cache.delete_many([_badge_credentials_cache_key(mac_address) for mac_address in mac_addresses])
+
+
+def _cache_badge_credentials(badge: Badge, user: User) -> None:
+    cache.set(
+        _badge_credentials_cache_key(badge.mac_address),
+        CachedBadgeCredentials(
+            badge_id=str(badge.id),
+            user_id=user.id,
+            username=user.username,
+            display_name=user.display_name,
+            secret_hash=_hash_badge_secret(badge.secret),
+            is_enabled=badge.is_enabled,
+        ),
+        timeout=BADGE_CREDENTIALS_CACHE_TIMEOUT,
+    )
+
+
+def _badge_from_cached_credentials(mac_address: str, credentials: CachedBadgeCredentials) -> tuple[Badge, User]:
+    """
+    Build the badge and user from the cache, without querying the database.
+
+    Fields that are not cached are deferred, so are loaded from the database if they are accessed.
+    """
+    user = User.from_db(
+        None,
+        ["id", "username", "display_name"],
+        [credentials["user_id"], credentials["username"], credentials["display_name"]],
+    )
+    badge = Badge.from_db(
+        None,
+        ["id", "mac_address", "user_id", "is_enabled"],
+        [UUID(credentials["badge_id"]), mac_address, credentials["user_id"], credentials["is_enabled"]],
+    )
+    badge.user = user
+    return badge, user
+
+
 def _handle_unknown_badge(
     mac_address: str,
     badge_secret: str,
 ) -> tuple[Badge, User]:
-    username = generate_username()
-    user = User.objects.create(
-        username=username,
-        display_name=username,
-    )
+    username = claim_username()
+    try:
+        with transaction.atomic():
+            user = User.objects.create(username=username, display_name=username)
+    except IntegrityError:
+        # The username was taken after it was reserved, e.g by an admin.
+        username = generate_username()
+        user = User.objects.create(username=username, display_name=username)
     badge = user.badges.create(mac_address=mac_address, secret=badge_secret)
 
     return badge, user
@@ -35,6 +122,28 @@ def check_badge_credentials(
     mac_address: str,
     badge_secret: str,
 ) -> BadgeCredentialsSuccessfulResult | BadgeCredentialsFailResult:
+    """
+    Check the secret for a badge, registering the badge to a new user if it has not been seen before.
+
+    Badges are looked up in the cache first. Cached credentials are invalidated when the badge or its user is saved.
+    """
+    credentials: CachedBadgeCredentials | None = cache.get(_badge_credentials_cache_key(mac_address))
+
+    # A badge with a blank secret must be updated, so is always read from the database.
+    if credentials is not None and credentials["secret_hash"] != _hash_badge_secret(""):
+        badge_credentials_cache_requests.labels(result="hit").inc()
+        if not constant_time_compare(_hash_badge_secret(badge_secret), credentials["secret_hash"]):
+            return BadgeCredentialsFailResult(result="failure")
+
+        badge, user = _badge_from_cached_credentials(mac_address, credentials)
+        return BadgeCredentialsSuccessfulResult(
+            result="success",
+            badge=badge,
+            user=user,
+            new_user=False,
+        )
+
+    badge_credentials_cache_requests.labels(result="miss").inc()
     try:
         badge = Badge.objects.select_related("user").get(
             mac_address=mac_address,
@@ -46,6 +155,8 @@ def check_badge_credentials(
             badge.secret = badge_secret
             badge.save()
 
+        _cache_badge_credentials(badge, badge.user)
+
         if not constant_time_compare(badge_secret, badge.secret):
             return BadgeCredentialsFailResult(result="failure")
 
@@ -57,9 +168,78 @@ def check_badge_credentials(
         )
     except Badge.DoesNotExist:
         badge, user = _handle_unknown_badge(mac_address, badge_secret)
+        _cache_badge_credentials(badge, user)
         return BadgeCredentialsSuccessfulResult(
             result="success",
             badge=badge,
             user=user,
             new_user=True,
         )
+
+
+def _hash_api_token(api_token: str) -> str:
+    """A keyed hash of an API token, so that tokens are not used as cache keys."""
+    return salted_hmac("gchqnet.accounts.api_token", api_token, algorithm="sha256").hexdigest()
+
+
+def _api_token_cache_key(api_token_hash: str) -> str:
+    return f"accounts:api-token:v2:{api_token_hash}"
+
+
+def _api_token_cached_field_names() -> list[str]:
+    """
+    Get the fields of a user that are cached for their API token, in the order of the fields of the model.
+
+    Every field is cached, so that views can read any of them without a query, except the password, which is not needed
+    to authenticate with a token, and the token itself, which is not stored in the cache.
+    """
+    return [
+        field.attname
+        for field in User._meta.fields
+        if field.concrete and field.attname not in ("password", "api_token")
+    ]
+
+
+def _api_token_user_cache_key(user_id: int) -> str:
+    return f"accounts:api-token-user:{user_id}"
+
+
+def invalidate_api_token(user_id: int) -> None:
+    """Discard the cached user for the API token of a user, e.g after the token has been rotated."""
+    if (api_token_hash := cache.get(_api_token_user_cache_key(user_id))) is not None:
+        cache.delete_many([_api_token_cache_key(api_token_hash), _api_token_user_cache_key(user_id)])
+
+
+def get_user_for_api_token(api_token: str) -> User | None:
+    """
+    Get the user with an API token.
+
+    Users are looked up in the cache by a keyed hash of the token first, then by the token in the database. Cached
+    users are invalidated when the user is saved, and otherwise expire quickly. Every field of the user is loaded,
+    except the password, which is deferred, so is loaded from the database if it is accessed.
+    """
+    api_token_hash = _hash_api_token(api_token)
+    cached: CachedAPITokenUser | None = cache.get(_api_token_cache_key(api_token_hash))
+    if cached is not None:
+        api_token_cache_requests.labels(result="hit").inc()
+        values = cached | {"api_token": api_token}
+        # The values must be in the same order as the fields of the model.
+        field_names = [field.attname for field in User._meta.fields if field.concrete and field.attname in values]
+        return User.from_db(None, field_names, [values[name] for name in field_names])
+
+    api_token_cache_requests.labels(result="miss").inc()
+    try:
+        user = User.objects.defer("password").get(api_token=api_token)
+    except User.DoesNotExist:
+        return None
+
+    cache.set_many(
+        {
+            _api_token_cache_key(api_token_hash): {
+                name: getattr(user, name) for name in _api_token_cached_field_names()
+            },
+            _api_token_user_cache_key(user.id): api_token_hash,
+        },
+        timeout=API_TOKEN_CACHE_TIMEOUT,
+    )
+    return user
@@ -0,0 +1,55 @@
+from typing import Any
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.accounts.repository import invalidate_api_token, invalidate_badge_credentials
+
+BADGE_CREDENTIALS_USER_FIELDS = {"username", "display_name"}
+API_TOKEN_USER_FIELDS = {"username", "display_name", "is_active", "is_superuser", "api_token"}
+
+
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+def invalidate_badge_credentials_on_badge_change(sender: type[Badge], instance: Badge, **kwargs: Any) -> None:
+    # If the MAC address has been changed, the credentials are also cached under the old one.
+    mac_addresses = [instance.mac_address]
+    if instance.saved_mac_address is not None and instance.saved_mac_address != instance.mac_address:
+        mac_addresses.append(instance.saved_mac_address)
+    invalidate_badge_credentials(*mac_addresses)
+    instance.saved_mac_address = instance.mac_address
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_badge_credentials_on_user_save(
+    sender: type[User],
+    instance: User,
+    raw: bool,  # noqa: FBT001
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    if raw or (update_fields is not None and not BADGE_CREDENTIALS_USER_FIELDS & update_fields):
+        return
+    mac_addresses = list(instance.badges.values_list("mac_address", flat=True))
+    if mac_addresses:
+        invalidate_badge_credentials(*mac_addresses)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_api_token_on_user_save(
+    sender: type[User],
+    instance: User,
+    raw: bool,  # noqa: FBT001
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    if raw or (update_fields is not None and not API_TOKEN_USER_FIELDS & update_fields):
+        return
+    invalidate_api_token(instance.id)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_api_token_on_user_delete(sender: type[User], instance: User, **kwargs: Any) -> None:
+    invalidate_api_token(instance.id)
@@ -32,7 +32,7 @@ class TestGetCurrentUserAPIView:
 
     def test_get__has_score(self, client: Client, user: User) -> None:
         # Mock the user's current score
-        UserScore.objects.create(user=user, current_score=103)
+        UserScore.objects.filter(user=user).update(current_score=103)
 
         client.force_login(user)
         resp = client.get(self.url)
@@ -29,3 +29,15 @@ def user_with_badge() -> User:
     )
     user.badges.create(mac_address="01-23-45-67-89-AB")
     return user
+
+
+@pytest.fixture
+def superuser() -> User:
+    user = User.objects.create(
+        username="superuser",
+        display_name="superuser",
+        is_superuser=True,
+        email="foo@example.com",
+    )
+    user.badges.create(mac_address="0B-23-45-67-89-AB")
+    return user
@@ -0,0 +1,207 @@
+import io
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from gchqnet.accounts.models import Badge, ReservedUsername, User
+from gchqnet.accounts.provisioning import ManifestError, ManifestFormat, provision_badges, read_manifest
+from gchqnet.accounts.repository import check_badge_credentials
+from gchqnet.accounts.usernames.pool import refill_username_pool
+from gchqnet.quest.models.scores import ScoreboardEntry
+from gchqnet.quest.repository.rankings import get_ranked_entries
+
+SECRET = "a" * 64
+CSV_MANIFEST = f"mac_address,secret\n01:23:45:67:89:ab,{SECRET}\n01-23-45-67-89-AC,\nnot-a-mac,\n"
+
+
+def _provision(manifest: str, manifest_format: ManifestFormat = "csv", chunk_size: int = 500) -> dict:
+    return dict(provision_badges(read_manifest(io.StringIO(manifest), manifest_format), chunk_size=chunk_size))
+
+
+@pytest.mark.django_db
+class TestProvisionBadges:
+    def test_csv(self) -> None:
+        # Act
+        progress = _provision(CSV_MANIFEST)
+
+        # Assert
+        assert progress | {"elapsed": 0, "rate": 0} == {
+            "read": 3,
+            "created": 2,
+            "skipped": 0,
+            "invalid": 1,
+            "errors": [{"row": 3, "mac_address": "NOT-A-MAC", "error": "Invalid MAC address"}],
+            "elapsed": 0,
+            "rate": 0,
+        }
+        badges = {badge.mac_address: badge for badge in Badge.objects.select_related("user")}
+        assert set(badges) == {"01-23-45-67-89-AB", "01-23-45-67-89-AC"}
+        assert badges["01-23-45-67-89-AB"].secret == SECRET
+        assert badges["01-23-45-67-89-AC"].secret == ""
+        assert badges["01-23-45-67-89-AB"].user.display_name == badges["01-23-45-67-89-AB"].user.username
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            json.dumps([{"mac_address": "01-23-45-67-89-AB"}, {"mac_address": "01-23-45-67-89-AC"}]),
+            '{"mac_address": "01-23-45-67-89-AB"}\n\n{"mac_address": "01-23-45-67-89-AC"}\n',
+        ],
+    )
+    def test_json(self, manifest: str) -> None:
+        progress = _provision(manifest, "json")
+
+        assert progress["created"] == 2
+        assert Badge.objects.count() == 2
+
+    def test_invalid_manifest(self) -> None:
+        with pytest.raises(ManifestError):
+            _provision('[{"secret": "foo"}]', "json")
+
+    def test_secret_too_long(self) -> None:
+        # Arrange
+        manifest = f"mac_address,secret\n01-23-45-67-89-AB,{SECRET}\n01-23-45-67-89-AC,{SECRET}b\n"
+
+        # Act
+        progress = _provision(manifest)
+
+        # Assert
+        assert progress["created"] == 1
+        assert progress["invalid"] == 1
+        assert progress["errors"] == [
+            {"row": 2, "mac_address": "01-23-45-67-89-AC", "error": "The secret is longer than 64 characters"}
+        ]
+        assert list(Badge.objects.values_list("mac_address", flat=True)) == ["01-23-45-67-89-AB"]
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_invalid_chunk_size(self, chunk_size: int) -> None:
+        with pytest.raises(ValueError):
+            _provision(CSV_MANIFEST, chunk_size=chunk_size)
+
+        assert not Badge.objects.exists()
+
+    def test_resume(self) -> None:
+        # Arrange
+        _provision(CSV_MANIFEST)
+
+        # Act
+        progress = _provision(CSV_MANIFEST)
+
+        # Assert
+        assert progress["created"] == 0
+        assert progress["skipped"] == 2
+        assert User.objects.count() == 2
+
+    def test_chunks(self) -> None:
+        # Arrange
+        manifest = "mac_address\n" + "".join(f"01-23-45-67-89-{i:02X}\n" for i in range(10))
+        _provision("mac_address\n01-23-45-67-89-00\n")
+        refill_username_pool(4)
+        reserved = set(ReservedUsername.objects.values_list("username", flat=True))
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            progress = _provision(manifest, chunk_size=4)
+
+        # Assert
+        assert progress["created"] == 9
+        assert progress["skipped"] == 1
+        assert reserved <= set(User.objects.values_list("username", flat=True))
+        assert not ReservedUsername.objects.exists()
+        assert len(ctx.captured_queries) < 60
+
+    def test_scoreboard_entries(self) -> None:
+        _provision(CSV_MANIFEST)
+
+        assert ScoreboardEntry.objects.count() == 2
+        assert set(get_ranked_entries().values_list("rank", "current_score")) == {(1, 0)}
+
+    def test_first_contact_sets_secret(self) -> None:
+        # Arrange
+        _provision(CSV_MANIFEST)
+        user = Badge.objects.get(mac_address="01-23-45-67-89-AC").user
+
+        # Act
+        result = check_badge_credentials("01-23-45-67-89-AC", "b" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert result["user"] == user
+        assert Badge.objects.get(mac_address="01-23-45-67-89-AC").secret == "b" * 64
+
+    def test_command(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        # Arrange
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text(CSV_MANIFEST)
+
+        # Act
+        call_command("provision_badges", str(manifest))
+
+        # Assert
+        assert Badge.objects.count() == 2
+        output = capsys.readouterr()
+        assert output.out.startswith("Read 3 badges: 2 created, 0 already existed, 1 invalid")
+        assert output.err == "Row 3 (NOT-A-MAC): Invalid MAC address\n"
+
+    def test_command_invalid_chunk_size(self, tmp_path: Path) -> None:
+        # Arrange
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text(CSV_MANIFEST)
+
+        # Act
+        with pytest.raises(CommandError):
+            call_command("provision_badges", str(manifest), "--chunk-size", "0")
+
+        # Assert
+        assert not Badge.objects.exists()
+
+
+@pytest.mark.django_db
+class TestProvisionBadgesAPIView:
+    url = reverse("api:provision_badges")
+
+    def _upload(self, client: Client, manifest: str, name: str = "manifest.csv") -> dict:
+        resp = client.post(self.url, {"manifest": SimpleUploadedFile(name, manifest.encode())})
+        return {"status": resp.status_code, "json": resp.json()}
+
+    def test_not_admin(self, client: Client, user: User) -> None:
+        client.force_login(user)
+
+        resp = self._upload(client, CSV_MANIFEST)
+
+        assert resp["status"] == HTTPStatus.FORBIDDEN
+        assert not Badge.objects.exclude(user=user).exists()
+
+    def test_upload(self, client: Client, superuser: User) -> None:
+        client.force_login(superuser)
+
+        resp = self._upload(client, json.dumps([{"mac_address": "01-23-45-67-89-AB"}]), "manifest.json")
+
+        assert resp["status"] == HTTPStatus.OK
+        assert resp["json"]["created"] == 1
+        assert Badge.objects.filter(mac_address="01-23-45-67-89-AB").exists()
+
+    def test_invalid_manifest(self, client: Client, superuser: User) -> None:
+        client.force_login(superuser)
+
+        resp = self._upload(client, "[", "manifest.json")
+
+        assert resp["status"] == HTTPStatus.BAD_REQUEST
+        assert "manifest" in resp["json"]
+
+    @override_settings(BADGE_MANIFEST_MAX_UPLOAD_SIZE=32)
+    def test_manifest_too_large(self, client: Client, superuser: User) -> None:
+        client.force_login(superuser)
+
+        resp = self._upload(client, CSV_MANIFEST)
+
+        assert resp["status"] == HTTPStatus.BAD_REQUEST
+        assert "manifest" in resp["json"]
+        assert not Badge.objects.exclude(user=superuser).exists()
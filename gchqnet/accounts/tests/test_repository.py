@@ -0,0 +1,237 @@
+from collections.abc import Iterator
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from prometheus_client import REGISTRY
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.accounts.repository import check_badge_credentials, get_user_for_api_token
+from gchqnet.accounts.tokens import generate_api_token
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+MAC_ADDRESS = "0A-23-45-67-89-AB"
+
+
+@pytest.mark.django_db
+class TestCheckBadgeCredentialsCache:
+    @pytest.fixture(autouse=True)
+    def _locmem_cache(self) -> Iterator[None]:
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def test_second_lookup_is_cached(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            result = check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert result["result"] == "success"
+        assert result["user"].id == user.id
+        assert result["user"].username == user.username
+        assert result["user"].display_name == user.display_name
+        assert result["badge"].mac_address == MAC_ADDRESS
+        assert result["badge"].user_id == user.id
+        assert result["new_user"] is False
+
+    def test_cached_lookup_checks_secret(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            result = check_badge_credentials(MAC_ADDRESS, "c" * 64)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert result["result"] == "failure"
+
+    def test_new_badge_is_cached(self) -> None:
+        # Arrange
+        first = check_badge_credentials("01-23-45-67-89-AB", "a" * 64)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            result = check_badge_credentials("01-23-45-67-89-AB", "a" * 64)
+
+        # Assert
+        assert first["result"] == "success"
+        assert first["new_user"] is True
+        assert len(ctx.captured_queries) == 0
+        assert result["result"] == "success"
+        assert result["user"].id == first["user"].id
+        assert result["new_user"] is False
+
+    def test_blank_secret_is_not_served_from_cache(self, user_with_badge: User) -> None:
+        # Arrange
+        check_badge_credentials("01-23-45-67-89-AB", "")
+
+        # Act
+        result = check_badge_credentials("01-23-45-67-89-AB", "a" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert Badge.objects.get(mac_address="01-23-45-67-89-AB").secret == "a" * 64
+
+    def test_badge_save_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+        badge = Badge.objects.get(mac_address=MAC_ADDRESS)
+        badge.secret = "c" * 64
+        badge.save()
+
+        # Act
+        result = check_badge_credentials(MAC_ADDRESS, "c" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+
+    def test_badge_mac_address_change_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+        badge = Badge.objects.get(mac_address=MAC_ADDRESS)
+        badge.mac_address = "01-23-45-67-89-AC"
+        badge.save()
+
+        # Act
+        result = check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert result["new_user"] is True
+
+    def test_badge_delete_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+        Badge.objects.filter(mac_address=MAC_ADDRESS).delete()
+
+        # Act
+        result = check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert result["new_user"] is True
+
+    def test_user_save_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+        user.display_name = "bar"
+        user.save()
+
+        # Act
+        result = check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Assert
+        assert result["user"].display_name == "bar"
+
+    def test_unrelated_user_save_keeps_cache(self, user: User) -> None:
+        # Arrange
+        check_badge_credentials(MAC_ADDRESS, "b" * 64)
+        user.save(update_fields=["last_login"])
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            check_badge_credentials(MAC_ADDRESS, "b" * 64)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+class TestGetUserForAPITokenCache:
+    @pytest.fixture(autouse=True)
+    def _locmem_cache(self) -> Iterator[None]:
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def test_second_lookup_is_cached(self, user: User) -> None:
+        # Arrange
+        get_user_for_api_token(user.api_token)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            result = get_user_for_api_token(user.api_token)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert result is not None
+        assert result.id == user.id
+        assert result.username == user.username
+        assert result.is_active is True
+        assert result.is_superuser is False
+
+    def test_cached_user_fields(self, user: User) -> None:
+        # Arrange
+        get_user_for_api_token(user.api_token)
+        result = get_user_for_api_token(user.api_token)
+        assert result is not None
+
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname != "password"]
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            values = {name: getattr(result, name) for name in field_names}
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert values == {name: getattr(user, name) for name in field_names}
+        assert result.get_deferred_fields() == {"password"}
+
+    def test_token_is_not_used_as_cache_key(self, user: User) -> None:
+        get_user_for_api_token(user.api_token)
+
+        assert not any(user.api_token in key for key in cache._cache)  # type: ignore[attr-defined]
+
+    def test_invalid_token(self, user: User) -> None:
+        assert get_user_for_api_token("invalid") is None
+
+    def test_token_rotation_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        old_token = user.api_token
+        get_user_for_api_token(old_token)
+
+        # Act
+        user.api_token = generate_api_token()
+        user.save(update_fields=["api_token"])
+
+        # Assert
+        assert get_user_for_api_token(old_token) is None
+        assert get_user_for_api_token(user.api_token) == user
+
+    def test_deactivation_invalidates_cache(self, user: User) -> None:
+        # Arrange
+        get_user_for_api_token(user.api_token)
+
+        # Act
+        user.is_active = False
+        user.save()
+
+        # Assert
+        result = get_user_for_api_token(user.api_token)
+        assert result is not None
+        assert result.is_active is False
+
+    def test_metrics(self, user: User) -> None:
+        # Arrange
+        def _sample(result: str) -> float:
+            return REGISTRY.get_sample_value("gchqnet_api_token_cache_requests_total", {"result": result}) or 0
+
+        hits, misses = _sample("hit"), _sample("miss")
+
+        # Act
+        get_user_for_api_token(user.api_token)
+        get_user_for_api_token(user.api_token)
+
+        # Assert
+        assert _sample("hit") == hits + 1
+        assert _sample("miss") == misses + 1
@@ -0,0 +1,116 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from prometheus_client import REGISTRY
+
+from gchqnet.accounts.models import ReservedUsername, User
+from gchqnet.accounts.repository import check_badge_credentials
+from gchqnet.accounts.usernames.pool import claim_username, get_username_namespace, refill_username_pool
+
+
+@pytest.mark.django_db
+class TestUsernamePool:
+    def test_refill(self, user: User) -> None:
+        # Arrange
+        taken = sorted(get_username_namespace())[:2]
+        User.objects.create(username=taken[0], display_name="taken")
+        User.objects.create(username="taken", display_name=taken[1].upper())
+
+        # Act
+        stats = refill_username_pool(10)
+
+        # Assert
+        reserved = set(ReservedUsername.objects.values_list("username", flat=True))
+        assert len(reserved) == 10
+        assert reserved <= get_username_namespace()
+        assert not reserved & set(taken)
+        assert stats == {
+            "pool_size": 10,
+            "namespace_size": len(get_username_namespace()),
+            "namespace_remaining": len(get_username_namespace()) - 2,
+        }
+
+    def test_refill_tops_up(self) -> None:
+        # Arrange
+        refill_username_pool(5)
+        claim_username()
+
+        # Act
+        stats = refill_username_pool(5)
+
+        # Assert
+        assert stats["pool_size"] == 5
+        assert ReservedUsername.objects.count() == 5
+
+    def test_metrics(self) -> None:
+        # Arrange
+        refill_username_pool(3)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            claim_username()
+
+        # Assert
+        assert len(ctx.captured_queries) == 1
+        assert REGISTRY.get_sample_value("gchqnet_username_pool_size") == 2
+        assert REGISTRY.get_sample_value("gchqnet_username_namespace_remaining") == len(get_username_namespace())
+
+    def test_metrics_empty_pool(self) -> None:
+        # Arrange
+        refill_username_pool(1)
+        claim_username()
+
+        # Act
+        claim_username()
+
+        # Assert
+        assert REGISTRY.get_sample_value("gchqnet_username_pool_size") == 0
+
+    def test_claim(self) -> None:
+        # Arrange
+        refill_username_pool(2)
+        first, second = ReservedUsername.objects.order_by("id").values_list("username", flat=True)
+
+        # Act
+        claimed = [claim_username(), claim_username()]
+
+        # Assert
+        assert claimed == [first, second]
+        assert not ReservedUsername.objects.exists()
+
+    def test_claim_from_empty_pool(self) -> None:
+        username = claim_username()
+
+        assert username in get_username_namespace()
+
+    def test_new_badge_claims_username(self) -> None:
+        # Arrange
+        refill_username_pool(1)
+        reserved = ReservedUsername.objects.get().username
+
+        # Act
+        result = check_badge_credentials("01-23-45-67-89-AB", "a" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert result["user"].username == reserved
+        assert result["user"].display_name == reserved
+        assert not ReservedUsername.objects.exists()
+
+    def test_new_badge_with_taken_username(self, user: User) -> None:
+        # Arrange
+        ReservedUsername.objects.create(username=user.username)
+
+        # Act
+        result = check_badge_credentials("01-23-45-67-89-AB", "a" * 64)
+
+        # Assert
+        assert result["result"] == "success"
+        assert result["user"].username != user.username
+
+    def test_command(self, capsys: pytest.CaptureFixture[str]) -> None:
+        call_command("refill_username_pool", size=3)
+
+        assert ReservedUsername.objects.count() == 3
+        assert capsys.readouterr().out.startswith("3 usernames in the pool")
@@ -0,0 +1,131 @@
+"""
+A pool of free usernames for new players.
+
+When the gates open, thousands of badges are registered within minutes, and searching for a free username gets
+slower as the namespace fills up. Instead, free usernames are reserved in advance by ./manage.py refill_username_pool,
+and a new player claims one with a single query. If the pool is empty, a username is generated as before.
+
+A username is claimed by deleting its row. On PostgreSQL, the row is locked with SKIP LOCKED so that concurrent claims
+take different rows without waiting for each other. SQLite does not have row locks, but only has one writer at a time.
+
+The metrics are set when usernames are claimed and when the pool is refilled, as the server runs several processes
+that each export their own values. The most recent value from any process is exported. Counting the usernames that
+remain in the namespace reads every username, so that is only done by the refill.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TypedDict
+
+from django.db import connection
+from django.db.models.functions import Lower
+from django_prometheus.conf import NAMESPACE
+from prometheus_client import Counter, Gauge
+
+from gchqnet.accounts.models import ReservedUsername, User
+
+from . import generate_username
+from .data import ADJECTIVES, NOUNS
+
+username_pool_claims = Counter(
+    "gchqnet_username_pool_claims_total",
+    "Number of usernames given to new players, by whether they were claimed from the pool.",
+    ["result"],
+    namespace=NAMESPACE,
+)
+
+username_pool_size = Gauge(
+    "gchqnet_username_pool_size",
+    "Number of usernames reserved in the pool, as of the last claim or refill.",
+    namespace=NAMESPACE,
+    multiprocess_mode="mostrecent",
+)
+
+username_namespace_remaining = Gauge(
+    "gchqnet_username_namespace_remaining",
+    "Number of generated usernames that have not been taken by a player, as of the last refill.",
+    namespace=NAMESPACE,
+    multiprocess_mode="mostrecent",
+)
+
+
+class UsernamePoolStats(TypedDict):
+    pool_size: int
+    namespace_size: int
+    namespace_remaining: int
+
+
+def get_username_namespace() -> set[str]:
+    """Get every username that can be generated."""
+    return {f"{adjective}-{noun}" for adjective in ADJECTIVES for noun in NOUNS}
+
+
+def _get_taken_usernames() -> set[str]:
+    # New players have their username as their display name, which must also be unique.
+    usernames = set(User.objects.values_list("username", flat=True))
+    display_names = set(User.objects.values_list(Lower("display_name"), flat=True))
+    return usernames | display_names
+
+
+def claim_usernames(count: int) -> list[str]:
+    """Claim up to count usernames from the pool, in the order that they were reserved."""
+    quote_name = connection.ops.quote_name
+    table = quote_name(ReservedUsername._meta.db_table)
+    lock = " FOR UPDATE SKIP LOCKED" if connection.features.has_select_for_update_skip_locked else ""
+    # The newest reserved username is returned too, so that the size of the pool can be estimated without a count.
+    sql = (
+        f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} ORDER BY id LIMIT %s{lock}) "  # noqa: S608
+        f"RETURNING id, {quote_name('username')}, (SELECT MAX(id) FROM {table})"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [count])
+        rows = sorted(cursor.fetchall())
+
+    if rows:
+        # Usernames are claimed in the order they were reserved, so the ones left are those reserved after the last.
+        last_claimed_id, _, newest_id = rows[-1]
+        username_pool_size.set(max((newest_id or last_claimed_id) - last_claimed_id, 0))
+    else:
+        username_pool_size.set(0)
+
+    return [username for _, username, _ in rows]
+
+
+def claim_username() -> str:
+    """Claim a username from the pool, or generate one if the pool is empty."""
+    if not (usernames := claim_usernames(1)):
+        username_pool_claims.labels(result="empty").inc()
+        return generate_username()
+
+    username_pool_claims.labels(result="claimed").inc()
+    return usernames[0]
+
+
+def refill_username_pool(size: int) -> UsernamePoolStats:
+    """
+    Reserve free usernames until there are at least size in the pool.
+
+    This reads every username that has been taken, so should be run in the background.
+    """
+    namespace = get_username_namespace()
+    taken = _get_taken_usernames()
+    reserved = set(ReservedUsername.objects.values_list("username", flat=True))
+    namespace_remaining = len(namespace - taken)
+    available = list(namespace - taken - reserved)
+
+    if (needed := min(size - len(reserved), len(available))) > 0:
+        created = ReservedUsername.objects.bulk_create(
+            [ReservedUsername(username=username) for username in random.sample(available, needed)],
+            ignore_conflicts=True,
+        )
+        reserved.update(reserved_username.username for reserved_username in created)
+
+    stats = UsernamePoolStats(
+        pool_size=len(reserved),
+        namespace_size=len(namespace),
+        namespace_remaining=namespace_remaining,
+    )
+    username_pool_size.set(stats["pool_size"])
+    username_namespace_remaining.set(stats["namespace_remaining"])
+    return stats
@@ -0,0 +1,96 @@
+# Generated by Django 5.0.6 on 2026-10-18 20:14
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import django.db.models.deletion
+import django_prometheus.models
+from django.conf import settings
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_location_group_progress(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    LocationGroup = apps.get_model("achievements", "LocationGroup")
+    LocationGroupProgress = apps.get_model("achievements", "LocationGroupProgress")
+    CaptureEvent = apps.get_model("quest", "CaptureEvent")
+
+    for location_group in LocationGroup.objects.annotate(total=models.Count("locations")):
+        found_counts = (
+            CaptureEvent.objects.filter(location__groups=location_group)
+            .order_by()
+            .values("created_by")
+            .annotate(found_count=models.Count("id"))
+            .values_list("created_by", "found_count")
+        )
+        LocationGroupProgress.objects.bulk_create(
+            LocationGroupProgress(
+                user_id=user_id,
+                location_group=location_group,
+                found_count=found_count,
+                total=location_group.total,
+            )
+            for user_id, found_count in found_counts
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("achievements", "0007_add_description_to_basic"),
+        ("quest", "0014_location_bit_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocationGroupProgress",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Database ID",
+                    ),
+                ),
+                ("found_count", models.PositiveIntegerField()),
+                ("total", models.PositiveIntegerField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "location_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress",
+                        to="achievements.locationgroup",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="location_group_progress",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            bases=(
+                django_prometheus.models.ExportModelOperationsMixin("location_group_progress"),
+                models.Model,
+            ),
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "location_group"), name="one_progress_per_user_per_location_group"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_location_group_progress, migrations.RunPython.noop, elidable=True),
+    ]
@@ -133,3 +133,37 @@ class LocationGroupAchievementEvent(ExportModelOperationsMixin("location_group_a
 
     def __str__(self) -> str:
         return f"{self.user} completed group {self.display_name}"
+
+
+class LocationGroupProgress(ExportModelOperationsMixin("location_group_progress"), models.Model):  # type: ignore[misc]
+    """
+    How many of the locations in a group a player has found, dynamically updated.
+
+    There is a row for each player that has found at least one location in a group. The found count is incremented on
+    capture, and both counts are recomputed when the locations in the group are changed.
+    """
+
+    id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey("accounts.User", on_delete=models.CASCADE, related_name="location_group_progress")
+    location_group = models.ForeignKey(
+        "achievements.LocationGroup",
+        on_delete=models.CASCADE,
+        related_name="progress",
+    )
+    found_count = models.PositiveIntegerField()
+    total = models.PositiveIntegerField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "location_group"], name="one_progress_per_user_per_location_group"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} has found {self.found_count} of {self.total} in {self.location_group}"
+
+    @property
+    def is_complete(self) -> bool:
+        return self.total > 0 and self.found_count >= self.total
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID
 
-from django.db import models
+from django.db import connection, models
 from django.urls import reverse
+from django.utils import timezone
 from django_prometheus.conf import NAMESPACE
 from notifications.signals import notify
 from prometheus_client import Counter
 
 from gchqnet.accounts.models.user import User
+from gchqnet.quest.models.captures import CaptureEvent
 from gchqnet.quest.models.location import Location
-from gchqnet.quest.models.scores import ScoreRecord
-from gchqnet.quest.repository.scores import update_score_for_user
+from gchqnet.quest.models.scores import UserScore
+from gchqnet.quest.repository.scores import create_score_record
 
-from .models import BasicAchievement, FirstToCaptureAchievementEvent, LocationGroup, LocationGroupAchievementEvent
+from .models import (
+    BasicAchievement,
+    FirstToCaptureAchievementEvent,
+    LocationGroup,
+    LocationGroupAchievementEvent,
+    LocationGroupProgress,
+)
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AnonymousUser
@@ -22,17 +30,18 @@ if TYPE_CHECKING:
 AchievementAwardResult = Literal["success", "failure", "already_obtained"]
 
 
+# Achievements are created by admins so there are few of them, but players are not labelled.
 basic_achievement_awards = Counter(
     "gchqnet_achievement_awards_total",
     "Number of basic achievements awarded.",
-    ["id", "display_name", "award_type", "difficulty", "username"],
+    ["id", "display_name", "award_type", "difficulty"],
     namespace=NAMESPACE,
 )
 
 location_group_awards = Counter(
     "gchqnet_location_group_completions_total",
     "Number of location groups completed.",
-    ["id", "display_name", "difficulty", "username"],
+    ["id", "display_name", "difficulty"],
     namespace=NAMESPACE,
 )
 
@@ -56,14 +65,10 @@ def award_builtin_basic_achievement(
 
     if created:
         basic_achievement_awards.labels(
-            achievement_id, achievement.display_name, achievement.award_type, achievement.difficulty, user.username
+            achievement_id, achievement.display_name, achievement.award_type, achievement.difficulty
         ).inc()
-        ScoreRecord.objects.create(
-            basic_achievement_event=bae,
-            user=user,
-            score=achievement.difficulty,
-        )
-        current_score = update_score_for_user(user)
+        create_score_record(user, achievement.difficulty, basic_achievement_event=bae)
+        current_score = UserScore.objects.values_list("current_score", flat=True).get(user=user)
         notify.send(
             user,
             recipient=user,
@@ -76,17 +81,13 @@ def award_builtin_basic_achievement(
         return "already_obtained"
 
 
-def award_first_capture(location: Location, user: User, *, update_score: bool = False) -> AchievementAwardResult:
+def award_first_capture(location: Location, user: User) -> AchievementAwardResult:
     obj, created = FirstToCaptureAchievementEvent.objects.get_or_create(
         location=location,
         defaults={"user": user, "created_by": user},
     )
     if created:
-        ScoreRecord.objects.create(
-            first_capture_event=obj,
-            user=user,
-            score=location.difficulty,
-        )
+        create_score_record(user, location.difficulty, first_capture_event=obj)
         notify.send(
             user,
             recipient=user,
@@ -95,8 +96,6 @@ def award_first_capture(location: Location, user: User, *, update_score: bool =
             description="You have received a first capture bonus.",
             actions=[{"href": reverse("quest:location_detail", args=[location.id]), "title": "View"}],
         )
-        if update_score:
-            update_score_for_user(user)
     return "success" if created else "failure"
 
 
@@ -137,21 +136,116 @@ def get_achievements_for_user(user: User, viewer: User | AnonymousUser) -> model
     return bae.union(first_captures, lgae).order_by("-created_at")
 
 
+def _get_location_group_progress(user: User, location_group: LocationGroup) -> LocationGroupProgress | None:
+    return LocationGroupProgress.objects.filter(user=user, location_group=location_group).first()
+
+
 def has_user_captured_group(user: User, location_group: LocationGroup) -> bool:
-    location_ids_for_group = location_group.locations.values("id")
-    of_which_found = user.capture_events.filter(location__in=location_ids_for_group).count()
-    return bool(location_ids_for_group.count()) and (of_which_found == location_ids_for_group.count())
+    progress = _get_location_group_progress(user, location_group)
+    return progress is not None and progress.is_complete
 
 
 def has_user_started_group(user: User, location_group: LocationGroup) -> bool:
-    location_ids_for_group = location_group.locations.values("id")
-    of_which_found = user.capture_events.filter(location__in=location_ids_for_group).count()
-    return of_which_found == 1
+    progress = _get_location_group_progress(user, location_group)
+    return progress is not None and progress.found_count == 1
+
+
+def increment_location_group_progress(user: User, location: Location) -> dict[str, int]:
+    """
+    Count a new capture towards the progress of the player in each group of the location.
+
+    The progress is created for any group that the player has not started. This must be called exactly once for each
+    capture, in the same transaction.
+    Returns the number of locations found in each group after this capture, by group ID.
+    """
+    through = LocationGroup.locations.through
+    group_ids = list(through.objects.filter(location=location).values_list("locationgroup_id", flat=True))
+    if not group_ids:
+        return {}
+
+    quote_name = connection.ops.quote_name
+    table = quote_name(LocationGroupProgress._meta.db_table)
+    group_field = LocationGroupProgress.location_group.field
+    through_group_column = quote_name(through.locationgroup.field.column)
+    total = f"(SELECT COUNT(*) FROM {quote_name(through._meta.db_table)} WHERE {through_group_column} = %s)"  # noqa: S608
+
+    # New progress starts at one, and its total is the number of locations in the group.
+    fields = [
+        field
+        for field in LocationGroupProgress._meta.fields
+        if field.concrete and field.name not in {"found_count", "total"}
+    ]
+    row = f"({', '.join(['%s'] * len(fields))}, 1, {total})"
+    params: list[Any] = []
+    now = timezone.now()
+    for group_id in group_ids:
+        progress = LocationGroupProgress(user=user, location_group_id=group_id, updated_at=now)
+        params += [field.get_db_prep_save(getattr(progress, field.attname), connection) for field in fields]
+        params.append(group_field.get_db_prep_save(group_id, connection))
+
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    conflict_columns = ", ".join(
+        quote_name(field.column) for field in fields if field.name in {"user", "location_group"}
+    )
+    sql = (
+        f"INSERT INTO {table} ({columns}, found_count, total) "  # noqa: S608
+        f"VALUES {', '.join([row] * len(group_ids))} "
+        f"ON CONFLICT ({conflict_columns}) "
+        f"DO UPDATE SET found_count = {table}.found_count + 1, updated_at = EXCLUDED.updated_at "
+        f"RETURNING {quote_name(group_field.column)}, found_count"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {str(group_field.to_python(group_id)): found_count for group_id, found_count in cursor.fetchall()}
+
 
+def recompute_location_group_progress(*location_group_ids: UUID) -> None:
+    """
+    Recompute the progress of every player in some groups, e.g after the locations in a group have changed.
 
-def handle_location_capture_for_groups(user: User, location: Location, *, update_score: bool = False) -> None:
-    for group in location.groups.all():
-        if has_user_started_group(user, group):
+    This counts the captures in each group with a single grouped query, so it is only used when groups are changed.
+    """
+    through = LocationGroup.locations.through
+    for location_group_id in location_group_ids:
+        total = through.objects.filter(locationgroup_id=location_group_id).count()
+        found_counts = dict(
+            CaptureEvent.objects.filter(location__groups=location_group_id)
+            .order_by()
+            .values("created_by")
+            .annotate(found_count=models.Count("id"))
+            .values_list("created_by", "found_count")
+        )
+        LocationGroupProgress.objects.filter(location_group_id=location_group_id).exclude(
+            user_id__in=found_counts
+        ).delete()
+        LocationGroupProgress.objects.bulk_create(
+            [
+                LocationGroupProgress(
+                    user_id=user_id, location_group_id=location_group_id, found_count=found_count, total=total
+                )
+                for user_id, found_count in found_counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "location_group"],
+            update_fields=["found_count", "total", "updated_at"],
+        )
+
+
+def handle_location_capture_for_groups(user: User, location: Location, *, found_counts: dict[str, int]) -> None:
+    """
+    Send notifications and award achievements for the groups of a captured location.
+
+    found_counts is the progress in each group just after the capture, as returned by
+    increment_location_group_progress. This may run long after the capture, by when later captures have changed the
+    progress, so only the count at the time of the capture says whether it was the first location in a group.
+    """
+    # The progress was incremented when the capture was recorded, so this is a single indexed read.
+    progresses = LocationGroupProgress.objects.filter(user=user, location_group__locations=location).select_related(
+        "location_group"
+    )
+    for progress in progresses:
+        group = progress.location_group
+        if found_counts.get(str(group.id), progress.found_count) == 1:
             notify.send(
                 user,
                 recipient=user,
@@ -160,19 +254,15 @@ def handle_location_capture_for_groups(user: User, location: Location, *, update
                 description="You have started to find locations in a group. Try and find the rest!",
                 actions=[{"href": reverse("achievements:location_group_detail", args=[group.id]), "title": "View"}],
             )
-        elif has_user_captured_group(user, group):
+        elif progress.is_complete:
             obj, created = LocationGroupAchievementEvent.objects.get_or_create(
                 location_group=group,
                 user=user,
                 defaults={"created_by": user},
             )
             if created:
-                location_group_awards.labels(group.id, group.display_name, group.difficulty, user.username).inc()
-                ScoreRecord.objects.create(
-                    location_group_achievement_event=obj,
-                    user=user,
-                    score=group.difficulty,
-                )
+                location_group_awards.labels(group.id, group.display_name, group.difficulty).inc()
+                create_score_record(user, group.difficulty, location_group_achievement_event=obj)
                 notify.send(
                     user,
                     recipient=user,
@@ -181,5 +271,3 @@ def handle_location_capture_for_groups(user: User, location: Location, *, update
                     description="You have received a group capture bonus.",
                     actions=[{"href": reverse("achievements:location_group_detail", args=[group.id]), "title": "View"}],
                 )
-    if update_score:
-        update_score_for_user(user)
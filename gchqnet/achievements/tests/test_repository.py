@@ -1,12 +1,28 @@
 import pytest
+from django.test import Client, TestCase
+from django.urls import reverse
 
 from gchqnet.accounts.models.user import User
-from gchqnet.achievements.models import LocationGroup
+from gchqnet.achievements.models import LocationGroup, LocationGroupAchievementEvent, LocationGroupProgress
 from gchqnet.achievements.repository import has_user_captured_group
+from gchqnet.core.timing import PipelineTimer
 from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import ActivityEventKind, UserScore
+from gchqnet.quest.models.location import Location
 from gchqnet.quest.repository.captures import record_attempted_capture
 
 
+def _capture(user: User, location: Location, timer: PipelineTimer | None = None) -> None:
+    record_attempted_capture(
+        user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1", timer=timer
+    )
+
+
+def _progress(user: User, location_group: LocationGroup) -> tuple[int, int]:
+    progress = LocationGroupProgress.objects.get(user=user, location_group=location_group)
+    return progress.found_count, progress.total
+
+
 @pytest.mark.django_db
 class TestHasUserCapturedGroup:
     def test_no_locations_in_group(self, user: User, location_group: LocationGroup) -> None:
@@ -55,3 +71,138 @@ class TestHasUserCapturedGroup:
 
         res = has_user_captured_group(user, location_group)
         assert res is True
+
+
+@pytest.mark.django_db
+class TestHandleLocationCaptureForGroups:
+    def test_group_started(self, user: User, location_group: LocationGroup) -> None:
+        location = LocationFactory(created_by=user)
+        location2 = LocationFactory(created_by=user)
+        location_group.locations.set([location, location2])
+
+        record_attempted_capture(
+            user.badges.first(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+        )
+
+        assert user.notifications.filter(verb="found your first location in").count() == 1
+        assert not LocationGroupAchievementEvent.objects.filter(user=user).exists()
+
+    def test_group_completed(self, user: User, location_group: LocationGroup) -> None:
+        location = LocationFactory(created_by=user, difficulty=10)
+        location2 = LocationFactory(created_by=user, difficulty=20)
+        location_group.locations.set([location, location2])
+
+        record_attempted_capture(
+            user.badges.first(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+        )
+        record_attempted_capture(
+            user.badges.first(), location2.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+        )
+
+        event = LocationGroupAchievementEvent.objects.get(user=user, location_group=location_group)
+        assert event.score_record.score == location_group.difficulty
+        assert user.notifications.filter(verb="captured all locations in").count() == 1
+        assert UserScore.objects.get(user=user).current_score == 10 + 20 + location_group.difficulty
+        assert event.score_record.activity_event.type == ActivityEventKind.LOCATION_GROUP
+        assert event.score_record.activity_event.target_name == location_group.display_name
+
+
+@pytest.mark.django_db
+class TestLocationGroupProgress:
+    def test_capture_increments_progress(self, user: User, location_group: LocationGroup) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        location_group.locations.set(locations)
+        other_group = LocationGroup.objects.create(display_name="group 2", difficulty=10, created_by=user)
+        other_group.locations.set(locations[1:2])
+        timer = PipelineTimer("capture")
+
+        # Act
+        _capture(user, locations[0])
+        _capture(user, locations[1], timer)
+        _capture(user, locations[1])
+
+        # Assert
+        assert _progress(user, location_group) == (2, 3)
+        assert _progress(user, other_group) == (1, 1)
+        assert timer.stages["group_progress"]["queries"] == 2
+
+    def test_no_progress_for_groups_not_started(self, user: User, location_group: LocationGroup) -> None:
+        location = LocationFactory(created_by=user)
+        location_group.locations.add(location)
+
+        assert not LocationGroupProgress.objects.exists()
+        assert has_user_captured_group(user, location_group) is False
+
+    def test_adding_locations_recomputes_total(self, user: User, location_group: LocationGroup) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        location_group.locations.set(locations[:1])
+        _capture(user, locations[0])
+        _capture(user, locations[1])
+
+        # Act
+        location_group.locations.add(*locations[1:])
+
+        # Assert
+        assert _progress(user, location_group) == (2, 3)
+
+    def test_removing_locations_recomputes_progress(self, user: User, location_group: LocationGroup) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+        location_group.locations.set(locations)
+        _capture(user, locations[0])
+
+        # Act
+        location_group.locations.remove(locations[0])
+
+        # Assert
+        assert not LocationGroupProgress.objects.filter(user=user).exists()
+
+    def test_changing_groups_of_location_recomputes_progress(self, user: User, location_group: LocationGroup) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+        location_group.locations.add(locations[0])
+        _capture(user, locations[0])
+        _capture(user, locations[1])
+
+        # Act
+        locations[1].groups.add(location_group)
+
+        # Assert
+        assert _progress(user, location_group) == (2, 2)
+
+        # Act
+        locations[1].groups.clear()
+
+        # Assert
+        assert _progress(user, location_group) == (1, 1)
+
+    def test_deleting_location_recomputes_total(self, user: User, location_group: LocationGroup) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+        location_group.locations.set(locations)
+        _capture(user, locations[0])
+
+        # Act
+        with TestCase.captureOnCommitCallbacks(execute=True):
+            locations[1].delete()
+
+        # Assert
+        assert _progress(user, location_group) == (1, 1)
+
+    def test_location_group_detail_shows_progress(
+        self, client: Client, user: User, location_group: LocationGroup
+    ) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(4)]
+        location_group.locations.set(locations)
+        _capture(user, locations[0])
+        client.force_login(user)
+
+        # Act
+        resp = client.get(reverse("achievements:location_group_detail", args=[location_group.id]))
+
+        # Assert
+        assert resp.context["progress"].found_count == 1
+        assert b"You have found 1 of 4 locations" in resp.content
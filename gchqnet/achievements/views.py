@@ -15,6 +15,7 @@ from django.views.generic import CreateView, DetailView, ListView
 from gchqnet.core.mixins import BreadcrumbsMixin
 from gchqnet.logistics.mixins import AllowedLogisticsAccessMixin
 from gchqnet.quest.models.captures import CaptureEvent
+from gchqnet.quest.repository.found_locations import get_found_locations
 
 from .forms import BasicAchievementCreateForm
 from .models import BasicAchievement, BasicAchievementAwardType, LocationGroup
@@ -143,13 +144,11 @@ class LocationGroupDetailView(BreadcrumbsMixin, DetailView):
         locations = self.object.locations.order_by("id").values("id", "display_name", "difficulty")
 
         if self.request.user.is_authenticated:
-            user_found_locations = set(
-                self.request.user.capture_events.filter(
-                    location__in=[lo["id"] for lo in locations],
-                ).values_list("location_id", flat=True)
-            )
+            user_found_locations = get_found_locations(self.request.user.id).filter(lo["id"] for lo in locations)
+            progress = self.object.progress.filter(user=self.request.user).first()
         else:
             user_found_locations = set()
+            progress = None
 
         location_count = len(locations)
         user_found_all = location_count == len(user_found_locations)
@@ -165,6 +164,7 @@ class LocationGroupDetailView(BreadcrumbsMixin, DetailView):
             location_count=location_count,
             user_found_all=user_found_all,
             user_found_locations=user_found_locations,
+            progress=progress,
             recent_captures=recent_captures,
             **kwargs,
         )
@@ -3,7 +3,7 @@ from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.views import SpectacularJSONAPIView, SpectacularSwaggerView
 from rest_framework import routers
 
-from gchqnet.accounts.api.views import get_auth_token, profile
+from gchqnet.accounts.api.views import get_auth_token, profile, provision_badge_manifest
 from gchqnet.achievements.api.views import AchievementViewset
 from gchqnet.hexpansion.api.views import HexpansionViewset
 from gchqnet.logistics.api.views import AllLocationViewset, PlannedLocationViewset
@@ -11,6 +11,7 @@ from gchqnet.quest.api.views import (
     BadgeAPIViewset,
     GlobalScoreboardAPIView,
     LocationViewset,
+    PlayerCaptureStatsAPIView,
     PrivateScoreboardAPIViewset,
 )
 
@@ -42,7 +43,9 @@ app_name = "api"
 urlpatterns = [
     path("users/me/", profile, name="users_me"),
     path("auth/token/", get_auth_token, name="auth_user_token"),
+    path("badges/provision/", provision_badge_manifest, name="provision_badges"),
     path("scoreboards/global/", GlobalScoreboardAPIView.as_view(), name="quest_global_scoreboard"),
+    path("stats/players/", PlayerCaptureStatsAPIView.as_view(), name="quest_player_stats"),
     path("openapi.json", SpectacularJSONAPIView.as_view(), name="schema"),
     path("docs/", SpectacularSwaggerView.as_view(url_name="api:schema"), name="docs"),
 ] + router.urls
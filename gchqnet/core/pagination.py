@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Paginate by the values of the ordering fields of the last row seen, rather than by offset.
+
+    Each page is read with a query like WHERE (a, b) > (x, y) ORDER BY a, b LIMIT n, so every page costs the same as
+    the first if there is an index on the ordering. Rows that move while a client is paging are seen at their new
+    position, but the rows that did not move are never skipped or repeated.
+
+    The view must set keyset_ordering to fields that together are unique. If the view has an ordering filter, the
+    requested ordering is used, followed by the keyset ordering to break ties.
+    """
+
+    page_size_query_param = "limit"
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_keyset_ordering(self, request: Request, queryset: models.QuerySet, view: APIView) -> tuple[str, ...]:
+        keyset_ordering = tuple(getattr(view, "keyset_ordering", ()))
+        assert keyset_ordering, "Using keyset pagination, but the view does not declare keyset_ordering."
+        self.ordering = keyset_ordering
+
+        ordering = self.get_ordering(request, queryset, view)
+        fields = {field.lstrip("-") for field in ordering}
+        return ordering + tuple(field for field in keyset_ordering if field.lstrip("-") not in fields)
+
+    def paginate_queryset(
+        self, queryset: models.QuerySet, request: Request, view: APIView | None = None
+    ) -> list[Any] | None:
+        assert view is not None
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url: str = request.build_absolute_uri()
+        self.keyset = self.get_keyset_ordering(request, queryset, view)
+
+        cursor = self.decode_keyset_cursor(request)
+        values, reverse = cursor if cursor is not None else (None, False)
+        ordering = tuple(_invert(field) for field in self.keyset) if reverse else self.keyset
+
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(_after(ordering, values))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+        return self.page
+
+    def decode_keyset_cursor(self, request: Request) -> tuple[list[Any], bool] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            values, reverse = cursor["v"], cursor["r"]
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+        if not isinstance(values, list) or len(values) != len(self.keyset) or not isinstance(reverse, bool):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def encode_keyset_cursor(self, row: Any, *, reverse: bool) -> str:
+        values = [_get_value(row, field.lstrip("-")) for field in self.keyset]
+        encoded = urlsafe_b64encode(json.dumps({"v": values, "r": reverse}, cls=DjangoJSONEncoder).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_keyset_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_keyset_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+
+def _invert(field: str) -> str:
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def _get_value(row: Any, field: str) -> Any:
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+def _after(ordering: Sequence[str], values: Sequence[Any]) -> models.Q:
+    """
+    Build a filter for the rows after the given values in the ordering.
+
+    This expands (a, b, c) > (x, y, z) into a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z), with a bound on
+    the first field so that the database can use an index on the ordering for a range scan.
+    """
+    names = [field.lstrip("-") for field in ordering]
+    comparisons = ["lt" if field.startswith("-") else "gt" for field in ordering]
+
+    condition = models.Q()
+    for i, (name, comparison, value) in enumerate(zip(names, comparisons, values, strict=True)):
+        equal = dict(zip(names[:i], values[:i], strict=True))
+        condition |= models.Q(**equal, **{f"{name}__{comparison}": value})
+
+    return models.Q(**{f"{names[0]}__{comparisons[0]}e": values[0]}) & condition
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Any
 
 import sentry_sdk
 
@@ -155,6 +156,36 @@ LOGOUT_REDIRECT_URL = "/"
 # - post
 GAME_MODE = "live"
 
+# Side effects of captures, e.g notifications, are deferred to the outbox and processed by
+# ./manage.py process_outbox. If enabled, they are run immediately instead.
+OUTBOX_ALWAYS_EAGER = False
+
+# The global and private scoreboards are read from the scoreboard backend. Backends other than the database
+# must be populated with ./manage.py rebuild_scoreboard when they are first used.
+SCOREBOARD_BACKEND: dict[str, Any] = {
+    "BACKEND": "gchqnet.quest.scoreboard_backends.database.DatabaseScoreboardBackend",
+}
+
+# The global recent activity feed is read from the activity feed backend. Backends other than the database must be
+# populated with ./manage.py backfill_activity_feed when they are first used.
+ACTIVITY_FEED_BACKEND: dict[str, Any] = {
+    "BACKEND": "gchqnet.quest.activity_feeds.database.DatabaseActivityFeedBackend",
+}
+
+# The villages shown on the maps are proxied from the EMF website. They are refreshed on a schedule by
+# ./manage.py refresh_villages, or by a request once they are older than VILLAGES_MAX_AGE seconds.
+# A last-known-good copy is kept at VILLAGES_CACHE_PATH, so that they can be served when the upstream is down.
+VILLAGES_GEOJSON_URL = "https://www.emfcamp.org/api/villages.geojson"
+VILLAGES_MAX_AGE = 600
+VILLAGES_CACHE_PATH = BASE_DIR.parent / "var" / "villages.geojson"
+
+# Usernames for new players are claimed from a pool, which is refilled to this size by ./manage.py refill_username_pool.
+USERNAME_POOL_SIZE = 2000
+
+# Manifests uploaded to /api/badges/provision/ are provisioned within the request, so their size is limited.
+# Larger manifests can be provisioned with ./manage.py provision_badges.
+BADGE_MANIFEST_MAX_UPLOAD_SIZE = 1024 * 1024
+
 # Crispy Forms
 CRISPY_ALLOWED_TEMPLATE_PACKS = ["gds"]
 CRISPY_TEMPLATE_PACK = "gds"
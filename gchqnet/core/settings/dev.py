@@ -25,6 +25,9 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]  # noqa: F405
 
 HIDE_PRIVATE_API_ENDPOINTS = False
 
+# Don't require a worker to process the outbox in development.
+OUTBOX_ALWAYS_EAGER = True
+
 # Import settings from local.py if it exists.
 try:
     from .local import *  # type: ignore[import-not-found,unused-ignore]  # noqa: F403
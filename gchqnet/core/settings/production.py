@@ -20,6 +20,20 @@ CACHES = {
     }
 }
 
+SCOREBOARD_BACKEND = {
+    "BACKEND": "gchqnet.quest.scoreboard_backends.redis.RedisScoreboardBackend",
+    "OPTIONS": {
+        "url": "redis://127.0.0.1:6379",
+    },
+}
+
+ACTIVITY_FEED_BACKEND = {
+    "BACKEND": "gchqnet.quest.activity_feeds.redis.RedisActivityFeedBackend",
+    "OPTIONS": {
+        "url": "redis://127.0.0.1:6379",
+    },
+}
+
 HIDE_PRIVATE_API_ENDPOINTS = os.environ.get("GCHQNET_HIDE_PRIVATE_API_ENDPOINTS", "true").lower() == "true"
 
 SESSION_COOKIE_SECURE = True
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypedDict
+
+from django.db import connection
+from django_prometheus.conf import NAMESPACE
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Most stages are a single query, so the buckets are weighted towards a few milliseconds.
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+pipeline_stage_duration = Histogram(
+    "gchqnet_pipeline_stage_duration_seconds",
+    "Time taken by each stage of a pipeline.",
+    ["pipeline", "stage"],
+    namespace=NAMESPACE,
+    buckets=DURATION_BUCKETS,
+)
+
+pipeline_duration = Histogram(
+    "gchqnet_pipeline_duration_seconds",
+    "Time taken by each run of a pipeline.",
+    ["pipeline"],
+    namespace=NAMESPACE,
+    buckets=DURATION_BUCKETS,
+)
+
+
+class StageReport(TypedDict):
+    queries: int
+    duration: float
+
+
+class PipelineTimer:
+    """
+    Record the number of queries and the wall time for each stage of a pipeline.
+
+    Stages are recorded in the order that they are run. Running a stage twice adds to the existing report.
+    The duration of every stage that is run is also observed in a histogram, labelled by pipeline and stage name, so
+    names must not contain anything with unbounded cardinality such as a username.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stages: dict[str, StageReport] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        queries = 0
+
+        def _count_query(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any) -> Any:  # noqa: FBT001
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(_count_query):
+                yield
+        finally:
+            duration = time.perf_counter() - start
+            report = self.stages.setdefault(name, StageReport(queries=0, duration=0.0))
+            report["queries"] += queries
+            report["duration"] += duration
+            pipeline_stage_duration.labels(pipeline=self.name, stage=name).observe(duration)
+
+    @property
+    def total_queries(self) -> int:
+        return sum(report["queries"] for report in self.stages.values())
+
+    @property
+    def total_duration(self) -> float:
+        return sum(report["duration"] for report in self.stages.values())
+
+    def finish(self) -> None:
+        """Observe the total duration of the pipeline and log the report."""
+        pipeline_duration.labels(pipeline=self.name).observe(self.total_duration)
+        self.log()
+
+    def log(self) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        stages = ", ".join(
+            f"{name}={report['queries']}q/{report['duration'] * 1000:.2f}ms" for name, report in self.stages.items()
+        )
+        logger.debug(
+            "%s: %dq/%.2fms (%s)", self.name, self.total_queries, self.total_duration * 1000, stages or "no stages"
+        )
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark for badge response verification, run with ./manage.py benchmark_hmac.
+
+reference_badge_response_calculation is the calculation as it was before keys were cached. The tests check the
+calculation in gchqnet.hexpansion.crypto against it, but do not time either.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from typing import TypedDict
+
+from .crypto import BadgeResponseVerifier, badge_response_calculation
+
+
+def reference_generate_diversified_key(
+    chip_serial_number: bytes,
+    root_key: bytes | bytearray | list[int],
+    target_slot: int,
+) -> bytes:
+    serial_pad = [0x00] * (32 - 9)
+
+    generation_hash_data = list(root_key)
+    generation_hash_data += [0x1C, 0x04, target_slot & 0xFF, (target_slot >> 8) & 0xFF]
+    generation_hash_data += [0xEE, 0x01, 0x23]
+    generation_hash_data += [0x00] * 25
+    generation_hash_data += list(chip_serial_number) + serial_pad
+
+    return hashlib.sha256(bytes(generation_hash_data)).digest()
+
+
+def reference_badge_response_calculation(
+    atsha_serial: bytes,
+    atsha_random: bytes,
+    badge_mac: str,
+    master_key: bytes | bytearray | list[int],
+    slot: int = 0x00,
+) -> bytes:
+    marker_key = reference_generate_diversified_key(atsha_serial, master_key, 0x00)
+
+    formatted_mac = bytearray(badge_mac, "ascii")
+
+    challenge = list(formatted_mac) + [0x00] * 3
+
+    noncedata = list(atsha_random) + list(challenge) + [0x16, 0x01, 0x00]
+    atsha_tempkey = hashlib.sha256(bytes(noncedata)).digest()
+
+    otherdata = [0x08, 0x01, slot, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+
+    macdata = list(marker_key) + list(atsha_tempkey)
+    macdata += otherdata[0:4] + [0x00] * 8 + otherdata[4:7] + [0xEE] + otherdata[7:11] + [0x01, 0x23] + otherdata[11:13]
+    return hashlib.sha256(bytes(macdata)).digest()
+
+
+class BenchmarkResult(TypedDict):
+    name: str
+    iterations: int
+    duration: float
+    per_second: float
+
+
+def _result(name: str, iterations: int, duration: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, iterations=iterations, duration=duration, per_second=iterations / duration)
+
+
+def benchmark_badge_response(*, iterations: int = 10_000, hexpansions: int = 100) -> list[BenchmarkResult]:
+    """
+    Time the reference and optimised calculations over the same random captures.
+
+    Captures are spread over a number of hexpansions, as they would be during the game.
+    """
+    master_key = os.urandom(32)
+    serials = [os.urandom(9) for _ in range(hexpansions)]
+    captures = [(serials[i % hexpansions], os.urandom(32), "DC-54-75-D8-6E-88") for i in range(iterations)]
+    responses = [
+        (serial, rand, mac, reference_badge_response_calculation(serial, rand, mac, master_key).hex())
+        for serial, rand, mac in captures
+    ]
+
+    results = []
+
+    start = time.perf_counter()
+    for serial, rand, mac in captures:
+        reference_badge_response_calculation(serial, rand, mac, master_key)
+    results.append(_result("reference", iterations, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    for serial, rand, mac in captures:
+        badge_response_calculation(serial, rand, mac, master_key)
+    results.append(_result("cached", iterations, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    verified = BadgeResponseVerifier(master_key).verify_many(responses)
+    results.append(_result("batch verify", iterations, time.perf_counter() - start))
+
+    assert all(verified), "The optimised calculation does not match the reference implementation"
+
+    return results
@@ -1,4 +1,36 @@
 import hashlib
+import hmac
+from collections.abc import Iterable
+from functools import lru_cache
+
+# The number of diversified keys to keep. There is one for each hexpansion.
+DIVERSIFIED_KEY_CACHE_SIZE = 4096
+
+_SERIAL_PAD = bytes(32 - 9)
+_NONCE_SUFFIX = bytes(3) + bytes([0x16, 0x01, 0x00])
+_KEY_LENGTH = 32
+
+
+@lru_cache(maxsize=16)
+def _diversification_state(root_key: bytes, target_slot: int) -> "hashlib._Hash":
+    """
+    Hash the part of the key generation data that is the same for every device.
+
+    With a 32 byte root key this is exactly one SHA-256 block, so only the serial number is hashed for each device.
+    """
+    generation_hash_data = root_key
+    generation_hash_data += bytes([0x1C, 0x04, target_slot & 0xFF, (target_slot >> 8) & 0xFF])
+    generation_hash_data += bytes([0xEE, 0x01, 0x23])
+    generation_hash_data += bytes(25)
+    return hashlib.sha256(generation_hash_data)
+
+
+@lru_cache(maxsize=DIVERSIFIED_KEY_CACHE_SIZE)
+def _diversified_key(chip_serial_number: bytes, root_key: bytes, target_slot: int) -> bytes:
+    generation_hash = _diversification_state(root_key, target_slot).copy()
+    generation_hash.update(chip_serial_number)
+    generation_hash.update(_SERIAL_PAD)
+    return generation_hash.digest()
 
 
 def generate_diversified_key(
@@ -6,18 +38,54 @@ def generate_diversified_key(
     root_key: bytes | bytearray | list[int],
     target_slot: int,
 ) -> bytes:
-    """Generates the diversified key for a given device"""
-    serial_pad = [0x00] * (32 - 9)
+    """
+    Generates the diversified key for a given device
+
+    The key is the same for every capture of a hexpansion, so recently used keys are cached.
+    """
+    return _diversified_key(bytes(chip_serial_number), bytes(root_key), target_slot)
+
+
+class BadgeResponseVerifier:
+    """
+    Calculate and verify the responses that badges give for a hexpansion.
+
+    The data for the final hash is assembled in a buffer that is reused between calls, so an instance must not be
+    shared between threads. Create one for each batch of responses instead.
+    """
 
-    generation_hash_data = list(root_key)
-    generation_hash_data += [0x1C, 0x04, target_slot & 0xFF, (target_slot >> 8) & 0xFF]
-    generation_hash_data += [0xEE, 0x01, 0x23]
-    generation_hash_data += [0x00] * 25
-    generation_hash_data += list(chip_serial_number) + serial_pad
+    def __init__(self, master_key: bytes | bytearray | list[int], slot: int = 0x00) -> None:
+        self.master_key = bytes(master_key)
 
-    diversified_key = hashlib.sha256(bytes(generation_hash_data)).digest()
+        # marker key, tempkey, then the otherdata from the MAC command
+        otherdata = [0x08, 0x01, slot, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+        suffix = (
+            otherdata[0:4] + [0x00] * 8 + otherdata[4:7] + [0xEE] + otherdata[7:11] + [0x01, 0x23] + otherdata[11:13]
+        )
+        self._macdata = bytearray(_KEY_LENGTH * 2) + bytes(suffix)
+        self._marker_key = memoryview(self._macdata)[:_KEY_LENGTH]
+        self._tempkey = memoryview(self._macdata)[_KEY_LENGTH : _KEY_LENGTH * 2]
 
-    return diversified_key
+    def calculate(self, atsha_serial: bytes, atsha_random: bytes, badge_mac: str) -> bytes:
+        # generate diversified key used on the badge
+        self._marker_key[:] = generate_diversified_key(atsha_serial, self.master_key, 0x00)
+
+        # generate tempkey after nonce command
+        nonce_hash = hashlib.sha256(atsha_random)
+        nonce_hash.update(badge_mac.encode("ascii"))
+        nonce_hash.update(_NONCE_SUFFIX)
+        self._tempkey[:] = nonce_hash.digest()
+
+        # perform a local mac command
+        return hashlib.sha256(self._macdata).digest()
+
+    def verify(self, atsha_serial: bytes, atsha_random: bytes, badge_mac: str, response_hex: str) -> bool:
+        expected = self.calculate(atsha_serial, atsha_random, badge_mac).hex()
+        return hmac.compare_digest(expected.encode(), response_hex.encode())
+
+    def verify_many(self, responses: Iterable[tuple[bytes, bytes, str, str]]) -> list[bool]:
+        """Verify many (serial, random, badge MAC, response hex) tuples."""
+        return [self.verify(*response) for response in responses]
 
 
 def badge_response_calculation(
@@ -28,23 +96,4 @@ def badge_response_calculation(
     slot: int = 0x00,
 ) -> bytes:
     """verifies a response from a badge"""
-    # generate diversified key used on the badge
-    marker_key = generate_diversified_key(atsha_serial, master_key, 0x00)
-
-    formatted_mac = bytearray(badge_mac, "ascii")
-
-    challenge = list(formatted_mac) + [0x00] * 3
-
-    # generate tempkey after nonce command
-    noncedata = list(atsha_random) + list(challenge) + [0x16, 0x01, 0x00]
-    atsha_tempkey = hashlib.sha256(bytes(noncedata)).digest()
-
-    # generate expected result from chip
-    otherdata = [0x08, 0x01, slot, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-
-    # perform a local mac command
-    macdata = list(marker_key) + list(atsha_tempkey)
-    macdata += otherdata[0:4] + [0x00] * 8 + otherdata[4:7] + [0xEE] + otherdata[7:11] + [0x01, 0x23] + otherdata[11:13]
-    client_resp = hashlib.sha256(bytes(macdata)).digest()
-
-    return client_resp
+    return BadgeResponseVerifier(master_key, slot).calculate(atsha_serial, atsha_random, badge_mac)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from gchqnet.hexpansion.benchmarks import benchmark_badge_response
+
+
+class Command(BaseCommand):
+    help = "Compare the speed of badge response verification against the original implementation"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--iterations", type=int, default=10_000)
+        parser.add_argument("--hexpansions", type=int, default=100, help="Number of distinct hexpansion serials")
+
+    def handle(
+        self,
+        *,
+        iterations: int,
+        hexpansions: int,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        results = benchmark_badge_response(iterations=iterations, hexpansions=hexpansions)
+        baseline = results[0]["duration"]
+
+        for result in results:
+            self.stdout.write(
+                f"{result['name']:>14}: {result['duration'] * 1000:8.1f}ms "
+                f"{result['per_second']:10.0f}/s {baseline / result['duration']:5.2f}x"
+            )
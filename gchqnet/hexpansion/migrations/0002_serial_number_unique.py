@@ -0,0 +1,21 @@
+# Generated by Django 5.0.6 on 2026-10-18 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hexpansion", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="hexpansion",
+            name="serial_number",
+            field=models.UUIDField(
+                help_text="Serial Number of ATSHA204, encoded as 128-bit UUID",
+                unique=True,
+                verbose_name="Serial Number",
+            ),
+        ),
+    ]
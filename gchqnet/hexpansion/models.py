@@ -14,7 +14,11 @@ class Hexpansion(ExportModelOperationsMixin("hexpansion"), models.Model):  # typ
         unique=True,
     )
     eeprom_serial_number = models.SmallIntegerField("EEPROM Serial Number", unique=True)
-    serial_number = models.UUIDField("Serial Number", help_text="Serial Number of ATSHA204, encoded as 128-bit UUID")
+    serial_number = models.UUIDField(
+        "Serial Number",
+        help_text="Serial Number of ATSHA204, encoded as 128-bit UUID",
+        unique=True,
+    )
     hardware_revision = models.CharField("Hardware Version", max_length=4, choices=[("1", "rev 1.0")], default="1")
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1,4 +1,7 @@
-from gchqnet.hexpansion.crypto import badge_response_calculation, generate_diversified_key
+import os
+
+from gchqnet.hexpansion.benchmarks import reference_badge_response_calculation
+from gchqnet.hexpansion.crypto import BadgeResponseVerifier, badge_response_calculation, generate_diversified_key
 
 
 def test_generate_diversified_key() -> None:
@@ -40,3 +43,43 @@ def test_badge_response_calculation__bad() -> None:
     expected = badge_response_calculation(serial, random, badge_mac, key_0)
 
     assert response != expected
+
+
+def test_generate_diversified_key__cached() -> None:
+    key = generate_diversified_key(b"b" * 9, [0x04] * 32, 0)
+
+    assert generate_diversified_key(b"b" * 9, bytes([0x04] * 32), 0) is key
+    assert generate_diversified_key(b"b" * 9, [0x05] * 32, 0) != key
+    assert generate_diversified_key(b"b" * 9, [0x04] * 32, 1) != key
+
+
+def test_badge_response_calculation__matches_reference() -> None:
+    master_key = os.urandom(32)
+
+    for slot in (0, 1):
+        for _ in range(50):
+            serial, rand = os.urandom(9), os.urandom(32)
+            assert badge_response_calculation(
+                serial, rand, "DC-54-75-D8-6E-88", master_key, slot
+            ) == reference_badge_response_calculation(serial, rand, "DC-54-75-D8-6E-88", master_key, slot)
+
+
+def test_badge_response_verifier__verify_many() -> None:
+    master_key = os.urandom(32)
+    serials = [os.urandom(9) for _ in range(3)]
+    rand = os.urandom(32)
+    good = [
+        (
+            serial,
+            rand,
+            "DC-54-75-D8-6E-88",
+            badge_response_calculation(serial, rand, "DC-54-75-D8-6E-88", master_key).hex(),
+        )
+        for serial in serials
+    ]
+
+    verifier = BadgeResponseVerifier(master_key)
+
+    assert verifier.verify_many(
+        [*good, (serials[0], rand, "DC-54-75-D8-6E-89", good[0][3]), (serials[1], rand, "DC-54-75-D8-6E-88", "a" * 64)]
+    ) == [True, True, True, False, False]
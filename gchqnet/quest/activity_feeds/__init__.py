@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .base import ActivityFeedEntry, BaseActivityFeedBackend, get_activity_feed_entries
+
+__all__ = [
+    "ActivityFeedEntry",
+    "BaseActivityFeedBackend",
+    "get_activity_feed_backend",
+    "get_activity_feed_entries",
+]
+
+
+@cache
+def get_activity_feed_backend() -> BaseActivityFeedBackend:
+    """Get the activity feed backend configured by the ACTIVITY_FEED_BACKEND setting."""
+    backend_cls = import_string(settings.ACTIVITY_FEED_BACKEND["BACKEND"])
+    return backend_cls(**settings.ACTIVITY_FEED_BACKEND.get("OPTIONS", {}))
+
+
+@receiver(setting_changed)
+def _reset_activity_feed_backend(*, setting: str, **kwargs: Any) -> None:
+    if setting == "ACTIVITY_FEED_BACKEND":
+        get_activity_feed_backend.cache_clear()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypedDict
+from uuid import UUID
+
+from django.db import models
+
+if TYPE_CHECKING:
+    from gchqnet.quest.models import ActivityEvent
+
+
+class ActivityFeedEntry(TypedDict):
+    player_username: str
+    player_name: str
+    type: str
+    location_id: UUID | None
+    target_name: str
+    difficulty: int
+    created_at: datetime
+
+
+def get_activity_feed_entries(qs: models.QuerySet[ActivityEvent], count: int) -> list[ActivityFeedEntry]:
+    """Read the most recent activity events from a queryset as feed entries, newest first."""
+    return list(
+        qs.order_by("-created_at").values(  # type: ignore[arg-type]
+            "type",
+            "location_id",
+            "target_name",
+            "difficulty",
+            "created_at",
+            player_username=models.F("user__username"),
+            player_name=models.F("user__display_name"),
+        )[:count]
+    )
+
+
+class BaseActivityFeedBackend:
+    """
+    Storage for the global recent activity feed, holding the most recent entries, newest first.
+
+    The ActivityEvent table is the source of truth. Backends are told about new events once they have been committed,
+    and can be repopulated from it with ./manage.py backfill_activity_feed.
+
+    Options:
+        max_length: The number of entries to keep.
+    """
+
+    def __init__(self, *, max_length: int = 100, **options: Any) -> None:
+        self.max_length = max_length
+
+    def get_recent(self, count: int) -> list[ActivityFeedEntry]:
+        raise NotImplementedError  # pragma: nocover
+
+    def append(self, entry: ActivityFeedEntry) -> None:
+        """Add a new entry to the feed, dropping the oldest if the feed is full."""
+        raise NotImplementedError  # pragma: nocover
+
+    def replace(self, entries: Iterable[ActivityFeedEntry]) -> None:
+        """Replace the whole feed. The entries must be newest first."""
+        raise NotImplementedError  # pragma: nocover
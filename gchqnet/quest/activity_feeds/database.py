@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from gchqnet.quest.models import ActivityEvent
+
+from .base import ActivityFeedEntry, BaseActivityFeedBackend, get_activity_feed_entries
+
+
+class DatabaseActivityFeedBackend(BaseActivityFeedBackend):
+    """Read the feed from the ActivityEvent table. Changes do not need to be sent to it."""
+
+    def get_recent(self, count: int) -> list[ActivityFeedEntry]:
+        return get_activity_feed_entries(ActivityEvent.objects.all(), count)
+
+    def append(self, entry: ActivityFeedEntry) -> None:
+        pass
+
+    def replace(self, entries: Iterable[ActivityFeedEntry]) -> None:
+        pass
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+from .base import ActivityFeedEntry, BaseActivityFeedBackend
+
+
+class MemoryActivityFeedBackend(BaseActivityFeedBackend):
+    """
+    Keep the feed in the memory of the current process.
+
+    Each process has its own copy, which starts empty. This is intended for tests and local development.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        self._entries: deque[ActivityFeedEntry] = deque(maxlen=self.max_length)
+        self._lock = threading.Lock()
+
+    def get_recent(self, count: int) -> list[ActivityFeedEntry]:
+        with self._lock:
+            return list(self._entries)[:count]
+
+    def append(self, entry: ActivityFeedEntry) -> None:
+        with self._lock:
+            self._entries.appendleft(entry)
+
+    def replace(self, entries: Iterable[ActivityFeedEntry]) -> None:
+        with self._lock:
+            self._entries = deque(islice(entries, self.max_length), maxlen=self.max_length)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, cast
+from uuid import UUID
+
+import redis
+
+from .base import ActivityFeedEntry, BaseActivityFeedBackend
+
+
+def _dump_entry(entry: ActivityFeedEntry) -> str:
+    return json.dumps(
+        {
+            **entry,
+            "location_id": str(entry["location_id"]) if entry["location_id"] else None,
+            "created_at": entry["created_at"].isoformat(),
+        }
+    )
+
+
+def _load_entry(data: str) -> ActivityFeedEntry:
+    entry = json.loads(data)
+    return ActivityFeedEntry(
+        player_username=entry["player_username"],
+        player_name=entry["player_name"],
+        type=entry["type"],
+        location_id=UUID(entry["location_id"]) if entry["location_id"] else None,
+        target_name=entry["target_name"],
+        difficulty=entry["difficulty"],
+        created_at=datetime.fromisoformat(entry["created_at"]),
+    )
+
+
+class RedisActivityFeedBackend(BaseActivityFeedBackend):
+    """
+    Keep the feed in a capped Redis list, shared by every process.
+
+    New entries are pushed onto the head of the list, which is then trimmed to max_length.
+
+    Options:
+        url: The URL of the Redis server.
+        key: The key of the list.
+        max_length: The number of entries to keep.
+    """
+
+    def __init__(self, *, url: str, key: str = "gchqnet:activity:global", **options: Any) -> None:
+        super().__init__(**options)
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.key = key
+
+    def get_recent(self, count: int) -> list[ActivityFeedEntry]:
+        if count <= 0:
+            return []
+        return [_load_entry(data) for data in cast(list[str], self.client.lrange(self.key, 0, count - 1))]
+
+    def append(self, entry: ActivityFeedEntry) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.lpush(self.key, _dump_entry(entry))
+        pipe.ltrim(self.key, 0, self.max_length - 1)
+        pipe.execute()  # type: ignore[no-untyped-call]
+
+    def replace(self, entries: Iterable[ActivityFeedEntry]) -> None:
+        data = [_dump_entry(entry) for entry in entries][: self.max_length]
+
+        # Replace the list in a single transaction, so readers never see a partial feed.
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self.key)
+        if data:
+            pipe.rpush(self.key, *data)
+        pipe.execute()  # type: ignore[no-untyped-call]
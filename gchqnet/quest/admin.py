@@ -6,7 +6,7 @@ from django.utils.safestring import mark_safe
 
 from gchqnet.quest.models.captures import CaptureLog
 
-from .models import CaptureEvent, Coordinates, Leaderboard, Location, RawCaptureEvent
+from .models import CaptureEvent, Coordinates, Leaderboard, Location, OutboxTask, RawCaptureEvent
 
 
 class CoordinatesAdmin(admin.StackedInline):
@@ -217,8 +217,21 @@ class LeaderboardAdmin(admin.ModelAdmin):
         return instance
 
 
+class OutboxTaskAdmin(ViewOnlyMixin, admin.ModelAdmin):
+    model = OutboxTask
+
+    list_display = ("kind", "attempts", "processed_at", "created_at")
+    list_filter = ("kind", ("processed_at", admin.EmptyFieldListFilter))
+    fieldsets = (
+        (None, {"fields": ("kind", "payload")}),
+        ("Processing", {"fields": ("attempts", "last_error", "processed_at")}),
+        ("Database Info", {"classes": ["collapse"], "fields": ("id", "created_at", "updated_at")}),
+    )
+
+
 admin.site.register(Location, LocationAdmin)
 admin.site.register(RawCaptureEvent, RawCaptureEventAdmin)
 admin.site.register(CaptureEvent, CaptureEventAdmin)
 admin.site.register(CaptureLog, CaptureLogAdmin)
 admin.site.register(Leaderboard, LeaderboardAdmin)
+admin.site.register(OutboxTask, OutboxTaskAdmin)
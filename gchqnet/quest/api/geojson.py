@@ -0,0 +1,142 @@
+"""
+Render locations as GeoJSON for the maps.
+
+Each location is rendered to a fragment of JSON once, and the fragment is kept in the cache until the location or
+its coordinates change. A response is then assembled by joining the fragments, without building a dict for each
+feature or validating the output with LocationGeoJSONSerializer.
+
+The output is the same as LocationGeoJSONSerializer would give, including coordinates formatted to 13 decimal places.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.http import HttpResponse
+
+from gchqnet.quest.models.location import Location, LocationDifficulty
+
+if TYPE_CHECKING:  # pragma: nocover
+    from django.db.models import QuerySet
+
+    from gchqnet.logistics.models import PlannedLocation
+
+LOCATION_FEATURE_CACHE_TIMEOUT = 60 * 60 * 24
+
+DIFFICULTY_COLOURS = {
+    LocationDifficulty.EASY.value: "#648FFF",
+    LocationDifficulty.MEDIUM.value: "#785EF0",
+    LocationDifficulty.HARD.value: "#DC267F",
+    LocationDifficulty.INSANE.value: "#FE6100",
+    LocationDifficulty.IMPOSSIBLE.value: "#1AFF1A",
+}
+
+
+class GeoJSONResponse(HttpResponse):
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content, content_type="application/geo+json")
+
+
+def _location_feature_cache_key(location_id: UUID) -> str:
+    return f"quest:geojson:location:{location_id}"
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _feature_fragment(name: str, difficulty: str, colour: str, long: Decimal, lat: Decimal) -> str:
+    """Render a feature, without the opening of the properties object or the feature ID."""
+    return (
+        f'"name":{_dumps(name)},"colour":{_dumps(colour)},"difficulty":{_dumps(difficulty)}}},'
+        f'"geometry":{{"coordinates":["{long:.13f}","{lat:.13f}"],"type":"Point"}}'
+    )
+
+
+def render_feature_collection(fragments: Iterable[str | None]) -> bytes:
+    """
+    Join feature fragments into a feature collection.
+
+    Each feature has the index of its fragment as its ID, and None is used for locations without coordinates.
+    """
+    features = ",".join(
+        f'{{"type":"Feature","properties":{{"id":{idx},{fragment},"id":0}}'
+        for idx, fragment in enumerate(fragments)
+        if fragment is not None
+    )
+    return f'{{"type":"FeatureCollection","features":[{features}]}}'.encode()
+
+
+def _location_fragment(location: Location) -> str:
+    """Render a location, or return an empty string if it has no coordinates."""
+    try:
+        coordinates = location.coordinates
+    except ObjectDoesNotExist:
+        return ""
+
+    return _feature_fragment(
+        location.display_name,
+        LocationDifficulty(location.difficulty).label,
+        DIFFICULTY_COLOURS[location.difficulty],
+        coordinates.long,
+        coordinates.lat,
+    )
+
+
+def get_location_fragments(location_ids: Sequence[UUID]) -> list[str | None]:
+    """Get the fragment for each location, rendering any that are not in the cache in a single query."""
+    keys = [_location_feature_cache_key(location_id) for location_id in location_ids]
+    cached: dict[str, str] = cache.get_many(keys)
+
+    if missing := [location_id for location_id, key in zip(location_ids, keys, strict=True) if key not in cached]:
+        rendered = {
+            _location_feature_cache_key(location.id): _location_fragment(location)
+            for location in Location.objects.filter(id__in=missing).select_related("coordinates").order_by()
+        }
+        cache.set_many(rendered, timeout=LOCATION_FEATURE_CACHE_TIMEOUT)
+        cached.update(rendered)
+
+    return [cached.get(key) or None for key in keys]
+
+
+def render_locations(locations: QuerySet[Location]) -> GeoJSONResponse:
+    location_ids = list(locations.values_list("id", flat=True))
+    return GeoJSONResponse(render_feature_collection(get_location_fragments(location_ids)))
+
+
+def invalidate_location_features(*location_ids: UUID) -> None:
+    """
+    Discard the cached fragments for locations.
+
+    They are discarded again after the transaction is committed, in case a request cached the old data meanwhile.
+    """
+    keys = [_location_feature_cache_key(location_id) for location_id in location_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _planned_location_fragment(location: PlannedLocation) -> str | None:
+    if not (location.lat and location.long):
+        return None
+
+    try:
+        difficulty = LocationDifficulty(location.difficulty).label if location.difficulty else "Unknown"
+    except ValueError:
+        difficulty = "Unknown"
+    colour = DIFFICULTY_COLOURS.get(location.difficulty or 0, "#FFFFFF")
+
+    return _feature_fragment(location.internal_name, difficulty, colour, location.long, location.lat)
+
+
+def render_planned_locations(planned_locations: QuerySet[PlannedLocation]) -> GeoJSONResponse:
+    """Render planned locations, which are only shown to admins and so are not cached."""
+    return GeoJSONResponse(
+        render_feature_collection(_planned_location_fragment(location) for location in planned_locations)
+    )
@@ -6,6 +6,7 @@ from .scoreboards import (
     LeaderboardWithScoresSerializer,
     ScoreboardEntrySerializer,
 )
+from .stats import PlayerCaptureStatsSerializer
 
 __all__ = [
     "BadgeAPIRequestSerializer",
@@ -16,5 +17,6 @@ __all__ = [
     "LeaderboardWithScoresSerializer",
     "LocationGeoJSONSerializer",
     "LocationSerializer",
+    "PlayerCaptureStatsSerializer",
     "ScoreboardEntrySerializer",
 ]
@@ -48,6 +48,14 @@ class BadgeCaptureSubmissionSerializer(BadgeAPIRequestSerializer):
     fw_rev = serializers.CharField(max_length=20)
 
 
+class BadgeCaptureBatchSubmissionSerializer(BadgeAPIRequestSerializer):
+    MAX_CAPTURES = 100
+
+    captures = serializers.ListField(child=BadgeCaptureProofSerializer(), allow_empty=False, max_length=MAX_CAPTURES)
+    app_rev = serializers.CharField(max_length=20)
+    fw_rev = serializers.CharField(max_length=20)
+
+
 class BadgeCaptureSuccessSerializer(serializers.Serializer):
     result = serializers.CharField(default="success")
     repeat = serializers.BooleanField()
@@ -58,3 +66,15 @@ class BadgeCaptureSuccessSerializer(serializers.Serializer):
 class BadgeCaptureFailureSerializer(serializers.Serializer):
     result = serializers.CharField(default="fail")
     message = serializers.CharField()
+
+
+class BadgeCaptureBatchResultSerializer(serializers.Serializer):
+    result = serializers.ChoiceField(choices=["success", "fail"])
+    repeat = serializers.BooleanField(required=False)
+    location_name = serializers.CharField(max_length=30, required=False)
+    difficulty = serializers.CharField(required=False)
+    message = serializers.CharField(required=False)
+
+
+class BadgeCaptureBatchResponseSerializer(serializers.Serializer):
+    results = BadgeCaptureBatchResultSerializer(many=True)
@@ -10,15 +10,13 @@ class LeaderboardLinkedUserSerializer(serializers.ModelSerializer):
         fields = ["username", "display_name"]
 
 
-class ScoreboardEntrySerializer(serializers.ModelSerializer):
+class ScoreboardEntrySerializer(serializers.Serializer):
+    username = serializers.CharField()
+    display_name = serializers.CharField()
     rank = serializers.IntegerField()
     capture_count = serializers.IntegerField()
     current_score = serializers.IntegerField()
 
-    class Meta:
-        model = User
-        fields = ["username", "display_name", "rank", "capture_count", "current_score"]
-
 
 class LeaderboardSerializer(serializers.ModelSerializer):
     owner = LeaderboardLinkedUserSerializer()
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+
+class PlayerCaptureStatsSerializer(serializers.Serializer):
+    username = serializers.CharField()
+    display_name = serializers.CharField()
+    submission_count = serializers.IntegerField()
+    rejected_submission_count = serializers.IntegerField()
+    repeat_submission_count = serializers.IntegerField()
+    capture_count = serializers.IntegerField()
+    last_submission_at = serializers.DateTimeField(allow_null=True)
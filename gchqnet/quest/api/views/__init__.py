@@ -1,10 +1,12 @@
 from .badge import BadgeAPIViewset
 from .locations import LocationViewset
 from .scoreboards import GlobalScoreboardAPIView, PrivateScoreboardAPIViewset
+from .stats import PlayerCaptureStatsAPIView
 
 __all__ = [
     "BadgeAPIViewset",
     "LocationViewset",
     "GlobalScoreboardAPIView",
+    "PlayerCaptureStatsAPIView",
     "PrivateScoreboardAPIViewset",
 ]
@@ -11,14 +11,19 @@ from rest_framework.response import Response
 from gchqnet.accounts.api.serializers import UserProfileSerializer
 from gchqnet.accounts.repository import check_badge_credentials
 from gchqnet.accounts.totp import CustomTOTP
-from gchqnet.hexpansion.models import Hexpansion
 from gchqnet.quest.api.serializers import (
     BadgeAPIRequestSerializer,
     BadgeCaptureSubmissionSerializer,
     BadgeOTPResponseSerializer,
 )
-from gchqnet.quest.api.serializers.badge import BadgeCaptureFailureSerializer, BadgeCaptureSuccessSerializer
-from gchqnet.quest.repository.captures import record_attempted_capture
+from gchqnet.quest.api.serializers.badge import (
+    BadgeCaptureBatchResponseSerializer,
+    BadgeCaptureBatchSubmissionSerializer,
+    BadgeCaptureFailureSerializer,
+    BadgeCaptureSuccessSerializer,
+)
+from gchqnet.quest.repository.captures import CaptureProof, record_attempted_capture, record_attempted_captures
+from gchqnet.quest.repository.hexpansions import get_hexpansion_by_serial_number
 
 
 class BadgeAPIViewset(viewsets.GenericViewSet):
@@ -102,10 +107,9 @@ class BadgeAPIViewset(viewsets.GenericViewSet):
             # Theoretically, we can never trigger this.
             raise exceptions.ValidationError(detail={"detail": ["Invalid serial number for capture"]}) from e
 
-        try:
-            hexpansion = Hexpansion.objects.get(serial_number=hex_uuid)
-        except Hexpansion.DoesNotExist as e:
-            raise exceptions.ValidationError(detail={"detail": ["Unable to find that hexpansion"]}) from e
+        hexpansion = get_hexpansion_by_serial_number(hex_uuid)
+        if hexpansion is None:
+            raise exceptions.ValidationError(detail={"detail": ["Unable to find that hexpansion"]})
 
         capture_result = record_attempted_capture(
             result["badge"],
@@ -121,3 +125,47 @@ class BadgeAPIViewset(viewsets.GenericViewSet):
             return Response(capture_result, status=400)
 
         return Response(capture_result)
+
+    @extend_schema(
+        summary="Submit a batch of cryptographic proofs of capture",
+        exclude=settings.HIDE_PRIVATE_API_ENDPOINTS,
+        request=BadgeCaptureBatchSubmissionSerializer,
+        responses={200: BadgeCaptureBatchResponseSerializer},
+        tags=["Badge Internal API"],
+    )
+    @action(methods=["POST"], detail=False, url_path="capture-batch")
+    def capture_batch(self, request: Request) -> Response:
+        """
+        Submit captures that were made while the badge was offline.
+
+        The captures are recorded in the order that they are given, and a result is returned for each of them.
+        """
+        serializer = BadgeCaptureBatchSubmissionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = check_badge_credentials(
+            serializer.validated_data["mac_address"],
+            serializer.validated_data["badge_secret"],
+        )
+
+        if result["result"] == "failure":
+            raise exceptions.AuthenticationFailed()
+
+        proofs = [
+            CaptureProof(
+                serial_number=UUID(int=capture["sn"]),
+                rand=binascii.unhexlify(capture["rand"]),
+                hmac=capture["hmac"],
+            )
+            for capture in serializer.validated_data["captures"]
+        ]
+
+        capture_results = record_attempted_captures(
+            result["badge"],
+            proofs,
+            app_rev=serializer.validated_data["app_rev"],
+            fw_rev=serializer.validated_data["fw_rev"],
+            validate_hmac=True,
+        )
+
+        return Response({"results": capture_results})
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
-import requests
 from django.conf import settings
-from django.core.cache import cache
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.http import HttpRequest, HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
@@ -14,33 +14,65 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from gchqnet.achievements.models import LocationGroup
+from gchqnet.core.pagination import KeysetPagination
+from gchqnet.quest.api.geojson import render_locations
 from gchqnet.quest.api.serializers import (
     LocationGeoJSONSerializer,
     LocationSerializer,
 )
-from gchqnet.quest.models import CaptureEvent, LocationDifficulty
+from gchqnet.quest.models import CaptureEvent
 from gchqnet.quest.models.location import Location
+from gchqnet.quest.repository.found_locations import get_found_locations
+from gchqnet.quest.repository.versions import LOCATIONS_VERSION, get_etag, user_version_name
+from gchqnet.quest.villages import VillagesUnavailableError, get_villages
 
 if TYPE_CHECKING:  # pragma: nocover
     from django.db.models.query import QuerySet
 
 
-VILLAGE_CACHE_KEY = "map__village__geodata"
+def _my_finds_version_names(request: HttpRequest) -> list[str]:
+    if settings.GAME_MODE == "post" or not request.user.is_authenticated:
+        return [LOCATIONS_VERSION]
+    return [LOCATIONS_VERSION, user_version_name(request.user.id)]
+
+
+def _my_finds_etag(request: HttpRequest) -> str:
+    user_id = request.user.id if request.user.is_authenticated else "anonymous"
+    return get_etag(f"finds-{settings.GAME_MODE}-{user_id}", *_my_finds_version_names(request))
 
 
 class LocationViewset(viewsets.ReadOnlyModelViewSet):
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = LocationSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
 
     def get_queryset(self) -> QuerySet[Location]:
+        return Location.objects.order_by("id")
+
+    def _set_found_at(self, locations: list[Location]) -> list[Location]:
+        """Set when the user found each location, only querying for those that they have found."""
         assert self.request.user.is_authenticated
-        return Location.objects.order_by("id").annotate(
-            found_at=models.Subquery(
-                CaptureEvent.objects.filter(location=models.OuterRef("id"), created_by=self.request.user).values(
-                    "created_at"
-                ),
-            ),
+        found_ids = get_found_locations(self.request.user.id).filter(location.id for location in locations)
+        found_at = (
+            dict(
+                CaptureEvent.objects.filter(location_id__in=found_ids, created_by=self.request.user).values_list(
+                    "location_id", "created_at"
+                )
+            )
+            if found_ids
+            else {}
         )
+        for location in locations:
+            location.found_at = found_at.get(location.id)
+        return locations
+
+    def paginate_queryset(self, queryset: QuerySet[Location]) -> list[Location] | None:  # type: ignore[override]
+        page = super().paginate_queryset(queryset)
+        return self._set_found_at(page) if page is not None else None
+
+    def get_object(self) -> Location:
+        return self._set_found_at([super().get_object()])[0]
 
     def get_serializer_context(self) -> dict[str, Any]:
         assert self.request.user.is_authenticated
@@ -75,7 +107,8 @@ class LocationViewset(viewsets.ReadOnlyModelViewSet):
         },
     )
     @action(url_path="my-finds", methods=["GET"], detail=False, permission_classes=[permissions.AllowAny])
-    def geojson(self, request: Request) -> Response:
+    @method_decorator(condition(etag_func=_my_finds_etag))
+    def geojson(self, request: Request) -> HttpResponse:
         if settings.GAME_MODE == "post":
             locations = Location.objects.all()
         else:
@@ -91,54 +124,7 @@ class LocationViewset(viewsets.ReadOnlyModelViewSet):
             except LocationGroup.DoesNotExist:
                 raise
 
-        def _difficulty_label(location: Location) -> str:
-            return LocationDifficulty(location.difficulty).label
-
-        def _colour_for_difficulty(location: Location) -> str:
-            lut = {
-                LocationDifficulty.EASY.value: "#648FFF",
-                LocationDifficulty.MEDIUM.value: "#785EF0",
-                LocationDifficulty.HARD.value: "#DC267F",
-                LocationDifficulty.INSANE.value: "#FE6100",
-                LocationDifficulty.IMPOSSIBLE.value: "#1AFF1A",
-            }
-            return lut[location.difficulty]
-
-        def _has_coords(location: Location) -> bool:
-            try:
-                _ = location.coordinates
-                return True
-            except ObjectDoesNotExist:
-                return False
-
-        data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "id": idx,
-                        "name": location.display_name,
-                        "difficulty": _difficulty_label(location),
-                        "colour": _colour_for_difficulty(location),
-                    },
-                    "geometry": {
-                        "coordinates": [
-                            location.coordinates.long,
-                            location.coordinates.lat,
-                        ],
-                        "type": "Point",
-                    },
-                    "id": 0,
-                }
-                for idx, location in enumerate(locations)
-                if _has_coords(location)
-            ],
-        }
-
-        serializer = LocationGeoJSONSerializer(data=data)
-        serializer.is_valid(raise_exception=True)
-        return Response(serializer.data, content_type="application/geo+json")
+        return render_locations(locations)
 
     @extend_schema(
         summary="Get villages as GeoJSON",
@@ -150,10 +136,12 @@ class LocationViewset(viewsets.ReadOnlyModelViewSet):
     )
     @action(methods=["GET"], detail=False, permission_classes=[permissions.AllowAny])
     def villages(self, request: Request) -> Response:
-        if not (village_data := cache.get(VILLAGE_CACHE_KEY)):
-            resp = requests.get("https://www.emfcamp.org/api/villages.geojson", timeout=2)
-            resp.raise_for_status()
-            village_data = resp.json()
-            cache.set(VILLAGE_CACHE_KEY, village_data, timeout=600)
+        try:
+            village_data = get_villages()
+        except VillagesUnavailableError:
+            return Response(
+                {"detail": "The villages are not available."},
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
+            )
 
         return Response(village_data, content_type="application/geo+json")
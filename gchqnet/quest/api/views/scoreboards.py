@@ -1,42 +1,67 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from rest_framework import filters, permissions, serializers, viewsets
 from rest_framework.generics import ListAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from gchqnet.accounts.models.user import UserQuerySet
+from gchqnet.core.pagination import KeysetPagination
 from gchqnet.quest.api.serializers import (
     LeaderboardSerializer,
     LeaderboardWithScoresSerializer,
     ScoreboardEntrySerializer,
 )
-from gchqnet.quest.models import Leaderboard
-from gchqnet.quest.repository import get_global_scoreboard
+from gchqnet.quest.models import Leaderboard, ScoreboardEntry
+from gchqnet.quest.repository.scoreboards import get_global_scoreboard_queryset
+from gchqnet.quest.repository.versions import (
+    SCORES_VERSION,
+    get_etag,
+    leaderboard_version_name,
+)
+
+
+def _global_scoreboard_etag(request: HttpRequest) -> str:
+    return get_etag("scoreboard", SCORES_VERSION)
 
-if TYPE_CHECKING:  # pragma: nocover
-    from django.db.models.query import QuerySet
+
+def _private_scoreboard_etag(request: HttpRequest, pk: str) -> str | None:
+    # The ETag is only given to members, and is specific to the user. Changing the members bumps the version of the
+    # leaderboard, so an ETag stops matching once the user leaves, without checking membership on every request.
+    if not request.user.is_authenticated:
+        return None
+    return get_etag(f"leaderboard-{pk}-{request.user.id}", SCORES_VERSION, leaderboard_version_name(pk))
 
 
 class GlobalScoreboardAPIView(ListAPIView):
     permission_classes = (permissions.AllowAny,)
     serializer_class = ScoreboardEntrySerializer
+    pagination_class = KeysetPagination
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ["rank", "capture_count", "current_score", "display_name"]
-    ordering = ["rank", "capture_count", "display_name"]
+    ordering = ["-current_score", "capture_count", "display_name"]
+    keyset_ordering = ("-current_score", "capture_count", "display_name")
 
-    def get_queryset(self) -> UserQuerySet:
-        return get_global_scoreboard()
+    def get_queryset(self) -> QuerySet[ScoreboardEntry, dict[str, Any]]:
+        # Pages are read by a range scan of the score index, so deep pages cost the same as the first.
+        return get_global_scoreboard_queryset()
 
     @extend_schema(summary="Get the global scoreboard", tags=["Scoreboards"])
+    @method_decorator(condition(etag_func=_global_scoreboard_etag))
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
         Get the entries on the global scoreboard.
 
-        By default, returns the users with the highest rank first.
+        By default, returns the users with the highest rank first. Use the next and previous links to move between
+        pages, which stay consistent while scores change.
+
+        Responses have an ETag, so that polling clients can make conditional requests.
         """
         return super().list(request, *args, **kwargs)
 
@@ -70,10 +95,12 @@ class PrivateScoreboardAPIViewset(viewsets.ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
     @extend_schema(summary="Get a private scoreboard", tags=["Scoreboards"])
+    @method_decorator(condition(etag_func=_private_scoreboard_etag))
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
         Get the details of a private scoreboard, including scores.
 
-        Scores are returned in order of rank.
+        Scores are returned in order of rank. Responses have an ETag, so that polling clients can make conditional
+        requests.
         """
         return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,46 @@
+from typing import Any
+
+from django.conf import settings
+from django.db.models import QuerySet
+from drf_spectacular.utils import extend_schema
+from rest_framework import filters, permissions
+from rest_framework.generics import ListAPIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.api.serializers import PlayerCaptureStatsSerializer
+from gchqnet.quest.repository import get_player_capture_stats_queryset
+
+
+class PlayerCaptureStatsAPIView(ListAPIView):
+    permission_classes = (permissions.IsAdminUser,)
+    serializer_class = PlayerCaptureStatsSerializer
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ["username", "display_name"]
+    ordering_fields = [
+        "username",
+        "submission_count",
+        "rejected_submission_count",
+        "repeat_submission_count",
+        "capture_count",
+        "last_submission_at",
+    ]
+    ordering = ["username"]
+
+    def get_queryset(self) -> QuerySet[User]:
+        return get_player_capture_stats_queryset()
+
+    @extend_schema(
+        summary="Get capture statistics for each player",
+        exclude=settings.HIDE_PRIVATE_API_ENDPOINTS,
+        tags=["Statistics"],
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Get a breakdown of the capture submissions made by each player.
+
+        Rejected submissions did not have a valid proof of capture, and repeat submissions were for locations that the
+        player had already captured.
+        """
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,105 @@
+"""
+Benchmark for rendering locations as GeoJSON, run with ./manage.py benchmark_geojson.
+
+reference_render_locations builds a dict for each feature and validates the output with LocationGeoJSONSerializer, as
+the map API did before the features were cached. The API tests compare render_locations against it.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import uuid
+from typing import Any, TypedDict
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.api.geojson import DIFFICULTY_COLOURS, invalidate_location_features, render_locations
+from gchqnet.quest.api.serializers import LocationGeoJSONSerializer
+from gchqnet.quest.models.location import Location, LocationDifficulty
+from gchqnet.quest.synthetic import create_locations
+
+
+def reference_render_locations(locations: Any) -> bytes:
+    def _has_coords(location: Location) -> bool:
+        try:
+            _ = location.coordinates
+            return True
+        except ObjectDoesNotExist:
+            return False
+
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {
+                    "id": idx,
+                    "name": location.display_name,
+                    "difficulty": LocationDifficulty(location.difficulty).label,
+                    "colour": DIFFICULTY_COLOURS[location.difficulty],
+                },
+                "geometry": {
+                    "coordinates": [location.coordinates.long, location.coordinates.lat],
+                    "type": "Point",
+                },
+                "id": 0,
+            }
+            for idx, location in enumerate(locations)
+            if _has_coords(location)
+        ],
+    }
+
+    serializer = LocationGeoJSONSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    return JSONRenderer().render(serializer.data)
+
+
+class BenchmarkResult(TypedDict):
+    name: str
+    duration: float
+    queries: int
+
+
+def _create_locations(count: int, rng: random.Random) -> None:
+    name = f"benchmark-{uuid.UUID(int=rng.getrandbits(128)).hex[:8]}"
+    user = User.objects.create(username=name, display_name=name, is_superuser=True, email=f"{name}@example.com")
+    create_locations(count, rng, created_by=user, name=name)
+
+
+def _run(name: str, render: Any) -> tuple[BenchmarkResult, bytes]:
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        content = render(Location.objects.all())
+        duration = time.perf_counter() - start
+    return BenchmarkResult(name=name, duration=duration, queries=len(ctx.captured_queries)), content
+
+
+def benchmark_geojson(*, locations: int = 3000, seed: int = 0) -> list[BenchmarkResult]:
+    """
+    Time the reference renderer, and the cached renderer with a cold and a warm cache.
+
+    The locations are created in a transaction that is rolled back afterwards, so this can be run against any
+    database. Any locations that already exist are included in the output.
+    """
+    with transaction.atomic():
+        _create_locations(locations, random.Random(seed))  # noqa: S311
+        location_ids = list(Location.objects.values_list("id", flat=True))
+        invalidate_location_features(*location_ids)
+
+        reference, expected = _run("reference", reference_render_locations)
+        cold, cold_content = _run("cold cache", lambda qs: render_locations(qs).content)
+        warm, warm_content = _run("warm cache", lambda qs: render_locations(qs).content)
+
+        invalidate_location_features(*location_ids)
+        transaction.set_rollback(True)
+
+    assert json.loads(cold_content) == json.loads(expected), "The cached renderer does not match the reference"
+    assert json.loads(warm_content) == json.loads(expected), "The cached renderer does not match the reference"
+
+    return [reference, cold, warm]
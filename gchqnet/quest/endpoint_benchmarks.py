@@ -0,0 +1,324 @@
+"""
+Benchmarks for the busiest pages and API endpoints, with budgets.
+
+Each endpoint is requested a few times on a generated dataset, measuring the number of queries, the wall time and the
+memory allocated while handling the request. The results are compared against the budgets in endpoint_budgets.json,
+which is checked in, so that a change which adds a query for each row on a page is caught before it is deployed. The
+results can also be saved and compared against a baseline from an earlier run.
+
+The dataset is created in a transaction that is rolled back afterwards, so this should be run against a development
+database. Query budgets are the same on every machine, but time and memory budgets are only a rough guide.
+
+As nothing is committed, the callbacks that would be run once each request's writes were committed, such as updating
+the scoreboard after a capture, are run at the end of the request instead, so that they are measured as part of it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal, NamedTuple, TypedDict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Abs
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.accounts.repository import invalidate_api_token, invalidate_badge_credentials
+from gchqnet.hexpansion.crypto import badge_response_calculation
+from gchqnet.quest.api.geojson import invalidate_location_features
+from gchqnet.quest.models.leaderboard import Leaderboard
+from gchqnet.quest.models.location import Location
+from gchqnet.quest.repository.found_locations import invalidate_found_locations
+from gchqnet.quest.repository.hexpansions import invalidate_hexpansion_lookup
+from gchqnet.quest.repository.rankings import add_scoreboard_entries
+from gchqnet.quest.repository.scores import add_user_scores
+
+from .synthetic import generate_dataset
+
+logger = logging.getLogger(__name__)
+
+BUDGETS_PATH = Path(__file__).resolve().parent / "endpoint_budgets.json"
+
+# Requests come from an address that is not in INTERNAL_IPS, so that the debug toolbar is not shown.
+CLIENT_REMOTE_ADDR = "192.0.2.1"
+
+
+class DatasetSize(TypedDict):
+    users: int
+    locations: int
+    groups: int
+    captures: int
+
+
+class EndpointBudget(TypedDict):
+    queries: int
+    time_ms: float
+    memory_kib: float
+
+
+class Budgets(TypedDict):
+    dataset: DatasetSize
+    endpoints: dict[str, EndpointBudget]
+
+
+class EndpointResult(TypedDict):
+    name: str
+    status_code: int
+    queries: int
+    time_ms: float
+    max_time_ms: float
+    memory_kib: float
+
+
+class BudgetComparison(TypedDict):
+    name: str
+    result: EndpointResult
+    budget: EndpointBudget | None
+    baseline: EndpointResult | None
+    over_budget: list[str]
+
+
+class _Request(NamedTuple):
+    method: Literal["get", "post"]
+    path: str
+    data: dict[str, Any] | None
+    user: User | None
+
+
+class _Endpoint(NamedTuple):
+    name: str
+    # Called with the number of the request, so that each request can be different.
+    make_request: Callable[[int], _Request]
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> Budgets:
+    with path.open() as f:
+        return json.load(f)
+
+
+def _badge_request(badge: Badge, **data: Any) -> dict[str, Any]:
+    return {"mac_address": badge.mac_address, "badge_secret": badge.secret, **data}
+
+
+def _capture_proof(badge: Badge, location: Location, rng: random.Random) -> dict[str, Any]:
+    serial_number = location.hexpansion.serial_number.int
+    rand = rng.randbytes(32)
+    hmac = badge_response_calculation(
+        serial_number.to_bytes(9, "little"), rand, badge.mac_address, settings.HEXPANSION_ROOT_KEY
+    )
+    return {"sn": serial_number, "rand": rand.hex(), "hmac": hmac.hex()}
+
+
+def _create_endpoints(repeat: int, rng: random.Random) -> list[_Endpoint]:
+    # The player with the most captures has the most to show on their pages.
+    player = User.objects.filter(is_superuser=False).order_by("-user_score__current_score", "id").first()
+    assert player is not None, "The dataset must have at least one player"
+    badge = player.badges.get()
+
+    leaderboard = Leaderboard.objects.create(display_name="Benchmark", owner=player, created_by=player)
+    members = User.objects.filter(is_superuser=False).exclude(pk=player.pk).order_by("id")[:99]
+    leaderboard.members.set([player, *members])
+
+    endpoints = [
+        _Endpoint(
+            "badge_player",
+            lambda _: _Request("post", reverse("api:badge-player"), _badge_request(badge), None),
+        ),
+        _Endpoint(
+            "badge_otp",
+            lambda _: _Request("post", reverse("api:badge-otp"), _badge_request(badge), None),
+        ),
+        _Endpoint("global_scoreboard", lambda _: _Request("get", reverse("quest:home"), None, None)),
+        _Endpoint(
+            "global_scoreboard_api", lambda _: _Request("get", reverse("api:quest_global_scoreboard"), None, None)
+        ),
+        _Endpoint("global_recent_activity", lambda _: _Request("get", reverse("quest:recent_activity"), None, player)),
+        _Endpoint("locations_list", lambda _: _Request("get", reverse("api:locations-list"), None, player)),
+        _Endpoint("locations_geojson", lambda _: _Request("get", reverse("api:locations-geojson"), None, player)),
+        _Endpoint("player_finds", lambda _: _Request("get", reverse("quest:profile"), None, player)),
+        _Endpoint(
+            "leaderboard_detail",
+            lambda _: _Request("get", reverse("quest:leaderboard_detail", args=[leaderboard.id]), None, player),
+        ),
+    ]
+
+    # The HMAC for a capture can only be calculated if the root key is known.
+    if hasattr(settings, "HEXPANSION_ROOT_KEY"):
+        # Each capture is made by a new player, so that it is not a repeat. Two more are needed for the warm up and
+        # the memory measurement.
+        # A location in one group is captured, as the progress towards the group is also updated.
+        locations = Location.objects.select_related("hexpansion").annotate(group_count=Count("groups"))
+        location = locations.order_by(Abs(F("group_count") - 1), "bit_index").first()
+        assert location is not None, "The dataset must have at least one location"
+        users = User.objects.bulk_create(
+            User(username=f"benchmark-capture-{i}", display_name=f"benchmark capture {i}") for i in range(repeat + 2)
+        )
+        # Each capture moves its player on the scoreboard, as for a player that registered with their badge.
+        add_user_scores(users)
+        add_scoreboard_entries(users)
+        badges = Badge.objects.bulk_create(
+            Badge(mac_address=f"0E-00-00-00-00-{i:02X}", secret=rng.randbytes(32).hex(), user=user)
+            for i, user in enumerate(users)
+        )
+        endpoints.insert(
+            2,
+            _Endpoint(
+                "badge_capture",
+                lambda i: _Request(
+                    "post",
+                    reverse("api:badge-capture"),
+                    _badge_request(
+                        badges[i],
+                        capture=_capture_proof(badges[i], location, rng),
+                        app_rev="0.0.0",
+                        fw_rev="0.0.0",
+                    ),
+                    None,
+                ),
+            ),
+        )
+
+    return endpoints
+
+
+@contextmanager
+def _run_on_commit_callbacks() -> Iterator[None]:
+    """Run the on_commit callbacks registered inside the block, as if its writes had been committed."""
+    start_count = len(connection.run_on_commit)
+    yield
+    # Callbacks may register more callbacks, which are run in turn.
+    while (callback_count := len(connection.run_on_commit)) > start_count:
+        for _, callback, robust in connection.run_on_commit[start_count:]:  # type: ignore[misc]
+            if not robust:
+                callback()
+                continue
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error calling %s in on_commit()", callback)
+        start_count = callback_count
+
+
+def _send(client: Client, request: _Request) -> int:
+    with _run_on_commit_callbacks():
+        if request.method == "post":
+            response = client.post(request.path, request.data, content_type="application/json", secure=True)
+        else:
+            response = client.get(request.path, secure=True)
+    return response.status_code
+
+
+def _benchmark_endpoint(endpoint: _Endpoint, repeat: int) -> EndpointResult:
+    client = Client(REMOTE_ADDR=CLIENT_REMOTE_ADDR)
+    requests = [endpoint.make_request(i) for i in range(repeat + 2)]
+    if user := requests[0].user:
+        client.force_login(user)
+
+    # The first request fills any caches, so that the measurements are of a warm server.
+    _send(client, requests[0])
+
+    queries: list[int] = []
+    durations: list[float] = []
+    status_codes: set[int] = set()
+    for request in requests[1:-1]:
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            status_codes.add(_send(client, request))
+            durations.append((time.perf_counter() - start) * 1000)
+        queries.append(len(ctx.captured_queries))
+
+    # Tracing allocations slows every request down, so memory is measured by a separate request.
+    tracemalloc.start()
+    try:
+        status_codes.add(_send(client, requests[-1]))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return EndpointResult(
+        name=endpoint.name,
+        status_code=max(status_codes),
+        queries=max(queries),
+        time_ms=statistics.median(durations),
+        max_time_ms=max(durations),
+        memory_kib=peak / 1024,
+    )
+
+
+def benchmark_endpoints(
+    *,
+    dataset: DatasetSize,
+    repeat: int = 5,
+    seed: int = 0,
+    on_result: Callable[[EndpointResult], None] | None = None,
+) -> list[EndpointResult]:
+    """
+    Generate a dataset and benchmark each endpoint on it.
+
+    Everything is rolled back afterwards, and the cached data for the players that made requests is discarded.
+    """
+    assert repeat > 0, "Each endpoint must be requested at least once"
+    rng = random.Random(seed)  # noqa: S311
+    results = []
+    with transaction.atomic():
+        generate_dataset(**dataset, seed=seed)
+        endpoints = _create_endpoints(repeat, rng)
+        players = list(User.objects.filter(is_superuser=False).prefetch_related("badges"))
+        location_ids = list(Location.objects.values_list("id", flat=True))
+
+        for endpoint in endpoints:
+            result = _benchmark_endpoint(endpoint, repeat)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+
+        for player in players:
+            invalidate_found_locations(player.id)
+            invalidate_api_token(player.id)
+            invalidate_badge_credentials(*[badge.mac_address for badge in player.badges.all()])
+        invalidate_location_features(*location_ids)
+        transaction.set_rollback(True)
+
+    # The map of hexpansions was built from the generated locations, which have now been rolled back.
+    invalidate_hexpansion_lookup()
+
+    return results
+
+
+def compare_results(
+    results: list[EndpointResult], budgets: Budgets, baseline: list[EndpointResult] | None = None
+) -> list[BudgetComparison]:
+    """Compare each result against its budget, and the result for the same endpoint in a baseline if given."""
+    baseline_results = {result["name"]: result for result in baseline or []}
+    comparisons = []
+    for result in results:
+        budget = budgets["endpoints"].get(result["name"])
+        over_budget = []
+        if budget is not None:
+            over_budget = [
+                metric
+                for metric in ("queries", "time_ms", "memory_kib")
+                if result[metric] > budget[metric]  # type: ignore[literal-required]
+            ]
+        comparisons.append(
+            BudgetComparison(
+                name=result["name"],
+                result=result,
+                budget=budget,
+                baseline=baseline_results.get(result["name"]),
+                over_budget=over_budget,
+            )
+        )
+    return comparisons
@@ -0,0 +1,328 @@
+"""
+Simulate a fleet of badges using the badge API, for load testing.
+
+Each simulated badge arrives at a time given by the arrival curve, registers with the player endpoint, fetches an OTP
+and then submits captures of random locations. Some captures are repeats of a location that the badge has already
+captured, as happens when a player scans a hexpansion twice. The HMAC for each capture is calculated from the root key
+in the same way as a real badge, so the whole capture path is exercised.
+
+The badges either make requests to a running server over HTTP, or to this process with the Django test client. The
+hexpansions to capture are read from the database, so a remote server must use the same database or a copy of it.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, NamedTuple, Protocol, TypedDict
+
+import requests
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+
+from gchqnet.hexpansion.crypto import badge_response_calculation
+from gchqnet.hexpansion.models import Hexpansion
+
+ArrivalCurve = Literal["instant", "linear", "opening"]
+
+BADGE_ENDPOINTS = ["player", "otp", "capture"]
+APP_REV = "fleet-simulator"
+FW_REV = "0.0.0"
+
+
+class FleetRequest(NamedTuple):
+    endpoint: str
+    status_code: int
+    latency: float
+    error: str | None
+
+
+class EndpointStats(TypedDict):
+    requests: int
+    errors: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class FleetReport(TypedDict):
+    badges: int
+    requests: int
+    errors: int
+    captures: int
+    repeat_captures: int
+    elapsed: float
+    throughput: float
+    endpoints: dict[str, EndpointStats]
+    error_breakdown: dict[str, int]
+
+
+class _Transport(Protocol):
+    def post(self, endpoint: str, data: dict[str, Any]) -> tuple[int, Any]: ...
+
+
+class HTTPTransport:
+    """Make requests to a running server, with a session for each thread so that connections are reused."""
+
+    def __init__(self, base_url: str, *, timeout: float) -> None:
+        base_url = base_url.rstrip("/")
+        self._urls = {endpoint: f"{base_url}{reverse(f'api:badge-{endpoint}')}" for endpoint in BADGE_ENDPOINTS}
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def post(self, endpoint: str, data: dict[str, Any]) -> tuple[int, Any]:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        response = self._local.session.post(self._urls[endpoint], json=data, timeout=self._timeout)
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, None
+
+
+class InProcessTransport:
+    """
+    Make requests to this process with the Django test client, with a client for each thread.
+
+    Exceptions in a view are reported as a server error, as they would be by a running server.
+    """
+
+    def __init__(self) -> None:
+        self._paths = {endpoint: reverse(f"api:badge-{endpoint}") for endpoint in BADGE_ENDPOINTS}
+        self._local = threading.local()
+
+    def post(self, endpoint: str, data: dict[str, Any]) -> tuple[int, Any]:
+        if not hasattr(self._local, "client"):
+            self._local.client = Client(raise_request_exception=False)
+        response = self._local.client.post(self._paths[endpoint], data, content_type="application/json", secure=True)
+        if not response.get("Content-Type", "").startswith("application/json"):
+            return response.status_code, None
+        return response.status_code, response.json()
+
+
+class _Badge(NamedTuple):
+    mac_address: str
+    secret: str
+    arrival: float
+    seed: int
+
+
+def _mac_address(index: int) -> str:
+    # Locally administered addresses, so that they do not clash with real or generated badges.
+    return "-".join(f"{byte:02X}" for byte in (0x060000000000 + index).to_bytes(6, "big"))
+
+
+def arrival_times(count: int, curve: ArrivalCurve, ramp: float) -> list[float]:
+    """
+    Get the number of seconds after the start at which each badge arrives.
+
+    With the opening curve, badges arrive at a rate that falls steadily to zero at the end of the ramp, as when the
+    gates open and players turn their badges on.
+    """
+    if curve == "instant" or ramp <= 0:
+        return [0.0] * count
+    quantiles = [i / count for i in range(count)]
+    if curve == "linear":
+        return [ramp * q for q in quantiles]
+    return [ramp * (1 - math.sqrt(1 - q)) for q in quantiles]
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    """Get a percentile of some sorted values, by the nearest rank."""
+    if not sorted_values:
+        return 0
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def _error_message(status_code: int, body: Any) -> str | None:
+    if isinstance(body, dict) and body.get("result") == "fail":
+        return str(body.get("message"))
+    if 200 <= status_code < 300:
+        return None
+    if isinstance(body, dict) and "detail" in body:
+        return str(body["detail"])
+    return "Unexpected response"
+
+
+class _Session:
+    """The requests made by one badge, from registering to its last capture."""
+
+    def __init__(
+        self,
+        badge: _Badge,
+        transport: _Transport,
+        *,
+        hexpansions: list[tuple[int, bytes]],
+        root_key: bytes | bytearray,
+        captures: int,
+        repeat_ratio: float,
+        think_time: float,
+    ) -> None:
+        self.badge = badge
+        self.transport = transport
+        self.hexpansions = hexpansions
+        self.root_key = root_key
+        self.captures = captures
+        self.repeat_ratio = repeat_ratio
+        self.think_time = think_time
+        self.rng = random.Random(badge.seed)  # noqa: S311
+        self.results: list[FleetRequest] = []
+        self.repeat_captures = 0
+
+    def _request(self, endpoint: str, data: dict[str, Any]) -> bool:
+        request = {"mac_address": self.badge.mac_address, "badge_secret": self.badge.secret, **data}
+        start = time.perf_counter()
+        try:
+            status_code, body = self.transport.post(endpoint, request)
+            error = _error_message(status_code, body)
+        except requests.RequestException as e:
+            status_code, error = 0, type(e).__name__
+        self.results.append(FleetRequest(endpoint, status_code, time.perf_counter() - start, error))
+        return error is None
+
+    def _capture_proof(self, serial_number: int, atsha_serial: bytes) -> dict[str, Any]:
+        rand = self.rng.randbytes(32)
+        hmac = badge_response_calculation(atsha_serial, rand, self.badge.mac_address, self.root_key)
+        return {"sn": serial_number, "rand": rand.hex(), "hmac": hmac.hex()}
+
+    def run(self) -> None:
+        if not self._request("player", {}) or not self._request("otp", {}):
+            return
+
+        captured: list[tuple[int, bytes]] = []
+        uncaptured = self.rng.sample(self.hexpansions, len(self.hexpansions))
+        for _ in range(self.captures):
+            if captured and (not uncaptured or self.rng.random() < self.repeat_ratio):
+                hexpansion = self.rng.choice(captured)
+                self.repeat_captures += 1
+            else:
+                hexpansion = uncaptured.pop()
+                captured.append(hexpansion)
+
+            if self.think_time:
+                time.sleep(self.rng.expovariate(1 / self.think_time))
+            self._request(
+                "capture", {"capture": self._capture_proof(*hexpansion), "app_rev": APP_REV, "fw_rev": FW_REV}
+            )
+
+
+def _summarise(sessions: list[_Session], elapsed: float) -> FleetReport:
+    results = [result for session in sessions for result in session.results]
+    endpoints = {}
+    for endpoint in BADGE_ENDPOINTS:
+        latencies = sorted(result.latency * 1000 for result in results if result.endpoint == endpoint)
+        endpoints[endpoint] = EndpointStats(
+            requests=len(latencies),
+            errors=sum(1 for result in results if result.endpoint == endpoint and result.error is not None),
+            p50_ms=_percentile(latencies, 50),
+            p90_ms=_percentile(latencies, 90),
+            p99_ms=_percentile(latencies, 99),
+            max_ms=latencies[-1] if latencies else 0,
+        )
+
+    errors = Counter(
+        f"{result.endpoint} {result.status_code}: {result.error}" for result in results if result.error is not None
+    )
+    return FleetReport(
+        badges=len(sessions),
+        requests=len(results),
+        errors=errors.total(),
+        captures=endpoints["capture"]["requests"],
+        repeat_captures=sum(session.repeat_captures for session in sessions),
+        elapsed=elapsed,
+        throughput=len(results) / elapsed if elapsed else 0,
+        endpoints=endpoints,
+        error_breakdown=dict(errors.most_common()),
+    )
+
+
+def simulate_fleet(
+    *,
+    badges: int,
+    root_key: bytes | bytearray,
+    base_url: str | None = None,
+    concurrency: int = 10,
+    captures: int = 5,
+    repeat_ratio: float = 0.1,
+    arrival_curve: ArrivalCurve = "linear",
+    ramp: float = 0,
+    think_time: float = 0,
+    timeout: float = 10,
+    first_badge: int = 0,
+    seed: int = 0,
+    on_progress: Callable[[int], None] | None = None,
+) -> FleetReport:
+    """
+    Simulate some badges registering and capturing locations, and report how the server coped.
+
+    The badges are run by a pool of threads, each badge waiting for its arrival time. With a concurrency of one the
+    badges are run in this thread, which is needed to make requests in process inside a test's transaction.
+    """
+    hexpansions = [
+        (serial_number.int, serial_number.int.to_bytes(9, "little"))
+        for serial_number in Hexpansion.objects.filter(location__isnull=False).values_list("serial_number", flat=True)
+    ]
+    if not hexpansions:
+        raise ValueError("There are no hexpansions installed at a location to capture")
+
+    rng = random.Random(seed)  # noqa: S311
+    transport: _Transport = InProcessTransport()
+    if base_url is not None:
+        transport = HTTPTransport(base_url, timeout=timeout)
+    fleet = [
+        _Badge(_mac_address(first_badge + i), rng.randbytes(32).hex(), arrival, rng.getrandbits(64))
+        for i, arrival in enumerate(arrival_times(badges, arrival_curve, ramp))
+    ]
+    sessions = [
+        _Session(
+            badge,
+            transport,
+            hexpansions=hexpansions,
+            root_key=root_key,
+            captures=captures,
+            repeat_ratio=repeat_ratio,
+            think_time=think_time,
+        )
+        for badge in fleet
+    ]
+
+    start = time.perf_counter()
+    finished = 0
+    finished_lock = threading.Lock()
+
+    def run(session: _Session) -> None:
+        nonlocal finished
+        if (delay := session.badge.arrival - (time.perf_counter() - start)) > 0:
+            time.sleep(delay)
+        session.run()
+        with finished_lock:
+            finished += 1
+            if on_progress is not None:
+                on_progress(finished)
+
+    if concurrency == 1:
+        for session in sessions:
+            run(session)
+    else:
+
+        def run_in_thread(session: _Session) -> None:
+            try:
+                run(session)
+            finally:
+                # In process, each thread has its own database connection.
+                connections.close_all()
+
+        # The sessions are started in order of arrival, as the pool takes them in the order they were submitted.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(run_in_thread, session) for session in sessions]:
+                future.result()
+
+    return _summarise(sessions, time.perf_counter() - start)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from gchqnet.quest.repository import backfill_activity_feed
+
+
+class Command(BaseCommand):
+    help = "Repopulate the global recent activity feed from the most recent activity events"  # noqa: A003
+
+    def handle(
+        self,
+        *,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        count = backfill_activity_feed()
+        self.stdout.write(f"Added {count} entries to the activity feed")
@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from gchqnet.quest.endpoint_benchmarks import (
+    BUDGETS_PATH,
+    BudgetComparison,
+    EndpointResult,
+    benchmark_endpoints,
+    compare_results,
+    load_budgets,
+)
+
+METRICS = [("queries", "queries", "{:.0f}"), ("time_ms", "ms", "{:.1f}"), ("memory_kib", "KiB", "{:.0f}")]
+
+
+class Command(BaseCommand):
+    help = "Measure the queries, time and memory of the busiest endpoints, and compare them against budgets"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=5, help="Number of measured requests to each endpoint")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH, help="Budgets file, with the dataset size")
+        parser.add_argument("--baseline", type=Path, help="Compare against results saved by --save-baseline")
+        parser.add_argument("--save-baseline", type=Path, help="Save the results, to compare against later")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if any endpoint is over its query budget, or an endpoint with a budget was not benchmarked",
+        )
+
+    def handle(
+        self,
+        *,
+        repeat: int,
+        seed: int,
+        budgets: Path,
+        baseline: Path | None,
+        save_baseline: Path | None,
+        check: bool,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        if repeat < 1:
+            raise CommandError("--repeat must be at least 1")
+        endpoint_budgets = load_budgets(budgets)
+        baseline_results: list[EndpointResult] | None = None
+        if baseline is not None:
+            baseline_results = json.loads(baseline.read_text())
+
+        dataset = endpoint_budgets["dataset"]
+        self.stdout.write(
+            f"Generating {dataset['users']} players, {dataset['locations']} locations, "
+            f"{dataset['groups']} groups and {dataset['captures']} captures"
+        )
+        results = benchmark_endpoints(dataset=dataset, repeat=repeat, seed=seed)
+        comparisons = compare_results(results, endpoint_budgets, baseline_results)
+
+        for comparison in comparisons:
+            self.stdout.write(self._format_comparison(comparison))
+
+        if save_baseline is not None:
+            save_baseline.write_text(json.dumps(results, indent=2) + "\n")
+            self.stdout.write(f"Saved the results to {save_baseline}")
+
+        over_budget = [comparison for comparison in comparisons if comparison["over_budget"]]
+        if over_budget:
+            self.stdout.write(self.style.WARNING(f"{len(over_budget)} endpoints are over budget"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All endpoints are within budget"))
+
+        # Captures can only be benchmarked if the hexpansion root key is set.
+        benchmarked = {result["name"] for result in results}
+        if missing := [name for name in endpoint_budgets["endpoints"] if name not in benchmarked]:
+            self.stdout.write(self.style.WARNING(f"Not benchmarked: {', '.join(missing)}"))
+
+        # Time and memory depend on the machine, so only the number of queries fails the check.
+        if check and (failed := [c["name"] for c in over_budget if "queries" in c["over_budget"]]):
+            raise CommandError(f"Over the query budget: {', '.join(failed)}")
+        if check and missing:
+            raise CommandError(f"Not benchmarked: {', '.join(missing)}")
+
+    def _format_comparison(self, comparison: BudgetComparison) -> str:
+        result = comparison["result"]
+        columns = [f"{comparison['name']:>24} {result['status_code']}"]
+        for metric, unit, number_format in METRICS:
+            value = result[metric]  # type: ignore[literal-required]
+            column = f"{number_format.format(value):>7} {unit}"
+            if comparison["budget"] is not None:
+                column += f" / {number_format.format(comparison['budget'][metric])}"  # type: ignore[literal-required]
+            if comparison["baseline"] is not None:
+                column += f" ({value - comparison['baseline'][metric]:+.0f})"  # type: ignore[literal-required]
+            if metric in comparison["over_budget"]:
+                column = self.style.ERROR(column)
+            columns.append(column)
+        return "  ".join(columns)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from gchqnet.quest.benchmarks import benchmark_geojson
+
+
+class Command(BaseCommand):
+    help = "Compare the speed of rendering locations as GeoJSON against the original implementation"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--locations", type=int, default=3000, help="Number of locations to create")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(
+        self,
+        *,
+        locations: int,
+        seed: int,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        results = benchmark_geojson(locations=locations, seed=seed)
+        baseline = results[0]["duration"]
+
+        for result in results:
+            self.stdout.write(
+                f"{result['name']:>10}: {result['duration'] * 1000:8.1f}ms "
+                f"{result['queries']:6} queries {baseline / result['duration']:6.2f}x"
+            )
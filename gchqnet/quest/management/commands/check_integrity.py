@@ -1,23 +1,37 @@
-from django.core.management.base import BaseCommand
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
 from sentry_sdk.crons import monitor
 
-from gchqnet.accounts.models.user import User
-from gchqnet.achievements.models import (
-    BasicAchievementEvent,
-    FirstToCaptureAchievementEvent,
-    LocationGroupAchievementEvent,
-)
-from gchqnet.quest.models import CaptureEvent, ScoreRecord
-from gchqnet.quest.repository import update_score_for_user
+from gchqnet.quest.repository.integrity import INTEGRITY_CHUNK_SIZE, IntegrityCheckResult, check_integrity
 
 
 class Command(BaseCommand):
     help = "Check data integrity"  # noqa: A003
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--dry-run", action="store_true", help="Report the issues without fixing them")
+        parser.add_argument("--chunk-size", type=int, default=INTEGRITY_CHUNK_SIZE)
+
+    def _report(self, result: IntegrityCheckResult, *, dry_run: bool, verbosity: int) -> None:
+        if not result["found"]:
+            if verbosity > 1:
+                self.stdout.write(f"{result['description']}: none ({result['elapsed']:.2f}s)")
+            return
+
+        action = "not fixed" if dry_run else f"{result['fixed']} fixed"
+        self.stdout.write(f"{result['description']}: {result['found']} found, {action} ({result['elapsed']:.2f}s)")
+        for line in result["sample"]:
+            self.stdout.write(f"  {line}")
+        if result["found"] > len(result["sample"]):
+            self.stdout.write(f"  and {result['found'] - len(result['sample'])} more")
+
     @monitor(monitor_slug="check-integrity")
     def handle(
         self,
         *,
+        dry_run: bool,
+        chunk_size: int,
         verbosity: int,
         settings: str,
         pythonpath: str,
@@ -26,73 +40,13 @@ class Command(BaseCommand):
         force_color: bool,
         skip_checks: bool,
     ) -> None:
-        # Capture Events
-        capture_events = CaptureEvent.objects.prefetch_related("location").select_related(
-            "raw_capture_event__badge", "score_record"
+        start = time.perf_counter()
+        results = check_integrity(
+            dry_run=dry_run,
+            chunk_size=chunk_size,
+            on_result=lambda result: self._report(result, dry_run=dry_run, verbosity=verbosity),
         )
+        found = sum(result["found"] for result in results)
+        self.stdout.write(f"Found {found} issues in {len(results)} checks")
 
-        for ce in capture_events:
-            if ce.raw_capture_event.badge.user_id != ce.created_by_id:
-                self.stdout.write(f"Issue found with {ce} created_by")
-                ce.created_by_id = ce.raw_capture_event.badge.user_id
-                ce.save(update_fields=["created_by_id"])
-
-            try:
-                score_record = ce.score_record
-            except ScoreRecord.DoesNotExist:
-                self.stdout.write(f"Missing score record for {ce}. Fixing.")
-                ScoreRecord.objects.create(user=ce.created_by, capture_event=ce, score=ce.location.difficulty)
-            else:
-                if ce.location.difficulty != score_record.score:
-                    self.stdout.write(f"Issue found with {ce} score")
-                    score_record.score = ce.location.difficulty
-                    score_record.save(update_fields=["score"])
-
-        self.stdout.write(f"Checked {len(capture_events)} capture events")
-
-        for bae in BasicAchievementEvent.objects.all():
-            try:
-                score_record = bae.score_record
-            except ScoreRecord.DoesNotExist:
-                self.stdout.write(f"Missing score record for {bae}. Fixing.")
-                ScoreRecord.objects.create(
-                    user=ce.created_by, basic_achievement_event=bae, score=bae.basic_achievement.difficulty
-                )
-            else:
-                if bae.basic_achievement.difficulty != score_record.score:
-                    self.stdout.write(f"Issue found with {bae} score")
-                    score_record.score = bae.basic_achievement.difficulty
-                    score_record.save(update_fields=["score"])
-
-        for fcae in FirstToCaptureAchievementEvent.objects.all():
-            try:
-                score_record = fcae.score_record
-            except ScoreRecord.DoesNotExist:
-                self.stdout.write(f"Missing score record for {fcae}. Fixing.")
-                ScoreRecord.objects.create(user=ce.created_by, first_capture_event=fcae, score=fcae.location.difficulty)
-            else:
-                if fcae.location.difficulty != score_record.score:
-                    self.stdout.write(f"Issue found with {fcae} score")
-                    score_record.score = fcae.location.difficulty
-                    score_record.save(update_fields=["score"])
-
-        for lgae in LocationGroupAchievementEvent.objects.all():
-            try:
-                score_record = lgae.score_record
-            except ScoreRecord.DoesNotExist:
-                self.stdout.write(f"Missing score record for {lgae}. Fixing.")
-                ScoreRecord.objects.create(
-                    user=ce.created_by,
-                    location_group_achievement_event=lgae,
-                    score=lgae.location_group.difficulty,
-                )
-            else:
-                if lgae.location_group.difficulty != score_record.score:
-                    self.stdout.write(f"Issue found with {lgae} score")
-                    score_record.score = lgae.location_group.difficulty
-                    score_record.save(update_fields=["score"])
-
-        for user in User.objects.all():
-            update_score_for_user(user)
-
-        self.stdout.write("Bumped scores for users")
+        self.stdout.write(f"Finished in {time.perf_counter() - start:.2f}s")
@@ -1,26 +1,50 @@
 import os
-import random
-import sys
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
 
-from gchqnet.accounts.factories import BadgeFactory
-from gchqnet.accounts.models.user import User
-from gchqnet.achievements.models import BasicAchievementEvent, FirstToCaptureAchievementEvent, LocationGroup
-from gchqnet.hexpansion.models import Hexpansion
-from gchqnet.quest.factories import LocationFactory
-from gchqnet.quest.models import CaptureEvent, Location, RawCaptureEvent
-from gchqnet.quest.models.captures import CaptureLog
-from gchqnet.quest.repository import update_score_for_user
-from gchqnet.quest.repository.captures import record_attempted_capture
+from gchqnet.quest.synthetic import DEFAULT_CHUNK_SIZE, DatasetStats, TimeProfile, delete_dataset, generate_dataset
 
 
 class Command(BaseCommand):
     help = "Generate fake data"  # noqa: A003
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=500)
+        parser.add_argument("--locations", type=int, default=100)
+        parser.add_argument("--groups", type=int, default=10)
+        parser.add_argument("--captures", type=int, default=12500, help="The approximate number of captures")
+        parser.add_argument(
+            "--profile",
+            choices=["uniform", "daily", "opening"],
+            default="daily",
+            help="How the captures are spread over the event",
+        )
+        parser.add_argument("--days", type=int, default=4, help="The length of the event, which ends now")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Players per chunk")
+        parser.add_argument(
+            "--noinput", "--no-input", action="store_false", dest="interactive", help="Do not ask for confirmation"
+        )
+
+    def _report(self, stats: DatasetStats) -> None:
+        self.stdout.write(
+            f"Created {stats['users']} players with {stats['captures']} captures, "
+            f"{stats['group_completions']} group completions and {stats['notifications']} notifications "
+            f"({stats['rate']:.0f} captures/s)"
+        )
+
     def handle(
         self,
         *,
+        users: int,
+        locations: int,
+        groups: int,
+        captures: int,
+        profile: TimeProfile,
+        days: int,
+        seed: int,
+        chunk_size: int,
+        interactive: bool,
         verbosity: int,
         settings: str,
         pythonpath: str,
@@ -33,47 +57,25 @@ class Command(BaseCommand):
             self.stdout.write("Data generation is disabled. Please set GCHQ_ENABLE_DATA_GENERATION=true env var.")
             return
 
-        if not input("Please type 1449 as written: ") == "one thousand four hundred and forty nine":
+        if interactive and not input("Please type 1449 as written: ") == "one thousand four hundred and forty nine":
             self.stdout.write("Nope")
             return
 
-        FirstToCaptureAchievementEvent.objects.all().delete()
-        BasicAchievementEvent.objects.all().delete()
-        CaptureEvent.objects.all().delete()
-        CaptureLog.objects.all().delete()
-        RawCaptureEvent.objects.all().delete()
-        Location.objects.all().delete()
-        Hexpansion.objects.all().delete()
-        User.objects.filter(is_superuser=False).delete()
+        delete_dataset()
 
-        assert User.objects.filter(is_superuser=True).first() is not None
-
-        badges = BadgeFactory.create_batch(size=500)
-        locations = LocationFactory.create_batch(
-            size=100,
-            created_by=User.objects.filter(is_superuser=True).first(),
+        stats = generate_dataset(
+            users=users,
+            locations=locations,
+            groups=groups,
+            captures=captures,
+            profile=profile,
+            days=days,
+            seed=seed,
+            chunk_size=chunk_size,
+            on_progress=self._report if verbosity > 1 else None,
         )
 
-        for badge in badges:
-            sample = random.sample(locations, k=random.randint(0, len(locations)))  # noqa: S311
-            for location in sample:
-                for _ in range(random.randint(1, 3)):  # noqa: S311
-                    record_attempted_capture(
-                        badge,
-                        location.hexpansion,
-                        rand=int.to_bytes(1234567890, 32, sys.byteorder),
-                        hmac="a" * 64,
-                        app_rev="0.0.0",
-                        fw_rev="0.0.0",
-                    )
-
-            update_score_for_user(badge.user)
-
-        for i in range(10):
-            sample = random.sample(list(Location.objects.all()), k=random.randint(3, 8))  # noqa: S311
-            group = LocationGroup.objects.create(
-                display_name=f"Group {i}", difficulty=15, created_by=User.objects.filter(is_superuser=True).first()
-            )
-            group.locations.set(sample)
-
-        self.stdout.write("Generated fake data")
+        self._report(stats)
+        self.stdout.write(
+            f"Generated {stats['locations']} locations and {stats['groups']} groups in {stats['elapsed']:.1f}s"
+        )
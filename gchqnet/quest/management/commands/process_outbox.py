@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from gchqnet.quest.repository.outbox import process_outbox
+
+
+class Command(BaseCommand):
+    help = "Process deferred side effects from the outbox"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait when the outbox is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the outbox and then exit")
+
+    def handle(
+        self,
+        *,
+        batch_size: int,
+        interval: float,
+        once: bool,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        while True:
+            processed = process_outbox(batch_size=batch_size)
+            if processed and verbosity > 1:
+                self.stdout.write(f"Processed {processed} outbox tasks")
+
+            if processed < batch_size:
+                if once:
+                    return
+                time.sleep(interval)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from gchqnet.quest.repository import rebuild_scoreboard
+
+
+class Command(BaseCommand):
+    help = "Recalculate the global scoreboard from user scores and repopulate the scoreboard backend"  # noqa: A003
+
+    def handle(
+        self,
+        *,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        count = rebuild_scoreboard()
+        self.stdout.write(f"Rebuilt {count} scoreboard entries")
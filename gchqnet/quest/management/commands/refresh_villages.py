@@ -0,0 +1,49 @@
+import time
+
+import requests
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from gchqnet.quest.villages import refresh_villages
+
+
+class Command(BaseCommand):
+    help = "Fetch the villages shown on the maps from the EMF website"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep refreshing the villages every INTERVAL seconds, rather than refreshing them once",
+        )
+
+    def _refresh(self) -> bool:
+        try:
+            entry = refresh_villages()
+        except (requests.RequestException, ValueError) as e:
+            self.stderr.write(f"Unable to refresh the villages: {e}")
+            return False
+
+        self.stdout.write(f"Refreshed {len(entry['data'].get('features', []))} villages")
+        return True
+
+    def handle(
+        self,
+        *,
+        interval: float | None,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        if interval is None:
+            if not self._refresh():
+                raise CommandError("The villages were not refreshed")
+            return
+
+        while True:
+            self._refresh()
+            time.sleep(interval)
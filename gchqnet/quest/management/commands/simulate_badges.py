@@ -0,0 +1,115 @@
+from typing import get_args
+
+from django.conf import settings as django_settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from gchqnet.quest.fleet import BADGE_ENDPOINTS, ArrivalCurve, simulate_fleet
+
+
+class Command(BaseCommand):
+    help = "Simulate badges registering and capturing locations, to load test the badge API"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--badges", type=int, default=100, help="Number of badges to simulate")
+        parser.add_argument(
+            "--url",
+            help="Base URL of a running server, such as http://localhost:8000, rather than making requests in process",
+        )
+        parser.add_argument("--concurrency", type=int, default=10, help="Number of badges making requests at once")
+        parser.add_argument("--captures", type=int, default=5, help="Number of captures made by each badge")
+        parser.add_argument(
+            "--repeat-ratio", type=float, default=0.1, help="Proportion of captures of an already captured location"
+        )
+        parser.add_argument("--arrival", choices=get_args(ArrivalCurve), default="linear", help="Arrival curve")
+        parser.add_argument("--ramp", type=float, default=0, help="Seconds over which the badges arrive")
+        parser.add_argument("--think-time", type=float, default=0, help="Mean seconds between captures by a badge")
+        parser.add_argument("--timeout", type=float, default=10, help="Timeout in seconds for requests to --url")
+        parser.add_argument("--root-key", help="Hexpansion root key as hex, if it is not set in the settings")
+        parser.add_argument(
+            "--first-badge", type=int, default=0, help="Number of the first badge, to simulate new badges in each run"
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(
+        self,
+        *,
+        badges: int,
+        url: str | None,
+        concurrency: int,
+        captures: int,
+        repeat_ratio: float,
+        arrival: ArrivalCurve,
+        ramp: float,
+        think_time: float,
+        timeout: float,
+        root_key: str | None,
+        first_badge: int,
+        seed: int,
+        verbosity: int,
+        settings: str,
+        pythonpath: str,
+        traceback: bool,
+        no_color: bool,
+        force_color: bool,
+        skip_checks: bool,
+    ) -> None:
+        if badges < 1 or concurrency < 1 or captures < 0:
+            raise CommandError("--badges and --concurrency must be at least 1, and --captures must not be negative")
+        if not 0 <= repeat_ratio <= 1:
+            raise CommandError("--repeat-ratio must be between 0 and 1")
+
+        if root_key is not None:
+            try:
+                key = bytearray.fromhex(root_key)
+            except ValueError as e:
+                raise CommandError("--root-key must be hex") from e
+        elif hasattr(django_settings, "HEXPANSION_ROOT_KEY"):
+            key = django_settings.HEXPANSION_ROOT_KEY
+        else:
+            raise CommandError("The hexpansion root key must be set with HEXPANSION_ROOT_KEY or --root-key")
+
+        self.stdout.write(f"Simulating {badges} badges against {url or 'this process'}")
+        progress_interval = max(badges // 10, 1)
+
+        def on_progress(finished: int) -> None:
+            if verbosity > 1 and finished % progress_interval == 0:
+                self.stdout.write(f"{finished} of {badges} badges finished")
+
+        try:
+            report = simulate_fleet(
+                badges=badges,
+                root_key=key,
+                base_url=url,
+                concurrency=concurrency,
+                captures=captures,
+                repeat_ratio=repeat_ratio,
+                arrival_curve=arrival,
+                ramp=ramp,
+                think_time=think_time,
+                timeout=timeout,
+                first_badge=first_badge,
+                seed=seed,
+                on_progress=on_progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            f"{report['requests']} requests from {report['badges']} badges in {report['elapsed']:.1f}s "
+            f"({report['throughput']:.1f} requests/s), {report['captures']} captures of which "
+            f"{report['repeat_captures']} were repeats"
+        )
+        for endpoint in BADGE_ENDPOINTS:
+            stats = report["endpoints"][endpoint]
+            self.stdout.write(
+                f"{endpoint:>8}: {stats['requests']:6} requests {stats['errors']:6} errors  "
+                f"p50 {stats['p50_ms']:7.1f}ms  p90 {stats['p90_ms']:7.1f}ms  "
+                f"p99 {stats['p99_ms']:7.1f}ms  max {stats['max_ms']:7.1f}ms"
+            )
+
+        if report["errors"]:
+            self.stdout.write(self.style.WARNING(f"{report['errors']} requests failed:"))
+            for error, count in report["error_breakdown"].items():
+                self.stdout.write(f"{count:8} {error}")
+        else:
+            self.stdout.write(self.style.SUCCESS("No requests failed"))
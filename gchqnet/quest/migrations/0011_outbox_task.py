@@ -0,0 +1,51 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:40
+
+import uuid
+
+import django_prometheus.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0010_location_install_image"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxTask",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Database ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("capture_notification", "Capture Notification"),
+                            ("location_groups", "Location Groups"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("payload", models.JSONField(default=dict)),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ("created_at",),
+                "indexes": [models.Index(fields=["processed_at", "created_at"], name="outbox_task_pending_idx")],
+            },
+            bases=(django_prometheus.models.ExportModelOperationsMixin("outbox_task"), models.Model),
+        ),
+    ]
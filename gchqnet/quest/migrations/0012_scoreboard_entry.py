@@ -0,0 +1,90 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:47
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import django.db.models.deletion
+import django_prometheus.models
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_scoreboard(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    User = apps.get_model("accounts", "User")
+    ScoreboardEntry = apps.get_model("quest", "ScoreboardEntry")
+
+    users = User.objects.filter(is_superuser=False).annotate(
+        current_score=Coalesce(models.F("user_score__current_score"), models.Value(0)),
+        capture_count=models.Count("capture_events"),
+    )
+    scores = sorted({user.current_score for user in users}, reverse=True)
+    ranks = {score: rank for rank, score in enumerate(scores, start=1)}
+
+    ScoreboardEntry.objects.bulk_create(
+        [
+            ScoreboardEntry(
+                user=user,
+                username=user.username,
+                display_name=user.display_name,
+                current_score=user.current_score,
+                capture_count=user.capture_count,
+                rank=ranks[user.current_score],
+            )
+            for user in users
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0011_outbox_task"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoreboardEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Database ID",
+                    ),
+                ),
+                ("username", models.CharField(max_length=150)),
+                ("display_name", models.CharField(max_length=30)),
+                ("current_score", models.IntegerField(default=0)),
+                ("capture_count", models.IntegerField(default=0)),
+                ("rank", models.PositiveIntegerField(default=1)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scoreboard_entry",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("rank", "capture_count", "display_name"),
+                "indexes": [
+                    models.Index(fields=["rank", "capture_count", "display_name"], name="scoreboard_entry_rank_idx"),
+                    models.Index(fields=["current_score"], name="scoreboard_entry_score_idx"),
+                ],
+            },
+            bases=(django_prometheus.models.ExportModelOperationsMixin("scoreboard_entry"), models.Model),
+        ),
+        migrations.RunPython(populate_scoreboard, migrations.RunPython.noop, elidable=True),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 5.0.6 on 2026-10-18 18:26
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import django.db.models.deletion
+import django_prometheus.models
+from django.conf import settings
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_activity_events(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    ActivityEvent = apps.get_model("quest", "ActivityEvent")
+    ScoreRecord = apps.get_model("quest", "ScoreRecord")
+
+    score_records = ScoreRecord.objects.select_related(
+        "capture_event__location",
+        "basic_achievement_event__basic_achievement",
+        "first_capture_event__location",
+        "location_group_achievement_event__location_group",
+    )
+
+    batch = []
+    for score_record in score_records.iterator(chunk_size=1000):
+        if score_record.capture_event_id:
+            event, kind = score_record.capture_event, "capture"
+            location, target_name = event.location, event.location.display_name
+        elif score_record.basic_achievement_event_id:
+            event, kind = score_record.basic_achievement_event, "basic_achievement"
+            location, target_name = None, event.basic_achievement.display_name
+        elif score_record.first_capture_event_id:
+            event, kind = score_record.first_capture_event, "first_capture"
+            location, target_name = event.location, event.location.display_name
+        else:
+            event, kind = score_record.location_group_achievement_event, "location_group"
+            location, target_name = None, event.location_group.display_name
+
+        batch.append(
+            ActivityEvent(
+                user_id=score_record.user_id,
+                score_record=score_record,
+                type=kind,
+                location=location,
+                target_name=target_name,
+                difficulty=score_record.score,
+                created_at=event.created_at,
+            )
+        )
+        if len(batch) >= 1000:
+            ActivityEvent.objects.bulk_create(batch)
+            batch = []
+    ActivityEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0012_scoreboard_entry"),
+        ("achievements", "0007_add_description_to_basic"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityEvent",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Database ID",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("capture", "Capture"),
+                            ("basic_achievement", "Basic Achievement"),
+                            ("first_capture", "First Capture"),
+                            ("location_group", "Location Group"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("target_name", models.CharField(max_length=30)),
+                ("difficulty", models.IntegerField()),
+                ("created_at", models.DateTimeField()),
+                (
+                    "location",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="activity_events",
+                        to="quest.location",
+                    ),
+                ),
+                (
+                    "score_record",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_event",
+                        to="quest.scorerecord",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_events",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-created_at",),
+                "indexes": [
+                    models.Index(fields=["user", "-created_at"], name="activity_event_user_idx"),
+                    models.Index(fields=["-created_at"], name="activity_event_created_idx"),
+                ],
+            },
+            bases=(django_prometheus.models.ExportModelOperationsMixin("activity_event"), models.Model),
+        ),
+        migrations.RunPython(populate_activity_events, migrations.RunPython.noop, elidable=True),
+    ]
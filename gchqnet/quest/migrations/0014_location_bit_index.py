@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2026-10-18 19:02
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import migrations, models
+
+import gchqnet.quest.models.location
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_bit_indexes(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Location = apps.get_model("quest", "Location")
+
+    locations = list(Location.objects.order_by("created_at", "id"))
+    for bit_index, location in enumerate(locations, start=1):
+        location.bit_index = bit_index
+    Location.objects.bulk_update(locations, ["bit_index"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0013_activity_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="location",
+            name="bit_index",
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.RunPython(populate_bit_indexes, migrations.RunPython.noop, elidable=True),
+        migrations.AlterField(
+            model_name="location",
+            name="bit_index",
+            field=models.PositiveIntegerField(
+                default=gchqnet.quest.models.location.next_location_bit_index,
+                editable=False,
+                help_text="The position of the location in the sets of locations that each player has found.",
+                unique=True,
+                verbose_name="Bit index",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.6 on 2026-10-18 21:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0014_location_bit_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="scoreboardentry",
+            options={"ordering": ("-current_score", "capture_count", "display_name")},
+        ),
+        migrations.RemoveIndex(
+            model_name="scoreboardentry",
+            name="scoreboard_entry_rank_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="scoreboardentry",
+            name="scoreboard_entry_score_idx",
+        ),
+        migrations.RemoveField(
+            model_name="scoreboardentry",
+            name="rank",
+        ),
+        migrations.AddIndex(
+            model_name="scoreboardentry",
+            index=models.Index(
+                fields=["-current_score", "capture_count", "display_name"], name="scoreboard_entry_order_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.6 on 2026-10-18 21:40
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_user_scores(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    User = apps.get_model("accounts", "User")
+    UserScore = apps.get_model("quest", "UserScore")
+
+    users = User.objects.filter(user_score__isnull=True).annotate(
+        total=Coalesce(models.Sum("score_records__score"), models.Value(0))
+    )
+    UserScore.objects.bulk_create(
+        [UserScore(user_id=user.id, current_score=user.total) for user in users],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quest", "0015_scoreboard_entry_derived_rank"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_user_scores, migrations.RunPython.noop, elidable=True),
+    ]
@@ -1,16 +1,23 @@
+from .activity import ActivityEvent, ActivityEventKind
 from .captures import CaptureEvent, CaptureLog, RawCaptureEvent
 from .leaderboard import Leaderboard
 from .location import Coordinates, Location, LocationDifficulty
-from .scores import ScoreRecord, UserScore
+from .outbox import OutboxTask, OutboxTaskKind
+from .scores import ScoreboardEntry, ScoreRecord, UserScore
 
 __all__ = [
+    "ActivityEvent",
+    "ActivityEventKind",
     "CaptureEvent",
     "CaptureLog",
     "Coordinates",
     "Leaderboard",
     "Location",
     "LocationDifficulty",
+    "OutboxTask",
+    "OutboxTaskKind",
     "RawCaptureEvent",
+    "ScoreboardEntry",
     "ScoreRecord",
     "UserScore",
 ]
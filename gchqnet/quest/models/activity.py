@@ -0,0 +1,45 @@
+import uuid
+
+from django.db import models
+from django_prometheus.models import ExportModelOperationsMixin
+
+
+class ActivityEventKind(models.TextChoices):
+    CAPTURE = "capture"
+    BASIC_ACHIEVEMENT = "basic_achievement"
+    FIRST_CAPTURE = "first_capture"
+    LOCATION_GROUP = "location_group"
+
+
+class ActivityEvent(ExportModelOperationsMixin("activity_event"), models.Model):  # type: ignore[misc]
+    """
+    An entry in the recent activity feeds.
+
+    One is written for each score record, with a copy of the details needed to show it, so that a feed can be read
+    from this table alone. The location is only set for captures and first captures, and is used to decide whether
+    the target name can be shown to the current user.
+    """
+
+    id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey("accounts.User", on_delete=models.CASCADE, related_name="activity_events")
+    score_record = models.OneToOneField("quest.ScoreRecord", on_delete=models.CASCADE, related_name="activity_event")
+    type = models.CharField(max_length=20, choices=ActivityEventKind)  # noqa: A003
+    location = models.ForeignKey(
+        "quest.Location", on_delete=models.PROTECT, related_name="activity_events", null=True, blank=True
+    )
+    target_name = models.CharField(max_length=30)
+    difficulty = models.IntegerField()
+
+    # The time of the event, rather than the time that this entry was written.
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="activity_event_user_idx"),
+            models.Index(fields=["-created_at"], name="activity_event_created_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_type_display()} {self.target_name}"
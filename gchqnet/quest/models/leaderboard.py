@@ -9,7 +9,7 @@ from django_prometheus.models import ExportModelOperationsMixin
 from gchqnet.quest.repository import get_private_scoreboard
 
 if TYPE_CHECKING:  # pragma: nocover
-    from gchqnet.accounts.models import User
+    from gchqnet.quest.scoreboard_backends import ScoreboardRow
 
 
 class Leaderboard(ExportModelOperationsMixin("leaderboard"), models.Model):  # type: ignore[misc]
@@ -37,5 +37,5 @@ class Leaderboard(ExportModelOperationsMixin("leaderboard"), models.Model):  # t
         return self.display_name
 
     @property
-    def scores(self) -> models.QuerySet[User]:
+    def scores(self) -> list[ScoreboardRow]:
         return get_private_scoreboard(self)
@@ -5,7 +5,7 @@ from typing import Any
 from uuid import uuid4
 
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.deconstruct import deconstructible
 from django_prometheus.models import ExportModelOperationsMixin
 
@@ -27,6 +27,19 @@ class UploadToPathAndRename:
         return f"location_img/{filename}"
 
 
+BIT_INDEX_ATTEMPTS = 5
+
+
+def next_location_bit_index() -> int:
+    """
+    Get a bit index after those of every existing location.
+
+    The index of a deleted location may be reused, which is safe as a location cannot be deleted once it has been found.
+    Two locations created at once may get the same index, in which case Location.save picks another.
+    """
+    return (Location.objects.aggregate(max_index=models.Max("bit_index"))["max_index"] or 0) + 1
+
+
 class Location(ExportModelOperationsMixin("location"), models.Model):  # type: ignore[misc]
     id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
     display_name = models.CharField(
@@ -62,12 +75,35 @@ class Location(ExportModelOperationsMixin("location"), models.Model):  # type: i
     created_by = models.ForeignKey("accounts.User", on_delete=models.PROTECT, related_name="+")
     updated_at = models.DateTimeField(auto_now=True)
 
+    bit_index = models.PositiveIntegerField(
+        "Bit index",
+        help_text="The position of the location in the sets of locations that each player has found.",
+        unique=True,
+        editable=False,
+        default=next_location_bit_index,
+    )
+
     class Meta:
         ordering = ("internal_name", "display_name")
 
     def __str__(self) -> str:
         return self.internal_name or self.display_name
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        # The bit index is taken when the location is created, which may be before another location takes it.
+        for attempt in range(BIT_INDEX_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                bit_index_taken = Location.objects.filter(bit_index=self.bit_index).exists()
+                if attempt == BIT_INDEX_ATTEMPTS - 1 or not bit_index_taken:
+                    raise
+                self.bit_index = next_location_bit_index()
+
 
 class Coordinates(ExportModelOperationsMixin("coordinates"), models.Model):  # type: ignore[misc]
     id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
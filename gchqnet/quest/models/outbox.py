@@ -0,0 +1,40 @@
+import uuid
+
+from django.db import models
+from django_prometheus.models import ExportModelOperationsMixin
+
+
+class OutboxTaskKind(models.TextChoices):
+    CAPTURE_NOTIFICATION = "capture_notification"
+    LOCATION_GROUPS = "location_groups"
+
+
+class OutboxTask(ExportModelOperationsMixin("outbox_task"), models.Model):  # type: ignore[misc]
+    """
+    A side effect that has been deferred until after the request that caused it.
+
+    Tasks are written in the same transaction as the event that caused them and drained by ./manage.py process_outbox
+    """
+
+    MAX_ATTEMPTS = 5
+
+    id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
+
+    kind = models.CharField(max_length=30, choices=OutboxTaskKind)
+    payload = models.JSONField(default=dict)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("created_at",)
+        indexes = [
+            models.Index(fields=["processed_at", "created_at"], name="outbox_task_pending_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} task created at {self.created_at}"
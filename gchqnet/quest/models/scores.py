@@ -47,3 +47,30 @@ class UserScore(ExportModelOperationsMixin("user_score"), models.Model):  # type
 
     def __str__(self) -> str:
         return f"Current score for {self.user} is {self.current_score}"
+
+
+class ScoreboardEntry(ExportModelOperationsMixin("scoreboard_entry"), models.Model):  # type: ignore[misc]
+    """
+    The position of a player on the global scoreboard.
+
+    This is a materialised copy of the scoreboard that is updated incrementally as scores change.
+    The rank is not stored, as it is derived from current_score when the scoreboard is read.
+    Administrators do not have an entry.
+    """
+
+    id = models.UUIDField("Database ID", primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.OneToOneField("accounts.User", on_delete=models.CASCADE, related_name="scoreboard_entry")
+    username = models.CharField(max_length=150)
+    display_name = models.CharField(max_length=30)
+    current_score = models.IntegerField(default=0)
+    capture_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ("-current_score", "capture_count", "display_name")
+        indexes = [
+            models.Index(fields=["-current_score", "capture_count", "display_name"], name="scoreboard_entry_order_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.display_name} has {self.current_score}"
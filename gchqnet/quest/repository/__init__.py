@@ -1,19 +1,30 @@
-from .captures import record_attempted_capture
-from .scoreboards import get_global_scoreboard, get_private_scoreboard, get_recent_events_for_users
+from .activity import backfill_activity_events, backfill_activity_feed, get_recent_events_for_users
+from .captures import record_attempted_capture, record_attempted_captures
+from .scoreboards import get_global_scoreboard, get_private_scoreboard, rebuild_scoreboard
 from .scores import (
     annotate_current_score_for_user_queryset,
+    create_score_record,
     get_current_score_for_user,
     grade_for_score,
+    increment_score_for_user,
     update_score_for_user,
 )
+from .stats import get_player_capture_stats_queryset
 
 __all__ = [
     "annotate_current_score_for_user_queryset",
+    "backfill_activity_events",
+    "backfill_activity_feed",
+    "create_score_record",
     "get_current_score_for_user",
     "get_global_scoreboard",
+    "get_player_capture_stats_queryset",
     "get_private_scoreboard",
     "get_recent_events_for_users",
+    "increment_score_for_user",
+    "rebuild_scoreboard",
     "record_attempted_capture",
+    "record_attempted_captures",
     "update_score_for_user",
     "grade_for_score",
 ]
@@ -0,0 +1,130 @@
+"""
+The recent activity feeds.
+
+Every score record has an ActivityEvent, so each feed is a single range scan of one table, ordered by time.
+The global feed is read from the activity feed backend, which is sent each new event once it has been committed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+
+from gchqnet.quest.activity_feeds import ActivityFeedEntry, get_activity_feed_backend, get_activity_feed_entries
+from gchqnet.quest.models.activity import ActivityEvent, ActivityEventKind
+from gchqnet.quest.models.scores import ScoreRecord
+
+from .found_locations import get_found_locations
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from django.contrib.auth.models import AnonymousUser
+
+    from gchqnet.accounts.models import User
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def build_activity_event(score_record: ScoreRecord) -> ActivityEvent:
+    """Build the activity event for a score record, using the event that the score was awarded for."""
+    activity_event = ActivityEvent(
+        user_id=score_record.user_id,
+        score_record=score_record,
+        difficulty=score_record.score,
+    )
+
+    # Forward relations with no ID set are None, without a query.
+    if (capture_event := score_record.capture_event) is not None:
+        activity_event.type = ActivityEventKind.CAPTURE
+        activity_event.location = capture_event.location
+        activity_event.target_name = capture_event.location.display_name
+        activity_event.created_at = capture_event.created_at
+    elif (basic_achievement_event := score_record.basic_achievement_event) is not None:
+        activity_event.type = ActivityEventKind.BASIC_ACHIEVEMENT
+        activity_event.target_name = basic_achievement_event.basic_achievement.display_name
+        activity_event.created_at = basic_achievement_event.created_at
+    elif (first_capture_event := score_record.first_capture_event) is not None:
+        activity_event.type = ActivityEventKind.FIRST_CAPTURE
+        activity_event.location = first_capture_event.location
+        activity_event.target_name = first_capture_event.location.display_name
+        activity_event.created_at = first_capture_event.created_at
+    elif (location_group_event := score_record.location_group_achievement_event) is not None:
+        activity_event.type = ActivityEventKind.LOCATION_GROUP
+        activity_event.target_name = location_group_event.location_group.display_name
+        activity_event.created_at = location_group_event.created_at
+
+    return activity_event
+
+
+def publish_activity_event(activity_event: ActivityEvent, user: User) -> None:
+    """
+    Add a new activity event to the global feed, once it has been committed.
+
+    An error from the backend is logged rather than raised, as the event has already been committed. The feed can be
+    repaired with backfill_activity_feed.
+    """
+    entry = ActivityFeedEntry(
+        player_username=user.username,
+        player_name=user.display_name,
+        type=str(activity_event.type),
+        location_id=activity_event.location_id,
+        target_name=activity_event.target_name,
+        difficulty=activity_event.difficulty,
+        created_at=activity_event.created_at,
+    )
+    transaction.on_commit(lambda: get_activity_feed_backend().append(entry), robust=True)
+
+
+def backfill_activity_events() -> int:
+    """Create the activity events for any score records that do not have one. Returns the number created."""
+    score_records = ScoreRecord.objects.filter(activity_event__isnull=True).select_related(
+        "capture_event__location",
+        "basic_achievement_event__basic_achievement",
+        "first_capture_event__location",
+        "location_group_achievement_event__location_group",
+    )
+
+    created = 0
+    batch: list[ActivityEvent] = []
+    for score_record in score_records.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        batch.append(build_activity_event(score_record))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            created += len(ActivityEvent.objects.bulk_create(batch))
+            batch = []
+    if batch:
+        created += len(ActivityEvent.objects.bulk_create(batch))
+    return created
+
+
+def backfill_activity_feed() -> int:
+    """Repopulate the global feed from the most recent activity events. Returns the number of entries."""
+    backend = get_activity_feed_backend()
+    entries = get_activity_feed_entries(ActivityEvent.objects.all(), backend.max_length)
+    backend.replace(entries)
+    return len(entries)
+
+
+def get_recent_events_for_users(
+    users: models.QuerySet[User] | None, *, current_user: User | AnonymousUser, max_num: int = 20
+) -> tuple[list[ActivityFeedEntry], set[UUID]]:
+    """
+    Get the most recent activity for some users, or from the global feed if users is None.
+
+    Also returns the IDs of the locations in the activity that the current user has found, as other players'
+    captures of a location should only be named if the current user has found it too.
+    """
+    if users is None:
+        events = get_activity_feed_backend().get_recent(max_num)
+    else:
+        events = get_activity_feed_entries(ActivityEvent.objects.filter(user__in=users), max_num)
+
+    if current_user.is_authenticated:
+        user_found_locations = get_found_locations(current_user.id).filter(
+            event["location_id"] for event in events if event["location_id"]
+        )
+    else:
+        user_found_locations = set()
+
+    return events, user_found_locations
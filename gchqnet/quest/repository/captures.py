@@ -1,28 +1,39 @@
 from __future__ import annotations
 
-from typing import Literal, TypedDict
+from typing import TYPE_CHECKING, Literal, TypedDict
 
 from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.signals import post_save
 from django.urls import reverse
-from django.utils.crypto import constant_time_compare
 from django_prometheus.conf import NAMESPACE
+from django_prometheus.models import model_inserts
 from notifications.signals import notify
 from prometheus_client import Counter
 
 from gchqnet.accounts.models.badge import Badge
-from gchqnet.achievements.repository import handle_location_capture_for_groups
-from gchqnet.hexpansion.crypto import badge_response_calculation
-from gchqnet.hexpansion.models import Hexpansion
+from gchqnet.accounts.models.user import User
+from gchqnet.achievements.repository import handle_location_capture_for_groups, increment_location_group_progress
+from gchqnet.core.timing import PipelineTimer
+from gchqnet.hexpansion.crypto import BadgeResponseVerifier
 from gchqnet.quest.models.captures import CaptureEvent, CaptureLog, RawCaptureEvent
 from gchqnet.quest.models.location import Location, LocationDifficulty
-from gchqnet.quest.models.scores import ScoreRecord
+from gchqnet.quest.models.outbox import OutboxTaskKind
 
-from .scores import update_score_for_user
+from .hexpansions import get_hexpansions_by_serial_number
+from .outbox import enqueue_tasks, outbox_handler
+from .scores import create_score_record
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from gchqnet.hexpansion.models import Hexpansion
+
+# Labels must have a small, fixed set of values. Per-player and per-location figures are read from the database.
 capture_submissions = Counter(
     "gchqnet_capture_submissions_total",
     "Number of captures submitted.",
-    ["hexpansion_id", "hexpansion_name", "location_id", "location_name", "username", "success", "repeat"],
+    ["outcome"],
     namespace=NAMESPACE,
 )
 
@@ -39,6 +50,86 @@ class CaptureFailure(TypedDict):
     message: str
 
 
+class CaptureProof(TypedDict):
+    serial_number: UUID
+    rand: bytes
+    hmac: str
+
+
+@outbox_handler(OutboxTaskKind.CAPTURE_NOTIFICATION)
+def send_capture_notification(*, user_id: int, location_id: str) -> None:
+    user = User.objects.get(id=user_id)
+    location = Location.objects.get(id=location_id)
+    notify.send(
+        user,
+        recipient=user,
+        verb="captured",
+        target=location,
+        description=f"You have gained {location.difficulty} points.",
+        actions=[{"href": reverse("quest:location_detail", args=[location.id]), "title": "View"}],
+    )
+
+
+@outbox_handler(OutboxTaskKind.LOCATION_GROUPS)
+def handle_capture_for_location_groups(
+    *, user_id: int, location_id: str, found_counts: dict[str, int] | None = None
+) -> None:
+    user = User.objects.get(id=user_id)
+    location = Location.objects.get(id=location_id)
+    # Tasks enqueued before found_counts was added to the payload use the current progress instead.
+    handle_location_capture_for_groups(user, location, found_counts=found_counts or {})
+
+
+def _create_capture_event_if_new(raw_event: RawCaptureEvent, location: Location, user: User) -> CaptureEvent | None:
+    """
+    Insert a CaptureEvent unless the user has already captured the location.
+
+    This relies on the one_capture_per_user constraint using INSERT ... ON CONFLICT DO NOTHING, rather than checking
+    whether the event exists first. Returns None if the location was already captured.
+
+    The insert is counted and post_save is sent as they would be by CaptureEvent.save, so that the receivers for new
+    captures are run.
+    """
+    capture_event = CaptureEvent(raw_capture_event=raw_event, location=location, created_by=user)
+    fields = [field for field in CaptureEvent._meta.fields if field.concrete]
+    values = [field.get_db_prep_save(field.pre_save(capture_event, add=True), connection) for field in fields]
+
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    conflict_columns = ", ".join(
+        quote_name(field.column) for field in (CaptureEvent.created_by.field, CaptureEvent.location.field)
+    )
+    sql = (
+        f"INSERT INTO {quote_name(CaptureEvent._meta.db_table)} ({columns}) "  # noqa: S608
+        f"VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT ({conflict_columns}) DO NOTHING"
+    )
+
+    model_inserts.labels("capture_event").inc()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, values)
+        created = cursor.rowcount == 1
+
+    if not created:
+        return None
+
+    capture_event._state.adding = False
+    capture_event._state.db = connection.alias
+    post_save.send(
+        sender=CaptureEvent, instance=capture_event, created=True, update_fields=None, raw=False, using=connection.alias
+    )
+    return capture_event
+
+
+def _hexpansion_atsha_serial(hexpansion: Hexpansion) -> bytes:
+    return hexpansion.serial_number.int.to_bytes(9, "little")
+
+
+def verify_capture_hmac(hexpansion: Hexpansion, *, rand: bytes, hmac: str, mac_address: str) -> bool:
+    verifier = BadgeResponseVerifier(settings.HEXPANSION_ROOT_KEY, slot=0)
+    return verifier.verify(_hexpansion_atsha_serial(hexpansion), rand, mac_address, hmac)
+
+
 def record_attempted_capture(
     badge: Badge,
     hexpansion: Hexpansion,
@@ -48,70 +139,84 @@ def record_attempted_capture(
     app_rev: str,
     fw_rev: str,
     validate_hmac: bool = False,
+    timer: PipelineTimer | None = None,
+) -> CaptureSuccess | CaptureFailure:
+    """
+    Record a capture attempt from a badge.
+
+    The whole pipeline runs in a single transaction. The number of queries and time taken by each stage is recorded
+    on the timer, which is logged on completion.
+    """
+    timer = timer or PipelineTimer("capture")
+    try:
+        with transaction.atomic():
+            return _record_attempted_capture(
+                badge,
+                hexpansion,
+                rand=rand,
+                hmac=hmac,
+                app_rev=app_rev,
+                fw_rev=fw_rev,
+                validate_hmac=validate_hmac,
+                timer=timer,
+            )
+    finally:
+        timer.finish()
+
+
+def _record_attempted_capture(
+    badge: Badge,
+    hexpansion: Hexpansion,
+    *,
+    rand: bytes,
+    hmac: str,
+    app_rev: str,
+    fw_rev: str,
+    validate_hmac: bool,
+    timer: PipelineTimer,
+    hmac_is_valid: bool | None = None,
 ) -> CaptureSuccess | CaptureFailure:
     # Firstly, record it regardless.
-    raw_event = RawCaptureEvent.objects.create(
-        badge=badge,
-        hexpansion=hexpansion,
-        created_by=badge.user,
-        rand=rand,
-        hmac=hmac,
-        app_rev=app_rev,
-        fw_rev=fw_rev,
-    )
+    with timer.stage("raw_capture"):
+        raw_event = RawCaptureEvent.objects.create(
+            badge=badge,
+            hexpansion=hexpansion,
+            created_by=badge.user,
+            rand=rand,
+            hmac=hmac,
+            app_rev=app_rev,
+            fw_rev=fw_rev,
+        )
 
     try:
-        location: Location = hexpansion.location
+        with timer.stage("location"):
+            location: Location = hexpansion.location
     except Location.DoesNotExist:
-        capture_submissions.labels(
-            hexpansion_id=hexpansion.id,
-            hexpansion_name=hexpansion.human_identifier,
-            location_id="",
-            location_name="",
-            username=badge.user.username,
-            success=0,
-            repeat=0,
-        ).inc()
+        capture_submissions.labels(outcome="not_installed").inc()
         return CaptureFailure(result="fail", message="Hexpansion not installed")
 
-    expected_response_bytes = badge_response_calculation(
-        hexpansion.serial_number.int.to_bytes(9, "little"),
-        rand,
-        badge.mac_address,
-        settings.HEXPANSION_ROOT_KEY,
-        slot=0,
-    )
-    expected_response_hex = "".join(f"{x:02x}" for x in expected_response_bytes)
+    if hmac_is_valid is None:
+        with timer.stage("verify"):
+            hmac_is_valid = verify_capture_hmac(hexpansion, rand=rand, hmac=hmac, mac_address=badge.mac_address)
 
-    if validate_hmac and not constant_time_compare(expected_response_hex, hmac):
-        capture_submissions.labels(
-            hexpansion_id=hexpansion.id,
-            hexpansion_name=hexpansion.human_identifier,
-            location_id=location.id,
-            location_name=location.display_name,
-            username=badge.user.username,
-            success=0,
-            repeat=0,
-        ).inc()
+    if validate_hmac and not hmac_is_valid:
+        capture_submissions.labels(outcome="invalid_hmac").inc()
         return CaptureFailure(result="fail", message="Invalid HMAC - Contact Support")
 
     # Log that a capture attempt of a location was made.
-    CaptureLog.objects.create(
-        raw_capture_event=raw_event,
-        location=location,
-        created_by=badge.user,
-    )
+    with timer.stage("capture_log"):
+        CaptureLog.objects.create(
+            raw_capture_event=raw_event,
+            location=location,
+            created_by=badge.user,
+        )
 
-    if CaptureEvent.objects.filter(created_by=badge.user, location=location).exists():
-        capture_submissions.labels(
-            hexpansion_id=hexpansion.id,
-            hexpansion_name=hexpansion.human_identifier,
-            location_id=location.id,
-            location_name=location.display_name,
-            username=badge.user.username,
-            success=1,
-            repeat=1,
-        ).inc()
+    # Mark as captured, unless it already has been.
+    with timer.stage("capture_event"):
+        ce = _create_capture_event_if_new(raw_event, location, badge.user)
+
+    if ce is None:
+        capture_submissions.labels(outcome="repeat").inc()
         return CaptureSuccess(
             result="success",
             repeat=True,
@@ -119,32 +224,86 @@ def record_attempted_capture(
             difficulty=LocationDifficulty(location.difficulty).label,
         )
 
-    # Mark as captured.
-    ce = CaptureEvent.objects.create(raw_capture_event=raw_event, location=location, created_by=badge.user)
-    ScoreRecord.objects.create(capture_event=ce, user=badge.user, score=location.difficulty)
-    notify.send(
-        badge.user,
-        recipient=badge.user,
-        verb="captured",
-        target=location,
-        description=f"You have gained {location.difficulty} points.",
-        actions=[{"href": reverse("quest:location_detail", args=[location.id]), "title": "View"}],
-    )
-    # award_first_capture(location, badge.user)
-    handle_location_capture_for_groups(badge.user, location, update_score=False)
-    update_score_for_user(badge.user)
-    capture_submissions.labels(
-        hexpansion_id=hexpansion.id,
-        hexpansion_name=hexpansion.human_identifier,
-        location_id=location.id,
-        location_name=location.display_name,
-        username=badge.user.username,
-        success=1,
-        repeat=0,
-    ).inc()
+    with timer.stage("score"):
+        create_score_record(badge.user, location.difficulty, capture_event=ce)
+
+    with timer.stage("group_progress"):
+        found_counts = increment_location_group_progress(badge.user, location)
+
+    # Notifications and location group achievements are not needed for the response to the badge.
+    with timer.stage("side_effects"):
+        payload = {"user_id": badge.user.id, "location_id": str(location.id)}
+        # award_first_capture(location, badge.user)
+        enqueue_tasks(
+            [
+                (OutboxTaskKind.CAPTURE_NOTIFICATION, payload),
+                (OutboxTaskKind.LOCATION_GROUPS, {**payload, "found_counts": found_counts}),
+            ]
+        )
+
+    capture_submissions.labels(outcome="captured").inc()
     return CaptureSuccess(
         result="success",
         repeat=False,
         location_name=location.display_name,
         difficulty=LocationDifficulty(location.difficulty).label,
     )
+
+
+def record_attempted_captures(
+    badge: Badge,
+    proofs: list[CaptureProof],
+    *,
+    app_rev: str,
+    fw_rev: str,
+    validate_hmac: bool = False,
+    timer: PipelineTimer | None = None,
+) -> list[CaptureSuccess | CaptureFailure]:
+    """
+    Record a batch of capture attempts from a badge, in the order that they were made.
+
+    The hexpansions are looked up in the in-process map, and every HMAC is verified before anything is recorded.
+    The captures are then recorded in a single transaction. Returns a result for each proof, in the same order.
+    """
+    timer = timer or PipelineTimer("capture_batch")
+    try:
+        with timer.stage("hexpansions"):
+            hexpansions = get_hexpansions_by_serial_number({proof["serial_number"] for proof in proofs})
+
+        with timer.stage("verify"):
+            found = [i for i, proof in enumerate(proofs) if proof["serial_number"] in hexpansions]
+            verified = BadgeResponseVerifier(settings.HEXPANSION_ROOT_KEY, slot=0).verify_many(
+                (
+                    _hexpansion_atsha_serial(hexpansions[proofs[i]["serial_number"]]),
+                    proofs[i]["rand"],
+                    badge.mac_address,
+                    proofs[i]["hmac"],
+                )
+                for i in found
+            )
+            hmac_results = dict(zip(found, verified, strict=True))
+
+        results: list[CaptureSuccess | CaptureFailure] = []
+        with transaction.atomic():
+            for i, proof in enumerate(proofs):
+                if (hexpansion := hexpansions.get(proof["serial_number"])) is None:
+                    capture_submissions.labels(outcome="unknown_hexpansion").inc()
+                    results.append(CaptureFailure(result="fail", message="Unable to find that hexpansion"))
+                    continue
+
+                results.append(
+                    _record_attempted_capture(
+                        badge,
+                        hexpansion,
+                        rand=proof["rand"],
+                        hmac=proof["hmac"],
+                        app_rev=app_rev,
+                        fw_rev=fw_rev,
+                        validate_hmac=validate_hmac,
+                        timer=timer,
+                        hmac_is_valid=hmac_results[i],
+                    )
+                )
+        return results
+    finally:
+        timer.finish()
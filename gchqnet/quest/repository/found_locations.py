@@ -0,0 +1,119 @@
+"""
+Compact sets of the locations that each player has found.
+
+Many pages need to know which of some locations a player has found. Each location has a bit index, and the locations
+that a player has found are kept in the shared cache as a bitset, which is a few hundred bytes even for a player that
+has found every location. The bitset is rebuilt from the database with a single query when it is not in the cache.
+
+The bitset is cached with the generation of the player's captures at the time the database was read, and the
+generation is bumped when a capture is committed. A bitset that was read from the database before a capture was
+committed, but cached after it, then has an old generation and is rebuilt rather than being used.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import transaction
+
+from gchqnet.quest.models.captures import CaptureEvent
+
+from .hexpansions import get_location_bit_indexes
+
+FOUND_LOCATIONS_CACHE_TIMEOUT = 60 * 60
+
+
+def _found_locations_cache_key(user_id: int) -> str:
+    return f"quest:found-locations:{user_id}"
+
+
+def _generation_cache_key(user_id: int) -> str:
+    return f"quest:found-locations:{user_id}:generation"
+
+
+def _initial_generation() -> int:
+    # If the generation is evicted, it restarts from a value that no cached bitset has.
+    return time.time_ns() // 1000
+
+
+def _to_bytes(bits: int) -> bytes:
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+class FoundLocations:
+    """The locations that a player has found, by location ID."""
+
+    __slots__ = ("bits", "bit_indexes")
+
+    def __init__(self, bits: int, bit_indexes: Mapping[UUID, int]) -> None:
+        self.bits = bits
+        self.bit_indexes = bit_indexes
+
+    def __contains__(self, location_id: object) -> bool:
+        if not isinstance(location_id, UUID):
+            return False
+        bit_index = self.bit_indexes.get(location_id)
+        return bit_index is not None and bool(self.bits >> bit_index & 1)
+
+    def __len__(self) -> int:
+        # A location cannot be deleted once it has been found, so every bit that is set is for a location.
+        return self.bits.bit_count()
+
+    def __sub__(self, other: FoundLocations) -> FoundLocations:
+        """The locations that have been found by this player, but not the other."""
+        return FoundLocations(self.bits & ~other.bits, self.bit_indexes)
+
+    def filter(self, location_ids: Iterable[UUID]) -> set[UUID]:  # noqa: A003
+        """Get the locations that have been found, out of some locations."""
+        return {location_id for location_id in location_ids if location_id in self}
+
+    def location_ids(self) -> set[UUID]:
+        return self.filter(self.bit_indexes)
+
+    def unfound_location_ids(self) -> set[UUID]:
+        return {location_id for location_id in self.bit_indexes if location_id not in self}
+
+
+def _build_bits(user_id: int) -> int:
+    bits = 0
+    for bit_index in CaptureEvent.objects.filter(created_by_id=user_id).values_list("location__bit_index", flat=True):
+        bits |= 1 << bit_index
+    return bits
+
+
+def _get_generation(user_id: int, cached: Mapping[str, int]) -> int:
+    key = _generation_cache_key(user_id)
+    if (generation := cached.get(key)) is None:
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = cache.get(key, _initial_generation())
+    return generation
+
+
+def get_found_locations(user_id: int) -> FoundLocations:
+    key = _found_locations_cache_key(user_id)
+    cached = cache.get_many([key, _generation_cache_key(user_id)])
+    # The generation is read before the database, so that a capture committed in between bumps it past this one.
+    generation = _get_generation(user_id, cached)
+    if (entry := cached.get(key)) is not None and entry[0] == generation:
+        bits = int.from_bytes(entry[1], "little")
+    else:
+        bits = _build_bits(user_id)
+        cache.set(key, (generation, _to_bytes(bits)), timeout=FOUND_LOCATIONS_CACHE_TIMEOUT)
+    return FoundLocations(bits, get_location_bit_indexes())
+
+
+def _bump_generation_now(user_id: int) -> None:
+    try:
+        cache.incr(_generation_cache_key(user_id))
+    except ValueError:
+        # Any cached bitset is discarded when the generation restarts.
+        pass
+
+
+def invalidate_found_locations(user_id: int) -> None:
+    """Discard the found locations for a player once the current transaction is committed, e.g after a capture."""
+    cache.delete(_found_locations_cache_key(user_id))
+    transaction.on_commit(lambda: _bump_generation_now(user_id))
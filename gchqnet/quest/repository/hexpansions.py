@@ -0,0 +1,169 @@
+"""
+An in-process map from hexpansion serial numbers to the locations they are installed at.
+
+Every capture needs the hexpansion and location for the serial number sent by the badge, but these only change when
+logistics deploy or edit a location. Each process keeps a map of them, so the capture path does not need to read them
+from the database. The version of the map is kept in the shared cache, so that a change made in one process causes
+every other process to rebuild its map.
+
+As every location has a hexpansion, the map also gives the bit index of every location, which is used for the sets of
+locations that each player has found.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Collection
+from typing import TypedDict
+from uuid import UUID, uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from gchqnet.hexpansion.models import Hexpansion
+from gchqnet.quest.models.location import Location
+
+VERSION_CACHE_KEY = "quest:hexpansion-lookup:version"
+
+
+class HexpansionLookupEntry(TypedDict):
+    hexpansion_id: UUID
+    human_identifier: str
+    location_id: UUID | None
+    difficulty: int | None
+    display_name: str | None
+    bit_index: int | None
+
+
+class HexpansionLookup:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._version: str | None = None
+        self._entries: dict[UUID, HexpansionLookupEntry] | None = None
+        self._bit_indexes: tuple[dict[UUID, HexpansionLookupEntry], dict[UUID, int]] | None = None
+
+    def invalidate(self) -> None:
+        """Discard the map in this process, and tell other processes to rebuild theirs."""
+        with self._lock:
+            self._generation += 1
+            self._entries = None
+        cache.set(VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+    def _build(self) -> dict[UUID, HexpansionLookupEntry]:
+        return {
+            serial_number: HexpansionLookupEntry(
+                hexpansion_id=hexpansion_id,
+                human_identifier=human_identifier,
+                location_id=location_id,
+                difficulty=difficulty,
+                display_name=display_name,
+                bit_index=bit_index,
+            )
+            for serial_number, hexpansion_id, human_identifier, location_id, difficulty, display_name, bit_index in (
+                Hexpansion.objects.order_by().values_list(
+                    "serial_number",
+                    "id",
+                    "human_identifier",
+                    "location__id",
+                    "location__difficulty",
+                    "location__display_name",
+                    "location__bit_index",
+                )
+            )
+        }
+
+    def get_entries(self) -> dict[UUID, HexpansionLookupEntry]:
+        version = cache.get(VERSION_CACHE_KEY)
+        with self._lock:
+            entries, generation = self._entries, self._generation
+            if entries is not None and version == self._version:
+                return entries
+
+        entries = self._build()
+        with self._lock:
+            # Don't keep the map if it was invalidated while it was being built.
+            if generation == self._generation:
+                self._entries, self._version = entries, version
+        return entries
+
+    def get_bit_indexes(self) -> dict[UUID, int]:
+        entries = self.get_entries()
+        with self._lock:
+            if self._bit_indexes is not None and self._bit_indexes[0] is entries:
+                return self._bit_indexes[1]
+
+        bit_indexes = {
+            entry["location_id"]: entry["bit_index"]
+            for entry in entries.values()
+            if entry["location_id"] is not None and entry["bit_index"] is not None
+        }
+        with self._lock:
+            self._bit_indexes = (entries, bit_indexes)
+        return bit_indexes
+
+
+_lookup = HexpansionLookup()
+
+
+def _hexpansion_from_entry(serial_number: UUID, entry: HexpansionLookupEntry) -> Hexpansion:
+    """
+    Build a hexpansion, along with the location it is installed at, without querying the database.
+
+    Fields that are not in the map are deferred, so are loaded from the database if they are accessed. As with
+    Model.from_db, the values must be in the same order as the fields on the model.
+    """
+    hexpansion = Hexpansion.from_db(
+        None,
+        ["id", "human_identifier", "serial_number"],
+        [entry["hexpansion_id"], entry["human_identifier"], serial_number],
+    )
+    if entry["location_id"] is None:
+        # Remember that the hexpansion is not installed, so that accessing the location doesn't query for it.
+        Location.hexpansion.field.remote_field.set_cached_value(hexpansion, None)
+    else:
+        hexpansion.location = Location.from_db(
+            None,
+            ["id", "display_name", "hexpansion_id", "difficulty", "bit_index"],
+            [
+                entry["location_id"],
+                entry["display_name"],
+                entry["hexpansion_id"],
+                entry["difficulty"],
+                entry["bit_index"],
+            ],
+        )
+    return hexpansion
+
+
+def get_hexpansion_by_serial_number(serial_number: UUID) -> Hexpansion | None:
+    """Get a hexpansion and its location by serial number, or None if there is no such hexpansion."""
+    entry = _lookup.get_entries().get(serial_number)
+    if entry is None:
+        return None
+    return _hexpansion_from_entry(serial_number, entry)
+
+
+def get_hexpansions_by_serial_number(serial_numbers: Collection[UUID]) -> dict[UUID, Hexpansion]:
+    entries = _lookup.get_entries()
+    return {
+        serial_number: _hexpansion_from_entry(serial_number, entry)
+        for serial_number in serial_numbers
+        if (entry := entries.get(serial_number)) is not None
+    }
+
+
+def get_location_bit_indexes() -> dict[UUID, int]:
+    """Get the bit index of every location, by location ID."""
+    return _lookup.get_bit_indexes()
+
+
+def invalidate_hexpansion_lookup() -> None:
+    """
+    Rebuild the hexpansion map after a hexpansion or location has changed.
+
+    The map is invalidated immediately for this process, and again once the change is committed so that other
+    processes cannot rebuild it from data that is not yet visible to them.
+    """
+    _lookup.invalidate()
+    transaction.on_commit(_lookup.invalidate)
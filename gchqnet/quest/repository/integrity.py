@@ -0,0 +1,392 @@
+"""
+Reconcile the data that is derived from captures and achievements.
+
+Scores, score records and group progress are updated incrementally, so a bug or a manual change in the admin can leave
+them inconsistent. Each check finds the inconsistent rows with a single set-based query, such as an anti-join for
+missing score records, and fixes them with bulk queries. The rows are read and fixed in chunks by primary key, each
+chunk in its own transaction, so that no table is locked for long while the event is running.
+
+The players whose scores or captures are fixed are moved on the scoreboard in the same transaction, rather than
+rebuilding the whole scoreboard afterwards, which would lock every entry while captures are being made.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import Any, NamedTuple, TypedDict
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from gchqnet.accounts.models import User
+from gchqnet.achievements.models import (
+    BasicAchievementEvent,
+    FirstToCaptureAchievementEvent,
+    LocationGroup,
+    LocationGroupAchievementEvent,
+    LocationGroupProgress,
+)
+from gchqnet.achievements.repository import recompute_location_group_progress
+from gchqnet.quest.models.captures import CaptureEvent, RawCaptureEvent
+from gchqnet.quest.models.scores import ScoreboardEntry, ScoreRecord, UserScore
+
+from .activity import backfill_activity_events
+from .found_locations import invalidate_found_locations
+from .rankings import set_scoreboard_entry, sync_scoreboard_entry
+from .versions import bump_versions, user_version_name
+
+INTEGRITY_CHUNK_SIZE = 1000
+INTEGRITY_SAMPLE_SIZE = 10
+
+
+class IntegrityCheckResult(TypedDict):
+    name: str
+    description: str
+    found: int
+    fixed: int
+    sample: list[str]
+    elapsed: float
+
+
+class _ScoredEvent(NamedTuple):
+    """An event that is worth points, by the ScoreRecord field that links to it."""
+
+    field: str
+    model: type[models.Model]
+    user_path: str
+    score_path: str
+
+
+SCORED_EVENTS = [
+    _ScoredEvent("capture_event", CaptureEvent, "created_by", "location__difficulty"),
+    _ScoredEvent("basic_achievement_event", BasicAchievementEvent, "user", "basic_achievement__difficulty"),
+    _ScoredEvent("first_capture_event", FirstToCaptureAchievementEvent, "user", "location__difficulty"),
+    _ScoredEvent(
+        "location_group_achievement_event", LocationGroupAchievementEvent, "user", "location_group__difficulty"
+    ),
+]
+
+
+def _iter_chunks(queryset: models.QuerySet, fields: list[str], chunk_size: int) -> Iterator[list[tuple[Any, ...]]]:
+    """
+    Read the primary key and some fields of each row in a queryset, in chunks.
+
+    Each chunk is a separate query that continues from the last primary key, rather than a long-running cursor. This
+    means that the rows in a chunk can be fixed before the next chunk is read.
+    """
+    last_pk = None
+    while True:
+        chunk_queryset = queryset.order_by("pk")
+        if last_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset.values_list("pk", *fields)[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1][0]
+
+
+def _reconcile(
+    name: str,
+    description: str,
+    queryset: models.QuerySet,
+    fix: Callable[[list[Any]], None],
+    *,
+    diff: tuple[str, str] | None = None,
+    dry_run: bool,
+    chunk_size: int,
+) -> IntegrityCheckResult:
+    """Find the inconsistent rows in a queryset, and fix them a chunk at a time unless this is a dry run."""
+    start = time.perf_counter()
+    result = IntegrityCheckResult(name=name, description=description, found=0, fixed=0, sample=[], elapsed=0)
+    for chunk in _iter_chunks(queryset, list(diff or []), chunk_size):
+        result["found"] += len(chunk)
+        for row in chunk[: INTEGRITY_SAMPLE_SIZE - len(result["sample"])]:
+            result["sample"].append(f"{row[0]}: {row[1]} should be {row[2]}" if diff else str(row[0]))
+
+        if not dry_run:
+            with transaction.atomic():
+                fix([row[0] for row in chunk])
+            result["fixed"] += len(chunk)
+
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def _expected_capture_count() -> Coalesce:
+    counts = (
+        CaptureEvent.objects.filter(created_by_id=models.OuterRef("user_id"))
+        .order_by()
+        .values("created_by_id")
+        .annotate(count=models.Count("id"))
+        .values("count")
+    )
+    return Coalesce(models.Subquery(counts), models.Value(0))
+
+
+def _move_on_scoreboard(user_ids: Iterable[int]) -> None:
+    """Move players on the scoreboard after their scores or captures have been fixed."""
+    users = User.objects.filter(id__in=set(user_ids)).annotate(
+        fixed_score=Coalesce(models.F("user_score__current_score"), models.Value(0)),
+        fixed_capture_count=models.Count("capture_events"),
+    )
+    for user in users:
+        set_scoreboard_entry(user, current_score=user.fixed_score, capture_count=user.fixed_capture_count)
+
+
+def _check_capture_players(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        user_ids = CaptureEvent.objects.filter(pk__in=ids).values_list(
+            "created_by_id", "raw_capture_event__badge__user_id"
+        )
+        CaptureEvent.objects.filter(pk__in=ids).update(
+            created_by_id=models.Subquery(
+                RawCaptureEvent.objects.filter(pk=models.OuterRef("raw_capture_event_id")).values("badge__user_id")[:1]
+            )
+        )
+        changed_user_ids = {user_id for pair in user_ids for user_id in pair}
+        for user_id in changed_user_ids:
+            invalidate_found_locations(user_id)
+        _move_on_scoreboard(changed_user_ids)
+
+    return _reconcile(
+        "capture_players",
+        "Capture events for a different player to the badge",
+        CaptureEvent.objects.exclude(created_by_id=models.F("raw_capture_event__badge__user_id")),
+        fix,
+        diff=("created_by_id", "raw_capture_event__badge__user_id"),
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_missing_score_records(event: _ScoredEvent, *, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        events = event.model.objects.filter(pk__in=ids)  # type: ignore[attr-defined]
+        ScoreRecord.objects.bulk_create(
+            ScoreRecord(user_id=user_id, score=score, **{f"{event.field}_id": pk})
+            for pk, user_id, score in events.values_list("pk", event.user_path, event.score_path)
+        )
+
+    return _reconcile(
+        f"missing_{event.field}_score_records",
+        f"Missing score records for {event.model._meta.verbose_name_plural}",
+        event.model.objects.filter(score_record__isnull=True),  # type: ignore[attr-defined]
+        fix,
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_score_records(event: _ScoredEvent, *, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        events = event.model.objects.filter(pk=models.OuterRef(event.field))  # type: ignore[attr-defined]
+        ScoreRecord.objects.filter(pk__in=ids).update(
+            score=models.Subquery(events.values(event.score_path)[:1]),
+            user_id=models.Subquery(events.values(event.user_path)[:1]),
+        )
+
+    return _reconcile(
+        f"{event.field}_score_records",
+        f"Score records with the wrong score or player for {event.model._meta.verbose_name_plural}",
+        ScoreRecord.objects.filter(**{f"{event.field}__isnull": False})
+        .annotate(expected_score=models.F(f"{event.field}__{event.score_path}"))
+        .exclude(score=models.F("expected_score"), user_id=models.F(f"{event.field}__{event.user_path}")),
+        fix,
+        diff=("score", "expected_score"),
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_activity_events(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    # The missing activity events are already created in batches by backfill_activity_events.
+    start = time.perf_counter()
+    missing = ScoreRecord.objects.filter(activity_event__isnull=True)
+    result = IntegrityCheckResult(
+        name="activity_events",
+        description="Score records without an activity event",
+        found=missing.count(),
+        fixed=0,
+        sample=[str(pk) for pk in missing.order_by("pk").values_list("pk", flat=True)[:INTEGRITY_SAMPLE_SIZE]],
+        elapsed=0,
+    )
+    if not dry_run and result["found"]:
+        result["fixed"] = backfill_activity_events()
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def _expected_score() -> Coalesce:
+    totals = (
+        ScoreRecord.objects.filter(user_id=models.OuterRef("user_id"))
+        .order_by()
+        .values("user_id")
+        .annotate(total=models.Sum("score"))
+        .values("total")
+    )
+    return Coalesce(models.Subquery(totals), models.Value(0))
+
+
+def _check_user_scores(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        user_ids = list(UserScore.objects.filter(pk__in=ids).values_list("user_id", flat=True))
+        UserScore.objects.filter(pk__in=ids).update(current_score=_expected_score())
+        bump_versions(*[user_version_name(user_id) for user_id in user_ids])
+        _move_on_scoreboard(user_ids)
+
+    return _reconcile(
+        "user_scores",
+        "Player scores that are not the total of their score records",
+        UserScore.objects.annotate(expected_score=_expected_score()).exclude(current_score=models.F("expected_score")),
+        fix,
+        diff=("current_score", "expected_score"),
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_missing_user_scores(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        totals = (
+            ScoreRecord.objects.filter(user_id__in=ids)
+            .order_by()
+            .values("user_id")
+            .annotate(total=models.Sum("score"))
+            .values_list("user_id", "total")
+        )
+        UserScore.objects.bulk_create(UserScore(user_id=user_id, current_score=total) for user_id, total in totals)
+        bump_versions(*[user_version_name(user_id) for user_id in ids])
+        _move_on_scoreboard(ids)
+
+    return _reconcile(
+        "missing_user_scores",
+        "Players with score records but no score",
+        User.objects.filter(user_score__isnull=True).filter(
+            models.Exists(ScoreRecord.objects.filter(user_id=models.OuterRef("pk")))
+        ),
+        fix,
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_scoreboard_entries(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        _move_on_scoreboard(ScoreboardEntry.objects.filter(pk__in=ids).values_list("user_id", flat=True))
+
+    return _reconcile(
+        "scoreboard_entries",
+        "Scoreboard entries with the wrong score or number of captures",
+        ScoreboardEntry.objects.annotate(
+            expected_score=Coalesce(models.F("user__user_score__current_score"), models.Value(0)),
+            expected_capture_count=_expected_capture_count(),
+        ).exclude(current_score=models.F("expected_score"), capture_count=models.F("expected_capture_count")),
+        fix,
+        diff=("current_score", "expected_score"),
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_missing_scoreboard_entries(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    def fix(ids: list[Any]) -> None:
+        for user in User.objects.filter(pk__in=ids):
+            sync_scoreboard_entry(user)
+
+    return _reconcile(
+        "missing_scoreboard_entries",
+        "Players without a scoreboard entry",
+        User.objects.filter(is_superuser=False, scoreboard_entry__isnull=True),
+        fix,
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def _check_location_group_progress(*, dry_run: bool, chunk_size: int) -> IntegrityCheckResult:
+    through = LocationGroup.locations.through
+    expected_found_count = Coalesce(
+        models.Subquery(
+            CaptureEvent.objects.filter(
+                created_by_id=models.OuterRef("user_id"), location__groups=models.OuterRef("location_group_id")
+            )
+            .order_by()
+            .values("created_by_id")
+            .annotate(count=models.Count("id"))
+            .values("count")
+        ),
+        models.Value(0),
+    )
+    expected_total = Coalesce(
+        models.Subquery(
+            through.objects.filter(locationgroup_id=models.OuterRef("location_group_id"))
+            .order_by()
+            .values("locationgroup_id")
+            .annotate(count=models.Count("id"))
+            .values("count")
+        ),
+        models.Value(0),
+    )
+    # Progress is recomputed for a whole group, so the groups with any drift are collected first.
+    stale = (
+        LocationGroupProgress.objects.annotate(expected_found_count=expected_found_count, expected_total=expected_total)
+        .exclude(found_count=models.F("expected_found_count"), total=models.F("expected_total"))
+        .values_list("location_group_id", flat=True)
+    )
+    missing = (
+        CaptureEvent.objects.filter(location__groups__isnull=False)
+        .exclude(
+            models.Exists(
+                LocationGroupProgress.objects.filter(
+                    user_id=models.OuterRef("created_by_id"), location_group_id=models.OuterRef("location__groups")
+                )
+            )
+        )
+        .values_list("location__groups", flat=True)
+    )
+
+    return _reconcile(
+        "location_group_progress",
+        "Location groups with the wrong progress for a player",
+        LocationGroup.objects.filter(models.Q(pk__in=stale) | models.Q(pk__in=missing)),
+        lambda ids: recompute_location_group_progress(*ids),
+        dry_run=dry_run,
+        chunk_size=chunk_size,
+    )
+
+
+def check_integrity(
+    *,
+    dry_run: bool = False,
+    chunk_size: int = INTEGRITY_CHUNK_SIZE,
+    on_result: Callable[[IntegrityCheckResult], None] | None = None,
+) -> list[IntegrityCheckResult]:
+    """
+    Find and fix inconsistencies in scores, score records and group progress.
+
+    The checks are run in order, so that scores are totalled after the score records have been fixed, and the
+    scoreboard is checked after the scores. Only the database is checked, so if the scoreboard backend has drifted it
+    must be rebuilt with rebuild_scoreboard.
+    """
+    checks: list[Callable[..., IntegrityCheckResult]] = [_check_capture_players]
+    checks += [partial(_check_missing_score_records, event) for event in SCORED_EVENTS]
+    checks += [partial(_check_score_records, event) for event in SCORED_EVENTS]
+    checks += [
+        _check_activity_events,
+        _check_user_scores,
+        _check_missing_user_scores,
+        _check_scoreboard_entries,
+        _check_missing_scoreboard_entries,
+        _check_location_group_progress,
+    ]
+
+    results = []
+    for check in checks:
+        result = check(dry_run=dry_run, chunk_size=chunk_size)
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from gchqnet.quest.models.outbox import OutboxTask, OutboxTaskKind
+
+OutboxHandler = Callable[..., None]
+
+_handlers: dict[str, OutboxHandler] = {}
+
+
+def outbox_handler(kind: OutboxTaskKind) -> Callable[[OutboxHandler], OutboxHandler]:
+    """Register a function to handle outbox tasks of the given kind."""
+
+    def _register(func: OutboxHandler) -> OutboxHandler:
+        _handlers[kind] = func
+        return func
+
+    return _register
+
+
+def enqueue_task(kind: OutboxTaskKind, **payload: Any) -> None:
+    """
+    Defer a side effect until the outbox is next processed.
+
+    The payload must be JSON serialisable. If OUTBOX_ALWAYS_EAGER is set, the handler is run immediately instead.
+    """
+    enqueue_tasks([(kind, payload)])
+
+
+def enqueue_tasks(tasks: Iterable[tuple[OutboxTaskKind, dict[str, Any]]]) -> None:
+    """Defer several side effects with a single insert, as enqueue_task does for one."""
+    if settings.OUTBOX_ALWAYS_EAGER:
+        for kind, payload in tasks:
+            _handlers[kind](**payload)
+        return
+
+    OutboxTask.objects.bulk_create(OutboxTask(kind=kind, payload=payload) for kind, payload in tasks)
+
+
+def process_outbox(*, batch_size: int = 100) -> int:
+    """
+    Run the handlers for a batch of pending outbox tasks, oldest first.
+
+    Locked rows are skipped, so multiple workers can drain the outbox at once.
+    A task that fails is retried on a later run, up to OutboxTask.MAX_ATTEMPTS times.
+
+    Returns the number of tasks that were attempted.
+    """
+    with transaction.atomic():
+        tasks = list(
+            OutboxTask.objects.select_for_update(skip_locked=True)
+            .filter(processed_at__isnull=True, attempts__lt=OutboxTask.MAX_ATTEMPTS)
+            .order_by("processed_at", "created_at")[:batch_size]
+        )
+
+        now = timezone.now()
+        for task in tasks:
+            task.attempts += 1
+            task.updated_at = now
+            try:
+                with transaction.atomic():
+                    _handlers[task.kind](**task.payload)
+            except Exception as e:  # noqa: BLE001
+                task.last_error = repr(e)
+            else:
+                task.processed_at = now
+
+        OutboxTask.objects.bulk_update(tasks, ["attempts", "last_error", "processed_at", "updated_at"])
+
+    return len(tasks)
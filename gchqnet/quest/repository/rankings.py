@@ -0,0 +1,143 @@
+"""
+Incremental maintenance of the materialised global scoreboard.
+
+Each ScoreboardEntry holds the score and capture count of a player, so a score change only updates the row of the
+player that moved, and captures by different players never wait for each other. The rank is not stored, as a change to
+one score can change the ranks of every player below it. Instead, it is derived when the scoreboard is read, as a
+dense rank from the index on the score.
+
+Changes are passed on to the scoreboard backend once they have been committed, and bump the scores version so that
+clients polling the scoreboards see them. The change has already been committed to the database by then, so an error
+from the backend is logged rather than raised, and the backend can be repaired with rebuild_scoreboard.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from gchqnet.quest.models.scores import ScoreboardEntry, UserScore
+from gchqnet.quest.scoreboard_backends import ScoreboardPlayer, get_scoreboard_backend
+
+from .versions import SCORES_VERSION, bump_versions
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from gchqnet.accounts.models import User
+
+RANK_ORDERING = ("-current_score", "capture_count", "display_name")
+
+
+def dense_rank() -> models.Expression:
+    """Get the dense rank of an entry, i.e one more than the number of distinct scores above it."""
+    higher_scores = (
+        ScoreboardEntry.objects.filter(current_score__gt=models.OuterRef("current_score"))
+        .order_by()
+        .annotate(group=models.Value(1))
+        .values("group")
+        .annotate(count=models.Count("current_score", distinct=True))
+        .values("count")
+    )
+    return Coalesce(models.Subquery(higher_scores), models.Value(0)) + 1
+
+
+def get_ranked_entries() -> models.QuerySet[ScoreboardEntry]:
+    """Get the entries on the global scoreboard with their ranks, in rank order."""
+    return ScoreboardEntry.objects.annotate(rank=dense_rank()).order_by(*RANK_ORDERING)
+
+
+def _publish_entry(entry: ScoreboardEntry) -> None:
+    player = ScoreboardPlayer(
+        user_id=entry.user_id,
+        username=entry.username,
+        display_name=entry.display_name,
+        current_score=entry.current_score,
+        capture_count=entry.capture_count,
+    )
+    transaction.on_commit(lambda: get_scoreboard_backend().set_player(player), robust=True)
+
+
+def increment_scoreboard_entry(user: User, *, score_delta: int, capture_delta: int = 0) -> None:
+    ScoreboardEntry.objects.filter(user=user).update(
+        current_score=models.F("current_score") + score_delta,
+        capture_count=models.F("capture_count") + capture_delta,
+    )
+    # Private scoreboards show the scores of administrators too, who are not on the scoreboard.
+    bump_versions(SCORES_VERSION)
+
+    # Send the delta rather than the new totals, as concurrent captures may be committed in any order.
+    user_id = user.id
+    transaction.on_commit(
+        lambda: get_scoreboard_backend().increment_player(
+            user_id, score_delta=score_delta, capture_delta=capture_delta
+        ),
+        robust=True,
+    )
+
+
+def set_scoreboard_entry(user: User, *, current_score: int, capture_count: int) -> None:
+    with transaction.atomic():
+        entry = ScoreboardEntry.objects.select_for_update().filter(user=user).first()
+        bump_versions(SCORES_VERSION)
+        if entry is None:
+            return
+
+        entry.current_score = current_score
+        entry.capture_count = capture_count
+        entry.save(update_fields=["current_score", "capture_count"])
+        _publish_entry(entry)
+
+
+def sync_scoreboard_entry(user: User) -> None:
+    """Add, update or remove the scoreboard entry for a user after their details have changed."""
+    with transaction.atomic():
+        entry = ScoreboardEntry.objects.select_for_update().filter(user=user).first()
+        bump_versions(SCORES_VERSION)
+
+        if user.is_superuser:
+            if entry is not None:
+                entry.delete()
+            return
+
+        if entry is None:
+            current_score = UserScore.objects.filter(user=user).values_list("current_score", flat=True).first() or 0
+            entry = ScoreboardEntry.objects.create(
+                user=user,
+                username=user.username,
+                display_name=user.display_name,
+                current_score=current_score,
+                capture_count=user.capture_events.count(),
+            )
+            _publish_entry(entry)
+        elif (entry.username, entry.display_name) != (user.username, user.display_name):
+            entry.username = user.username
+            entry.display_name = user.display_name
+            entry.save(update_fields=["username", "display_name"])
+            _publish_entry(entry)
+
+
+def add_scoreboard_entries(users: Sequence[User]) -> None:
+    """
+    Add entries for new players, who have no score yet, e.g after they have been created with bulk_create.
+
+    This is equivalent to calling sync_scoreboard_entry for each player, but takes the same number of queries for any
+    number of players.
+    """
+    entries = ScoreboardEntry.objects.bulk_create(
+        ScoreboardEntry(user=user, username=user.username, display_name=user.display_name)
+        for user in users
+        if not user.is_superuser
+    )
+    for entry in entries:
+        _publish_entry(entry)
+    bump_versions(SCORES_VERSION)
+
+
+def remove_scoreboard_entry(entry: ScoreboardEntry) -> None:
+    """Remove a player from the scoreboard backend after their entry has been deleted."""
+    user_id = entry.user_id
+    transaction.on_commit(lambda: get_scoreboard_backend().remove_player(user_id), robust=True)
+    bump_versions(SCORES_VERSION)
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from uuid import UUID
+from typing import TYPE_CHECKING, Any
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models.functions import DenseRank
 
 from gchqnet.accounts.models import User, UserQuerySet
-from gchqnet.achievements.models import BasicAchievementEvent, FirstToCaptureAchievementEvent
-from gchqnet.quest.models.captures import CaptureEvent
-
+from gchqnet.quest.models.scores import ScoreboardEntry
+from gchqnet.quest.scoreboard_backends import (
+    PLAYER_FIELDS,
+    ScoreboardPlayer,
+    ScoreboardRow,
+    ScoreboardRows,
+    get_scoreboard_backend,
+)
+
+from .rankings import get_ranked_entries
 from .scores import annotate_current_score_for_user_queryset
+from .versions import SCORES_VERSION, bump_versions
 
 if TYPE_CHECKING:  # pragma: nocover
-    from django.contrib.auth.models import AnonymousUser
     from django.db.models import QuerySet
 
     from gchqnet.accounts.models import User, UserQuerySet
@@ -31,75 +37,82 @@ def _annotate_scoreboard_query(qs: UserQuerySet | QuerySet[User]) -> UserQuerySe
     return qs  # type: ignore[return-value]
 
 
-def get_global_scoreboard(*, search_query: str = "") -> UserQuerySet:
-    # Only display users who are not administrators.
-    qs = User.objects.filter(is_superuser=False)
-    qs = _annotate_scoreboard_query(qs)
+def get_global_scoreboard_queryset() -> QuerySet[ScoreboardEntry, dict[str, Any]]:
+    """Get the global scoreboard from the database, for when it must be searched, sorted or paged by keyset."""
+    # Administrators do not have a scoreboard entry.
+    return get_ranked_entries().values(*PLAYER_FIELDS, "rank")
+
 
+def get_global_scoreboard(*, search_query: str = "") -> ScoreboardRows:
     if search_query:
-        # Construct a CTE expression manually as the Django ORM does not support them
-        # Hack for case-insensitivity that works across both SQLite and PostgreSQL
-        qs = User.objects.raw(
-            f"SELECT * FROM ({qs.query}) as u0 WHERE Lower(display_name) LIKE Lower(%s)",  # noqa: S608
-            [f"%{search_query}%"],
+        # Scoreboard backends can only be read in rank order.
+        return get_global_scoreboard_queryset().filter(display_name__icontains=search_query)
+
+    return get_scoreboard_backend().get_scoreboard()
+
+
+def rebuild_scoreboard() -> int:
+    """
+    Recalculate every entry on the global scoreboard from scratch, and repopulate the scoreboard backend.
+
+    The scoreboard is normally updated incrementally, so this only needs to be run to fix inconsistencies
+    or when the scoreboard backend has lost its data.
+    Returns the number of entries on the scoreboard.
+    """
+    with transaction.atomic():
+        ScoreboardEntry.objects.filter(user__is_superuser=True).delete()
+        entries = {entry.user_id: entry for entry in ScoreboardEntry.objects.select_for_update()}
+
+        to_create = []
+        to_update = []
+        users = _annotate_scoreboard_query(User.objects.filter(is_superuser=False))
+        for user in users.values("id", "username", "display_name", "current_score", "capture_count"):
+            values = {
+                "username": user["username"],
+                "display_name": user["display_name"],
+                "current_score": user["current_score"],
+                "capture_count": user["capture_count"],
+            }
+            if entry := entries.get(user["id"]):
+                for field, value in values.items():
+                    setattr(entry, field, value)
+                to_update.append(entry)
+            else:
+                to_create.append(ScoreboardEntry(user_id=user["id"], **values))
+
+        ScoreboardEntry.objects.bulk_update(
+            to_update,
+            ["username", "display_name", "current_score", "capture_count"],
+            batch_size=1000,
         )
+        ScoreboardEntry.objects.bulk_create(to_create, batch_size=1000)
 
-    return qs
+        players = list(ScoreboardEntry.objects.values(*PLAYER_FIELDS))
+        transaction.on_commit(lambda: get_scoreboard_backend().rebuild(players))
+        bump_versions(SCORES_VERSION)
 
+    return len(to_update) + len(to_create)
 
-def get_private_scoreboard(leaderboard: Leaderboard) -> UserQuerySet:
-    qs = leaderboard.members.all()
-    qs = _annotate_scoreboard_query(qs)
-    return qs
 
+def _rank_players(players: list[ScoreboardPlayer]) -> list[ScoreboardRow]:
+    rows: list[ScoreboardRow] = []
+    rank = 0
+    previous_score = None
+    for player in sorted(players, key=lambda p: -p["current_score"]):
+        if player["current_score"] != previous_score:
+            rank += 1
+            previous_score = player["current_score"]
+        rows.append(ScoreboardRow(**player, rank=rank))
+    return sorted(rows, key=lambda r: (r["rank"], r["capture_count"], r["display_name"]))
 
-def get_recent_events_for_users(
-    users: QuerySet[User], *, current_user: User | AnonymousUser, max_num: int = 20
-) -> tuple[QuerySet, set[UUID]]:
-    ce_qs = (
-        CaptureEvent.objects.select_related("location")
-        .filter(
-            created_by__in=users,
-        )
-        .annotate(
-            player_username=models.F("created_by__username"),
-            player_name=models.F("created_by__display_name"),
-            difficulty=models.F("location__difficulty"),
-            type=models.Value("capture"),
-        )[:max_num]
-    )
 
-    bae_qs = BasicAchievementEvent.objects.filter(
-        user__in=users,
-    ).annotate(
-        player_username=models.F("user__username"),
-        player_name=models.F("user__display_name"),
-        difficulty=models.F("basic_achievement__difficulty"),
-        type=models.Value("basic_achievement"),
-    )[:max_num]
-
-    fcae_qs = FirstToCaptureAchievementEvent.objects.filter(
-        user__in=users,
-    ).annotate(
-        player_username=models.F("user__username"),
-        player_name=models.F("user__display_name"),
-        difficulty=models.F("location__difficulty"),
-        type=models.Value("first_capture"),
-    )[:max_num]
-
-    # TODO: Add the location group achievement events
-    both = list(ce_qs) + list(bae_qs) + list(fcae_qs)
-
-    if current_user.is_authenticated:
-        user_found_locations = set(
-            CaptureEvent.objects.filter(
-                location_id__in=[ce.location_id for ce in ce_qs] + [fcae.location_id for fcae in fcae_qs],
-                created_by=current_user,
-            ).values_list("location_id", flat=True)
-        )
-    else:
-        user_found_locations = set()
+def get_private_scoreboard(leaderboard: Leaderboard) -> list[ScoreboardRow]:
+    member_ids = set(leaderboard.members.values_list("id", flat=True))
+    players = get_scoreboard_backend().get_players(member_ids)
 
-    events = sorted(both, key=lambda x: x.created_at, reverse=True)[:max_num]
+    if missing_ids := member_ids - {player["user_id"] for player in players}:
+        # Administrators are not on the global scoreboard, so their scores are read from the database.
+        qs = _annotate_scoreboard_query(User.objects.filter(id__in=missing_ids))
+        players.extend(qs.values("username", "display_name", "current_score", "capture_count", user_id=models.F("id")))  # type: ignore[arg-type]
 
-    return events, user_found_locations  # type: ignore[return-value]
+    return _rank_players(players)
@@ -2,11 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.db import models
+from django.db import models, transaction
 
 from gchqnet.quest.models.scores import ScoreRecord, UserScore
 
+from .activity import build_activity_event, publish_activity_event
+from .rankings import increment_scoreboard_entry, set_scoreboard_entry
+from .versions import bump_versions, user_version_name
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from gchqnet.accounts.models import User, UserQuerySet
 
 
@@ -33,14 +39,64 @@ def _calculate_current_score_for_user(user: User) -> int:
 
 
 def update_score_for_user(user: User) -> int:
+    """
+    Recalculate the score for the user from all of their score records.
+
+    This is a full recompute and is used to reconcile scores, e.g by check_integrity.
+    When awarding points, use create_score_record instead.
+    """
+    current_score = _calculate_current_score_for_user(user)
     obj, _ = UserScore.objects.update_or_create(
         user=user,
-        defaults={"current_score": _calculate_current_score_for_user(user)},
-        create_defaults={"current_score": _calculate_current_score_for_user(user)},
+        defaults={"current_score": current_score},
     )
+    set_scoreboard_entry(user, current_score=obj.current_score, capture_count=user.capture_events.count())
+    bump_versions(user_version_name(user.id))
     return obj.current_score
 
 
+def add_user_scores(users: Sequence[User]) -> None:
+    """
+    Give new players a score of zero, e.g after they have been created with bulk_create.
+
+    Players are given a score when they are created, so that awarding points only has to increment it.
+    """
+    UserScore.objects.bulk_create(
+        [UserScore(user=user, current_score=0) for user in users],
+        ignore_conflicts=True,
+    )
+
+
+def increment_score_for_user(user: User, delta: int, *, new_captures: int = 0) -> None:
+    """
+    Atomically apply a delta to the stored score for the user, and move them on the scoreboard.
+
+    Players are given a score when they are created, but if the user does not have one, it is calculated in full.
+    """
+    updated = UserScore.objects.filter(user=user).update(current_score=models.F("current_score") + delta)
+    if updated:
+        increment_scoreboard_entry(user, score_delta=delta, capture_delta=new_captures)
+        bump_versions(user_version_name(user.id))
+    else:
+        update_score_for_user(user)
+
+
+def create_score_record(user: User, score: int, **event: models.Model) -> ScoreRecord:
+    """
+    Create a score record for an event and add the points to the score for the user.
+
+    The event should be passed as a keyword argument matching the field on ScoreRecord, e.g capture_event=ce
+    """
+    # Captures are already in a transaction, so a savepoint is not needed.
+    with transaction.atomic(savepoint=False):
+        score_record = ScoreRecord.objects.create(user=user, score=score, **event)
+        activity_event = build_activity_event(score_record)
+        activity_event.save(force_insert=True)
+        publish_activity_event(activity_event, user)
+        increment_score_for_user(user, score, new_captures=1 if score_record.capture_event_id else 0)
+    return score_record
+
+
 def grade_for_score(score: int) -> str:
     grades = [
         (6800, "Sequoia"),
@@ -0,0 +1,52 @@
+"""
+Per-player capture statistics, read from the database on demand.
+
+These are not exported as Prometheus metrics, as a series for each player would grow without bound.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+from django.db.models.functions import Coalesce
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.models.captures import CaptureEvent, CaptureLog, RawCaptureEvent
+
+
+def _count_created_by_user(model: type[models.Model]) -> Coalesce:
+    return Coalesce(
+        models.Subquery(
+            model._default_manager.filter(created_by=models.OuterRef("pk"))
+            .order_by()
+            .values("created_by")
+            .annotate(count=models.Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def get_player_capture_stats_queryset() -> models.QuerySet[User]:
+    """
+    Annotate each player with a breakdown of their capture submissions.
+
+    Each count is a correlated subquery, so that the counts are not multiplied together by joins.
+    A submission that did not produce a CaptureLog was rejected, e.g because the HMAC was invalid.
+    """
+    return (
+        User.objects.filter(is_superuser=False)
+        .annotate(
+            submission_count=_count_created_by_user(RawCaptureEvent),
+            valid_submission_count=_count_created_by_user(CaptureLog),
+            capture_count=_count_created_by_user(CaptureEvent),
+            last_submission_at=models.Subquery(
+                RawCaptureEvent.objects.filter(created_by=models.OuterRef("pk"))
+                .order_by("-created_at")
+                .values("created_at")[:1]
+            ),
+        )
+        .annotate(
+            rejected_submission_count=models.F("submission_count") - models.F("valid_submission_count"),
+            repeat_submission_count=models.F("valid_submission_count") - models.F("capture_count"),
+        )
+    )
@@ -0,0 +1,69 @@
+"""
+Version counters for the data behind the scoreboard and map APIs.
+
+Clients poll these APIs, and most of the time nothing has changed. Each counter is kept in the shared cache and is
+bumped after a change is committed, so that a view can build an ETag from the counters and answer a conditional
+request with 304 Not Modified without reading anything from the database.
+
+If a counter is evicted from the cache, it restarts from the current time in microseconds, so that it is still
+greater than any version a client has seen unless it was bumped more than a million times a second.
+
+There is deliberately no Last-Modified time. It only has a precision of a second, so a client that fetched a response
+in the same second as a later change would be told that its stale copy was still fresh.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+SCORES_VERSION = "scores"
+LOCATIONS_VERSION = "locations"
+
+
+def _version_cache_key(name: str) -> str:
+    return f"quest:versions:{name}"
+
+
+def user_version_name(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def leaderboard_version_name(leaderboard_id: object) -> str:
+    return f"leaderboard:{leaderboard_id}"
+
+
+def _initial_version() -> int:
+    return time.time_ns() // 1000
+
+
+def _bump_versions_now(names: tuple[str, ...]) -> None:
+    for name in names:
+        key = _version_cache_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), timeout=None)
+
+
+def bump_versions(*names: str) -> None:
+    """Bump the named versions once the current transaction has been committed."""
+    transaction.on_commit(lambda: _bump_versions_now(names))
+
+
+def get_versions(*names: str) -> list[int]:
+    cached = cache.get_many([_version_cache_key(name) for name in names])
+    versions = []
+    for name in names:
+        key = _version_cache_key(name)
+        if (version := cached.get(key)) is None:
+            cache.add(key, _initial_version(), timeout=None)
+            version = cache.get(key, _initial_version())
+        versions.append(version)
+    return versions
+
+
+def get_etag(prefix: str, *names: str) -> str:
+    return f'W/"{prefix}-{"-".join(str(version) for version in get_versions(*names))}"'
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .base import PLAYER_FIELDS, BaseScoreboardBackend, LazyScoreboard, ScoreboardPlayer, ScoreboardRow, ScoreboardRows
+
+__all__ = [
+    "PLAYER_FIELDS",
+    "BaseScoreboardBackend",
+    "LazyScoreboard",
+    "ScoreboardPlayer",
+    "ScoreboardRow",
+    "ScoreboardRows",
+    "get_scoreboard_backend",
+]
+
+
+@cache
+def get_scoreboard_backend() -> BaseScoreboardBackend:
+    """Get the scoreboard backend configured by the SCOREBOARD_BACKEND setting."""
+    backend_cls = import_string(settings.SCOREBOARD_BACKEND["BACKEND"])
+    return backend_cls(**settings.SCOREBOARD_BACKEND.get("OPTIONS", {}))
+
+
+@receiver(setting_changed)
+def _reset_scoreboard_backend(*, setting: str, **kwargs: Any) -> None:
+    if setting == "SCOREBOARD_BACKEND":
+        get_scoreboard_backend.cache_clear()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, overload
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from gchqnet.quest.models import ScoreboardEntry
+
+
+class ScoreboardPlayer(TypedDict):
+    user_id: int
+    username: str
+    display_name: str
+    current_score: int
+    capture_count: int
+
+
+class ScoreboardRow(ScoreboardPlayer):
+    rank: int
+
+
+PLAYER_FIELDS = ("user_id", "username", "display_name", "current_score", "capture_count")
+
+
+ScoreboardRows: TypeAlias = "QuerySet[ScoreboardEntry, dict[str, Any]] | Sequence[ScoreboardRow]"
+
+
+class LazyScoreboard(Sequence[ScoreboardRow]):
+    """
+    The global scoreboard in rank order, read a page at a time from a scoreboard backend.
+
+    This can be passed to a paginator in place of a queryset.
+    """
+
+    def __init__(self, backend: BaseScoreboardBackend) -> None:
+        self.backend = backend
+
+    def __len__(self) -> int:
+        return self.backend.count()
+
+    def __iter__(self) -> Iterator[ScoreboardRow]:
+        return iter(self.backend.get_page(0, len(self)))
+
+    @overload
+    def __getitem__(self, index: int) -> ScoreboardRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ScoreboardRow]: ...
+
+    def __getitem__(self, index: int | slice) -> ScoreboardRow | list[ScoreboardRow]:
+        if isinstance(index, slice):
+            start, stop = index.start or 0, index.stop
+            if index.step not in (None, 1) or stop is None or start < 0 or stop < 0:
+                return list(self.backend.get_page(0, len(self)))[index]
+            return self.backend.get_page(start, stop) if start < stop else []
+
+        if index < 0:
+            index += len(self)
+        if index >= 0 and (page := self.backend.get_page(index, index + 1)):
+            return page[0]
+        raise IndexError("scoreboard index out of range")
+
+
+class BaseScoreboardBackend:
+    """
+    Storage for the global scoreboard, ordered by dense rank.
+
+    The ScoreboardEntry table is the source of truth, and is always kept up to date. Backends are told about changes
+    to it once they have been committed, and can be repopulated from it with ./manage.py rebuild_scoreboard.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        pass
+
+    def get_scoreboard(self) -> ScoreboardRows:
+        """Get every player on the scoreboard, in rank order."""
+        return LazyScoreboard(self)
+
+    def count(self) -> int:
+        """Get the number of players on the scoreboard."""
+        raise NotImplementedError
+
+    def get_page(self, start: int, stop: int) -> list[ScoreboardRow]:
+        """Get the players between two positions on the scoreboard, in rank order."""
+        raise NotImplementedError
+
+    def get_players(self, user_ids: Collection[int]) -> list[ScoreboardPlayer]:
+        """Get the scores of some players, in no particular order. Users that are not on the scoreboard are ignored."""
+        raise NotImplementedError
+
+    def set_player(self, player: ScoreboardPlayer) -> None:
+        """Add a player to the scoreboard, or replace their details and score."""
+        raise NotImplementedError
+
+    def increment_player(self, user_id: int, *, score_delta: int, capture_delta: int) -> None:
+        """Add to the score and capture count of a player. Users that are not on the scoreboard are ignored."""
+        raise NotImplementedError
+
+    def remove_player(self, user_id: int) -> None:
+        raise NotImplementedError
+
+    def rebuild(self, players: Iterable[ScoreboardPlayer]) -> None:
+        """Replace the contents of the scoreboard."""
+        raise NotImplementedError
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from typing import TYPE_CHECKING, Any
+
+from gchqnet.quest.models import ScoreboardEntry
+from gchqnet.quest.repository.rankings import get_ranked_entries
+
+from .base import PLAYER_FIELDS, BaseScoreboardBackend, ScoreboardPlayer, ScoreboardRow
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+class DatabaseScoreboardBackend(BaseScoreboardBackend):
+    """
+    Read the scoreboard directly from the ScoreboardEntry table.
+
+    The table is maintained by gchqnet.quest.repository.rankings, so there is nothing to do when scores change.
+    """
+
+    def get_scoreboard(self) -> QuerySet[ScoreboardEntry, dict[str, Any]]:
+        return get_ranked_entries().values(*PLAYER_FIELDS, "rank")
+
+    def count(self) -> int:
+        return ScoreboardEntry.objects.count()
+
+    def get_page(self, start: int, stop: int) -> list[ScoreboardRow]:
+        return list(self.get_scoreboard()[start:stop])  # type: ignore[arg-type]
+
+    def get_players(self, user_ids: Collection[int]) -> list[ScoreboardPlayer]:
+        return list(ScoreboardEntry.objects.filter(user_id__in=user_ids).values(*PLAYER_FIELDS))
+
+    def set_player(self, player: ScoreboardPlayer) -> None:
+        pass
+
+    def increment_player(self, user_id: int, *, score_delta: int, capture_delta: int) -> None:
+        pass
+
+    def remove_player(self, user_id: int) -> None:
+        pass
+
+    def rebuild(self, players: Iterable[ScoreboardPlayer]) -> None:
+        pass
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Collection, Iterable
+from typing import Any
+
+from .base import BaseScoreboardBackend, ScoreboardPlayer, ScoreboardRow
+
+
+class MemoryScoreboardBackend(BaseScoreboardBackend):
+    """
+    Keep the scoreboard in the memory of the current process.
+
+    Each process has its own copy, which starts empty. This is intended for tests and local development.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        self._players: dict[int, ScoreboardPlayer] = {}
+        self._lock = threading.Lock()
+
+    def count(self) -> int:
+        return len(self._players)
+
+    def get_page(self, start: int, stop: int) -> list[ScoreboardRow]:
+        with self._lock:
+            players = sorted(
+                self._players.values(),
+                key=lambda p: (-p["current_score"], p["capture_count"], p["display_name"]),
+            )
+
+        rows: list[ScoreboardRow] = []
+        rank = 0
+        previous_score = None
+        for player in players[:stop]:
+            if player["current_score"] != previous_score:
+                rank += 1
+                previous_score = player["current_score"]
+            rows.append(ScoreboardRow(**player, rank=rank))
+        return rows[start:stop]
+
+    def get_players(self, user_ids: Collection[int]) -> list[ScoreboardPlayer]:
+        with self._lock:
+            return [ScoreboardPlayer(**self._players[user_id]) for user_id in user_ids if user_id in self._players]
+
+    def set_player(self, player: ScoreboardPlayer) -> None:
+        with self._lock:
+            self._players[player["user_id"]] = ScoreboardPlayer(**player)
+
+    def increment_player(self, user_id: int, *, score_delta: int, capture_delta: int) -> None:
+        with self._lock:
+            if player := self._players.get(user_id):
+                player["current_score"] += score_delta
+                player["capture_count"] += capture_delta
+
+    def remove_player(self, user_id: int) -> None:
+        with self._lock:
+            self._players.pop(user_id, None)
+
+    def rebuild(self, players: Iterable[ScoreboardPlayer]) -> None:
+        new_players = {player["user_id"]: ScoreboardPlayer(**player) for player in players}
+        with self._lock:
+            self._players = new_players
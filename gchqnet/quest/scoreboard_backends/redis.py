@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Collection, Iterable
+from typing import TYPE_CHECKING, Any, cast
+
+import redis
+
+from .base import BaseScoreboardBackend, ScoreboardPlayer, ScoreboardRow
+
+if TYPE_CHECKING:
+    from redis.commands.core import Script
+
+# Move a player to a new score, keeping the set of distinct scores and the order of the players up to date.
+# KEYS: scores, distinct, counts, captures, names, order, members
+# ARGV: user_id, score, capture_count, relative, names, display_name
+_SET_PLAYER_SCRIPT = """
+local old = redis.call("ZSCORE", KEYS[1], ARGV[1])
+local relative = ARGV[4] == "1"
+if not old and relative then
+    return 0
+end
+
+local score = tonumber(ARGV[2])
+if old then
+    if relative then
+        score = score + tonumber(old)
+    end
+    if redis.call("HINCRBY", KEYS[3], old, -1) <= 0 then
+        redis.call("HDEL", KEYS[3], old)
+        redis.call("ZREM", KEYS[2], old)
+    end
+end
+
+redis.call("ZADD", KEYS[1], score, ARGV[1])
+redis.call("ZADD", KEYS[2], score, tostring(score))
+redis.call("HINCRBY", KEYS[3], tostring(score), 1)
+local captures
+if relative then
+    captures = redis.call("HINCRBY", KEYS[4], ARGV[1], tonumber(ARGV[3]))
+else
+    captures = tonumber(ARGV[3])
+    redis.call("HSET", KEYS[4], ARGV[1], ARGV[3])
+    redis.call("HSET", KEYS[5], ARGV[1], ARGV[5])
+end
+
+-- The capture count is a fixed width prefix of the member, followed by the display name and user ID.
+local old_member = redis.call("HGET", KEYS[7], ARGV[1])
+local member
+if relative then
+    member = string.format("%010d:", captures) .. string.sub(old_member, 12)
+else
+    member = string.format("%010d:", captures) .. ARGV[6] .. "\\0" .. ARGV[1]
+end
+if old_member then
+    redis.call("ZREM", KEYS[6], old_member)
+end
+redis.call("ZADD", KEYS[6], -score, member)
+redis.call("HSET", KEYS[7], ARGV[1], member)
+return 1
+"""
+
+# KEYS: scores, distinct, counts, captures, names, order, members
+# ARGV: user_id
+_REMOVE_PLAYER_SCRIPT = """
+local old = redis.call("ZSCORE", KEYS[1], ARGV[1])
+if not old then
+    return 0
+end
+
+redis.call("ZREM", KEYS[1], ARGV[1])
+if redis.call("HINCRBY", KEYS[3], old, -1) <= 0 then
+    redis.call("HDEL", KEYS[3], old)
+    redis.call("ZREM", KEYS[2], old)
+end
+local old_member = redis.call("HGET", KEYS[7], ARGV[1])
+if old_member then
+    redis.call("ZREM", KEYS[6], old_member)
+end
+redis.call("HDEL", KEYS[4], ARGV[1])
+redis.call("HDEL", KEYS[5], ARGV[1])
+redis.call("HDEL", KEYS[7], ARGV[1])
+return 1
+"""
+
+
+def _order_member(user_id: str, capture_count: int, display_name: str) -> str:
+    # Must match the member built by _SET_PLAYER_SCRIPT.
+    return f"{capture_count:010d}:{display_name}\x00{user_id}"
+
+
+class RedisScoreboardBackend(BaseScoreboardBackend):
+    """
+    Keep the scoreboard in Redis sorted sets.
+
+    Players are stored in a sorted set by score. As ranks are dense, a second sorted set holds each distinct score,
+    along with a count of the players that have it, so that the rank of a score is its position in that set.
+    The players are ordered for pages by a third sorted set, whose members begin with the capture count and display
+    name, so that Redis breaks ties between equal scores in the same way as the database.
+    Reading a rank or a page of the scoreboard is therefore O(log n).
+
+    Options:
+        url: The URL of the Redis server.
+        key_prefix: A prefix for the keys used by the scoreboard.
+    """
+
+    def __init__(self, *, url: str, key_prefix: str = "gchqnet:scoreboard", **options: Any) -> None:
+        super().__init__(**options)
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.keys = [
+            f"{key_prefix}:{name}" for name in ("scores", "distinct", "counts", "captures", "names", "order", "members")
+        ]
+        (
+            self.scores_key,
+            self.distinct_key,
+            self.counts_key,
+            self.captures_key,
+            self.names_key,
+            self.order_key,
+            self.members_key,
+        ) = self.keys
+        self._set_player: Script = self.client.register_script(_SET_PLAYER_SCRIPT)
+        self._remove_player: Script = self.client.register_script(_REMOVE_PLAYER_SCRIPT)
+
+    def _build_players(self, scores: list[tuple[str, float]]) -> list[ScoreboardPlayer]:
+        if not scores:
+            return []
+
+        user_ids = [user_id for user_id, _ in scores]
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hmget(self.captures_key, user_ids)
+        pipe.hmget(self.names_key, user_ids)
+        captures, names = pipe.execute()  # type: ignore[no-untyped-call]
+
+        players = []
+        for (user_id, score), capture_count, name in zip(scores, captures, names, strict=True):
+            username, display_name = json.loads(name) if name else ("", "")
+            players.append(
+                ScoreboardPlayer(
+                    user_id=int(user_id),
+                    username=username,
+                    display_name=display_name,
+                    current_score=int(score),
+                    capture_count=int(capture_count or 0),
+                )
+            )
+        return players
+
+    def count(self) -> int:
+        return cast(int, self.client.zcard(self.scores_key))
+
+    def get_page(self, start: int, stop: int) -> list[ScoreboardRow]:
+        if stop <= start:
+            return []
+
+        members = cast(list[tuple[str, float]], self.client.zrange(self.order_key, start, stop - 1, withscores=True))
+        # The order is by negated score, so that ties are in ascending order of capture count and display name.
+        players = self._build_players([(member.rpartition("\x00")[2], -score) for member, score in members])
+
+        distinct_scores = sorted({player["current_score"] for player in players}, reverse=True)
+        pipe = self.client.pipeline(transaction=False)
+        for score in distinct_scores:
+            pipe.zrevrank(self.distinct_key, str(score))
+        ranks = {score: (rank or 0) + 1 for score, rank in zip(distinct_scores, pipe.execute(), strict=True)}  # type: ignore[no-untyped-call]
+
+        return [ScoreboardRow(**player, rank=ranks[player["current_score"]]) for player in players]
+
+    def get_players(self, user_ids: Collection[int]) -> list[ScoreboardPlayer]:
+        if not user_ids:
+            return []
+
+        members = [str(user_id) for user_id in user_ids]
+        scores = cast(list[float | None], self.client.zmscore(self.scores_key, members))
+        return self._build_players(
+            [(member, score) for member, score in zip(members, scores, strict=True) if score is not None]
+        )
+
+    def set_player(self, player: ScoreboardPlayer) -> None:
+        self._set_player(
+            keys=self.keys,
+            args=[
+                str(player["user_id"]),
+                player["current_score"],
+                player["capture_count"],
+                0,
+                json.dumps([player["username"], player["display_name"]]),
+                player["display_name"],
+            ],
+        )
+
+    def increment_player(self, user_id: int, *, score_delta: int, capture_delta: int) -> None:
+        self._set_player(keys=self.keys, args=[str(user_id), score_delta, capture_delta, 1, "", ""])
+
+    def remove_player(self, user_id: int) -> None:
+        self._remove_player(keys=self.keys, args=[str(user_id)])
+
+    def rebuild(self, players: Iterable[ScoreboardPlayer]) -> None:
+        scores: dict[str, int] = {}
+        captures: dict[str, int] = {}
+        names: dict[str, str] = {}
+        members: dict[str, str] = {}
+        for player in players:
+            user_id = str(player["user_id"])
+            scores[user_id] = player["current_score"]
+            captures[user_id] = player["capture_count"]
+            names[user_id] = json.dumps([player["username"], player["display_name"]])
+            members[user_id] = _order_member(user_id, player["capture_count"], player["display_name"])
+        counts = Counter(str(score) for score in scores.values())
+
+        # Replace every key in a single transaction, so readers never see a partial scoreboard.
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(*self.keys)
+        if scores:
+            pipe.zadd(self.scores_key, scores)
+            pipe.zadd(self.distinct_key, {score: int(score) for score in counts})
+            pipe.hset(self.counts_key, mapping=counts)
+            pipe.hset(self.captures_key, mapping=captures)
+            pipe.hset(self.names_key, mapping=names)
+            pipe.zadd(self.order_key, {member: -scores[user_id] for user_id, member in members.items()})
+            pipe.hset(self.members_key, mapping=members)
+        pipe.execute()  # type: ignore[no-untyped-call]
@@ -0,0 +1,154 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from gchqnet.accounts.models import User
+from gchqnet.achievements.models import LocationGroup
+from gchqnet.achievements.repository import recompute_location_group_progress
+from gchqnet.hexpansion.models import Hexpansion
+from gchqnet.quest.api.geojson import invalidate_location_features
+from gchqnet.quest.models.captures import CaptureEvent
+from gchqnet.quest.models.leaderboard import Leaderboard
+from gchqnet.quest.models.location import Coordinates, Location
+from gchqnet.quest.models.scores import ScoreboardEntry
+from gchqnet.quest.repository.found_locations import invalidate_found_locations
+from gchqnet.quest.repository.hexpansions import invalidate_hexpansion_lookup
+from gchqnet.quest.repository.rankings import remove_scoreboard_entry, sync_scoreboard_entry
+from gchqnet.quest.repository.scores import add_user_scores
+from gchqnet.quest.repository.versions import LOCATIONS_VERSION, bump_versions, leaderboard_version_name
+
+SCOREBOARD_USER_FIELDS = {"username", "display_name", "is_superuser"}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_scoreboard_entry_on_user_save(
+    sender: type[User],
+    instance: User,
+    raw: bool,  # noqa: FBT001
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    if raw or (update_fields is not None and not SCOREBOARD_USER_FIELDS & update_fields):
+        return
+    sync_scoreboard_entry(instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def add_user_score_on_user_create(
+    sender: type[User],
+    instance: User,
+    created: bool,  # noqa: FBT001
+    raw: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    if created and not raw:
+        add_user_scores([instance])
+
+
+@receiver(post_delete, sender=ScoreboardEntry)
+def remove_scoreboard_entry_on_delete(sender: type[ScoreboardEntry], instance: ScoreboardEntry, **kwargs: Any) -> None:
+    remove_scoreboard_entry(instance)
+
+
+@receiver(post_save, sender=Hexpansion)
+@receiver(post_delete, sender=Hexpansion)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_hexpansion_lookup_on_change(sender: type[Hexpansion | Location], **kwargs: Any) -> None:
+    invalidate_hexpansion_lookup()
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=Coordinates)
+@receiver(post_delete, sender=Coordinates)
+@receiver(post_save, sender=LocationGroup)
+@receiver(post_delete, sender=LocationGroup)
+@receiver(m2m_changed, sender=LocationGroup.locations.through)
+def bump_locations_version_on_change(sender: type[Location | Coordinates | LocationGroup], **kwargs: Any) -> None:
+    bump_versions(LOCATIONS_VERSION)
+
+
+@receiver(post_save, sender=Leaderboard)
+@receiver(post_delete, sender=Leaderboard)
+def bump_leaderboard_version_on_change(sender: type[Leaderboard], instance: Leaderboard, **kwargs: Any) -> None:
+    bump_versions(leaderboard_version_name(instance.id))
+
+
+@receiver(m2m_changed, sender=Leaderboard.members.through)
+def bump_leaderboard_version_on_members_change(
+    sender: type[models.Model],
+    instance: Leaderboard | User,
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    if isinstance(instance, Leaderboard):
+        bump_versions(leaderboard_version_name(instance.id))
+    elif pk_set:
+        # The members were changed from the user side of the relation.
+        bump_versions(*(leaderboard_version_name(leaderboard_id) for leaderboard_id in pk_set))
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location_feature_on_location_change(sender: type[Location], instance: Location, **kwargs: Any) -> None:
+    invalidate_location_features(instance.id)
+
+
+@receiver(post_save, sender=Coordinates)
+@receiver(post_delete, sender=Coordinates)
+def invalidate_location_feature_on_coordinates_change(
+    sender: type[Coordinates], instance: Coordinates, **kwargs: Any
+) -> None:
+    invalidate_location_features(instance.location_id)
+
+
+@receiver(post_save, sender=CaptureEvent)
+def invalidate_found_locations_on_capture(
+    sender: type[CaptureEvent],
+    instance: CaptureEvent,
+    created: bool,  # noqa: FBT001
+    raw: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    if created and not raw:
+        invalidate_found_locations(instance.created_by_id)
+
+
+@receiver(post_delete, sender=CaptureEvent)
+def invalidate_found_locations_on_capture_delete(
+    sender: type[CaptureEvent], instance: CaptureEvent, **kwargs: Any
+) -> None:
+    invalidate_found_locations(instance.created_by_id)
+
+
+@receiver(m2m_changed, sender=LocationGroup.locations.through)
+def recompute_location_group_progress_on_change(
+    sender: type[models.Model],
+    instance: LocationGroup | Location,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if not reverse:
+        recompute_location_group_progress(instance.pk)
+    elif pk_set is not None:
+        recompute_location_group_progress(*pk_set)
+    else:
+        # The groups that a location was removed from are not known after it has been cleared, but there are few.
+        recompute_location_group_progress(*LocationGroup.objects.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Location)
+def recompute_location_group_progress_on_location_delete(
+    sender: type[Location], instance: Location, **kwargs: Any
+) -> None:
+    # The location is removed from its groups without sending m2m_changed.
+    location_group_ids = list(instance.groups.values_list("id", flat=True))
+    transaction.on_commit(lambda: recompute_location_group_progress(*location_group_ids))
@@ -0,0 +1,488 @@
+"""
+Generate a synthetic event, for load testing and benchmarks.
+
+Recording captures one at a time is far too slow to build a dataset the size of an event, so the rows are written
+directly with bulk_create, a chunk of players at a time. Everything that the capture pipeline and the outbox would
+have written is generated too, so the dataset passes check_integrity: score records, activity events, player scores,
+location group progress, group achievements, notifications and the scoreboard.
+
+The dataset is generated from a seed, so the same arguments always give the same players, locations and captures.
+The capture HMACs are random, as captures are not verified again once they have been recorded.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import cache
+from typing import Literal, TypedDict, TypeVar
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, models, transaction
+from django.db.models import Max
+from django.db.models.signals import ModelSignal, post_delete, pre_delete
+from django.urls import reverse
+from django.utils import timezone
+from notifications.models import Notification
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.accounts.repository import invalidate_api_token, invalidate_badge_credentials
+from gchqnet.achievements.models import (
+    AchievementDifficulty,
+    BasicAchievementEvent,
+    FirstToCaptureAchievementEvent,
+    LocationGroup,
+    LocationGroupAchievementEvent,
+    LocationGroupProgress,
+)
+from gchqnet.hexpansion.models import Hexpansion
+from gchqnet.quest.models.activity import ActivityEvent
+from gchqnet.quest.models.captures import CaptureEvent, CaptureLog, RawCaptureEvent
+from gchqnet.quest.models.location import Coordinates, Location, LocationDifficulty, next_location_bit_index
+from gchqnet.quest.models.scores import ScoreRecord, UserScore
+from gchqnet.quest.repository.activity import backfill_activity_feed, build_activity_event
+from gchqnet.quest.repository.found_locations import invalidate_found_locations
+from gchqnet.quest.repository.hexpansions import invalidate_hexpansion_lookup
+from gchqnet.quest.repository.scoreboards import rebuild_scoreboard
+from gchqnet.quest.repository.versions import LOCATIONS_VERSION, SCORES_VERSION, bump_versions
+
+TimeProfile = Literal["uniform", "daily", "opening"]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_T = TypeVar("_T", bound=models.Model)
+
+# The relative number of captures in each hour of the day, for the daily profile.
+HOURLY_WEIGHTS = [2, 1, 1, 0, 0, 0, 0, 1, 2, 4, 6, 8, 9, 9, 10, 10, 10, 9, 8, 8, 7, 6, 4, 3]
+
+
+class DatasetStats(TypedDict):
+    users: int
+    locations: int
+    groups: int
+    captures: int
+    group_completions: int
+    notifications: int
+    elapsed: float
+    rate: float
+
+
+def _sample_time(rng: random.Random, profile: TimeProfile, start: datetime, days: int) -> datetime:
+    if profile == "uniform":
+        return start + timedelta(days=rng.uniform(0, days))
+    if profile == "opening":
+        # Most badges are registered and most locations are found soon after the gates open.
+        return start + timedelta(days=days * rng.betavariate(1, 4))
+
+    # The hours are of the local day, so they are counted from midnight.
+    midnight = _local_midnight(start)
+    day = rng.randrange(days)
+    (hour,) = rng.choices(range(24), weights=HOURLY_WEIGHTS)
+    return midnight + timedelta(days=day, hours=hour, seconds=rng.uniform(0, 3600))
+
+
+def _local_midnight(value: datetime) -> datetime:
+    return timezone.localtime(value).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _bulk_create_with_timestamps(model: type[_T], rows: list[_T]) -> None:
+    """
+    Create some rows with the created_at that has been set on each of them.
+
+    bulk_create would set every created_at field to the current time, so the rows are inserted as raw rows, which are
+    written with the values that have been set on them. The rows have never been updated, so updated_at is created_at.
+    """
+    fields = model._meta.concrete_fields  # type: ignore[attr-defined]
+    for row in rows:
+        for field in fields:
+            if getattr(field, "auto_now", False):
+                setattr(row, field.attname, row.created_at)  # type: ignore[attr-defined]
+
+    batch_size = connection.ops.bulk_batch_size(fields, rows) or 1
+    for first in range(0, len(rows), batch_size):
+        model._default_manager._insert(rows[first : first + batch_size], fields=fields, raw=True)  # type: ignore[attr-defined]
+    for row in rows:
+        row._state.adding = False
+        row._state.db = connection.alias
+
+
+def _mac_address(index: int) -> str:
+    # Locally administered addresses, so that they do not clash with real badges.
+    return "-".join(f"{byte:02X}" for byte in (0x020000000000 + index).to_bytes(6, "big"))
+
+
+def create_locations(count: int, rng: random.Random, *, created_by: User, name: str) -> list[Location]:
+    """Create some installed locations with new hexpansions, most of which are shown on the map."""
+    # Use serial numbers after any hexpansions that already exist.
+    first_serial = (Hexpansion.objects.aggregate(serial=Max("eeprom_serial_number"))["serial"] or 0) + 1
+    hexpansions = Hexpansion.objects.bulk_create(
+        Hexpansion(
+            human_identifier=f"~{first_serial + i:05}",
+            eeprom_serial_number=first_serial + i,
+            serial_number=uuid.UUID(int=rng.getrandbits(72)),
+            created_by=created_by,
+        )
+        for i in range(count)
+    )
+    # bulk_create does not call the default for each location, so the bit indexes are assigned here.
+    first_bit_index = next_location_bit_index()
+    locations = Location.objects.bulk_create(
+        Location(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            display_name=f"{name} {i}",
+            hint=f"Hint {i}",
+            hexpansion=hexpansion,
+            difficulty=rng.choice(LocationDifficulty.values),
+            created_by=created_by,
+            bit_index=first_bit_index + i,
+        )
+        for i, hexpansion in enumerate(hexpansions)
+    )
+    # bulk_create does not send the signal that rebuilds the map of hexpansions, which captures are checked against.
+    invalidate_hexpansion_lookup()
+    # Some locations are not shown on the map.
+    Coordinates.objects.bulk_create(
+        Coordinates(
+            location=location,
+            lat=round(rng.uniform(52.03887, 52.04396), 13),
+            long=round(rng.uniform(-2.38255, -2.37431), 13),
+            created_by=created_by,
+        )
+        for location in locations
+        if rng.random() < 0.9
+    )
+    return locations
+
+
+def _create_groups(
+    count: int, rng: random.Random, locations: Sequence[Location], *, created_by: User, name: str
+) -> dict[LocationGroup, set[uuid.UUID]]:
+    """Create some groups of locations, returning the IDs of the locations in each group."""
+    groups = {
+        LocationGroup(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            display_name=f"{name} group {i}",
+            difficulty=rng.choice(AchievementDifficulty.values),
+            created_by=created_by,
+        ): {location.id for location in rng.sample(locations, k=min(len(locations), rng.randint(3, 8)))}
+        for i in range(count)
+    }
+    LocationGroup.objects.bulk_create(groups)
+    through = LocationGroup.locations.through
+    through.objects.bulk_create(
+        through(locationgroup_id=group.id, location_id=location_id)
+        for group, location_ids in groups.items()
+        for location_id in location_ids
+    )
+    return groups
+
+
+def _plan_capture_counts(rng: random.Random, users: int, locations: int, captures: int) -> list[int]:
+    # A few players find most of the locations, and many find only a handful.
+    weights = [rng.lognormvariate(0, 1) for _ in range(users)]
+    total_weight = sum(weights) or 1
+    return [min(locations, round(captures * weight / total_weight)) for weight in weights]
+
+
+@cache
+def _detail_url(viewname: str, pk: uuid.UUID) -> str:
+    # There is a notification for every capture, but only a few locations and groups.
+    return reverse(viewname, args=[pk])
+
+
+class _Notifications:
+    """Build notifications as notify.send would, without a query for each one."""
+
+    def __init__(self) -> None:
+        self.user_type = ContentType.objects.get_for_model(User)
+        self.location_type = ContentType.objects.get_for_model(Location)
+        self.group_type = ContentType.objects.get_for_model(LocationGroup)
+        self.rows: list[Notification] = []
+
+    def add(
+        self,
+        user: User,
+        *,
+        verb: str,
+        target: Location | LocationGroup,
+        description: str,
+        url: str,
+        timestamp: datetime,
+    ) -> None:
+        self.rows.append(
+            Notification(
+                recipient=user,
+                actor_content_type=self.user_type,
+                actor_object_id=str(user.id),
+                verb=verb,
+                target_content_type=self.location_type if isinstance(target, Location) else self.group_type,
+                target_object_id=str(target.id),
+                description=description,
+                timestamp=timestamp,
+                data={"actions": [{"href": url, "title": "View"}]},
+            )
+        )
+
+
+def _create_players(
+    rng: random.Random,
+    *,
+    first_index: int,
+    capture_counts: list[int],
+    locations: Sequence[Location],
+    groups: dict[LocationGroup, set[uuid.UUID]],
+    profile: TimeProfile,
+    start: datetime,
+    days: int,
+    name: str,
+) -> tuple[int, int, int]:
+    """Create a chunk of players and everything derived from their captures, returning the number of rows created."""
+    users = User.objects.bulk_create(
+        User(username=f"{name}-{first_index + i}", display_name=f"{name} {first_index + i}")
+        for i in range(len(capture_counts))
+    )
+
+    badges: list[Badge] = []
+    raw_events: list[RawCaptureEvent] = []
+    capture_logs: list[CaptureLog] = []
+    capture_events: list[CaptureEvent] = []
+    score_records: list[ScoreRecord] = []
+    user_scores: list[UserScore] = []
+    progress: list[LocationGroupProgress] = []
+    group_events: list[LocationGroupAchievementEvent] = []
+    notifications = _Notifications()
+
+    for i, (user, capture_count) in enumerate(zip(users, capture_counts, strict=True)):
+        found = sorted(
+            (
+                (_sample_time(rng, profile, start, days), location)
+                for location in rng.sample(locations, k=capture_count)
+            ),
+            key=lambda capture: capture[0],
+        )
+        joined_at = found[0][0] - timedelta(minutes=rng.uniform(1, 60)) if found else start
+        badge = Badge(
+            mac_address=_mac_address(first_index + i), secret=rng.randbytes(32).hex(), user=user, created_at=joined_at
+        )
+        badges.append(badge)
+        user_score = 0
+
+        for created_at, location in found:
+            raw_event = RawCaptureEvent(
+                badge=badge,
+                hexpansion=location.hexpansion,
+                created_by=user,
+                rand=rng.randbytes(32),
+                hmac=rng.randbytes(32).hex(),
+                app_rev="0.0.0",
+                fw_rev="0.0.0",
+                created_at=created_at,
+            )
+            raw_events.append(raw_event)
+            capture_logs.append(
+                CaptureLog(raw_capture_event=raw_event, location=location, created_by=user, created_at=created_at)
+            )
+            capture_event = CaptureEvent(
+                raw_capture_event=raw_event, location=location, created_by=user, created_at=created_at
+            )
+            capture_events.append(capture_event)
+            score_records.append(ScoreRecord(user=user, score=location.difficulty, capture_event=capture_event))
+            user_score += location.difficulty
+            notifications.add(
+                user,
+                verb="captured",
+                target=location,
+                description=f"You have gained {location.difficulty} points.",
+                url=_detail_url("quest:location_detail", location.id),
+                timestamp=created_at,
+            )
+
+        found_at = {location.id: created_at for created_at, location in found}
+        for group, location_ids in groups.items():
+            group_found_at = sorted(found_at[location_id] for location_id in location_ids & found_at.keys())
+            if not group_found_at:
+                continue
+
+            total = len(location_ids)
+            progress.append(
+                LocationGroupProgress(user=user, location_group=group, found_count=len(group_found_at), total=total)
+            )
+            url = _detail_url("achievements:location_group_detail", group.id)
+            notifications.add(
+                user,
+                verb="found your first location in",
+                target=group,
+                description="You have started to find locations in a group. Try and find the rest!",
+                url=url,
+                timestamp=group_found_at[0],
+            )
+            if len(group_found_at) == total:
+                group_event = LocationGroupAchievementEvent(
+                    location_group=group, user=user, created_by=user, created_at=group_found_at[-1]
+                )
+                group_events.append(group_event)
+                score_records.append(
+                    ScoreRecord(user=user, score=group.difficulty, location_group_achievement_event=group_event)
+                )
+                user_score += group.difficulty
+                notifications.add(
+                    user,
+                    verb="captured all locations in",
+                    target=group,
+                    description="You have received a group capture bonus.",
+                    url=url,
+                    timestamp=group_found_at[-1],
+                )
+
+        user_scores.append(UserScore(user=user, current_score=user_score))
+
+    _bulk_create_with_timestamps(Badge, badges)
+    _bulk_create_with_timestamps(RawCaptureEvent, raw_events)
+    _bulk_create_with_timestamps(CaptureLog, capture_logs)
+    _bulk_create_with_timestamps(CaptureEvent, capture_events)
+    _bulk_create_with_timestamps(LocationGroupAchievementEvent, group_events)
+    ScoreRecord.objects.bulk_create(score_records)
+    ActivityEvent.objects.bulk_create(build_activity_event(score_record) for score_record in score_records)
+    UserScore.objects.bulk_create(user_scores)
+    LocationGroupProgress.objects.bulk_create(progress)
+    Notification.objects.bulk_create(notifications.rows)
+
+    return len(capture_events), len(group_events), len(notifications.rows)
+
+
+@contextmanager
+def _without_receivers(*signals: ModelSignal) -> Iterator[None]:
+    saved = [(signal, signal.receivers) for signal in signals]
+    for signal in signals:
+        signal.receivers = []
+        signal.sender_receivers_cache.clear()
+    try:
+        yield
+    finally:
+        for signal, receivers in saved:
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
+
+
+def delete_dataset() -> None:
+    """
+    Delete every player, location and capture, and everything derived from them. Administrators are kept.
+
+    Django loads every row that has a delete receiver or rows that depend on it before deleting it, and the receivers
+    invalidate caches one row at a time. Instead, the tables of captures and everything derived from them, which have
+    the most rows, are emptied leaves first without loading them. The rest are deleted with the receivers
+    disconnected, and the caches are invalidated in bulk afterwards.
+    """
+    users = User.objects.filter(is_superuser=False)
+    user_ids = list(users.values_list("id", flat=True))
+    mac_addresses = list(Badge.objects.values_list("mac_address", flat=True))
+
+    with transaction.atomic(), _without_receivers(pre_delete, post_delete):
+        for model in [
+            ActivityEvent,
+            ScoreRecord,
+            FirstToCaptureAchievementEvent,
+            BasicAchievementEvent,
+            LocationGroupAchievementEvent,
+            LocationGroupProgress,
+            CaptureEvent,
+            CaptureLog,
+            RawCaptureEvent,
+            Notification,
+        ]:
+            model._default_manager.all()._raw_delete(connection.alias)
+        LocationGroup.objects.all().delete()
+        Location.objects.all().delete()
+        Hexpansion.objects.all().delete()
+        users.delete()
+        bump_versions(LOCATIONS_VERSION, SCORES_VERSION)
+
+    invalidate_badge_credentials(*mac_addresses)
+    for user_id in user_ids:
+        invalidate_api_token(user_id)
+        invalidate_found_locations(user_id)
+    invalidate_hexpansion_lookup()
+    # The players were not removed from the scoreboard and the global feed one at a time, so they are rebuilt.
+    rebuild_scoreboard()
+    backfill_activity_feed()
+
+
+def generate_dataset(
+    *,
+    users: int,
+    locations: int,
+    groups: int,
+    captures: int,
+    profile: TimeProfile = "daily",
+    start: datetime | None = None,
+    days: int = 4,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Callable[[DatasetStats], None] | None = None,
+) -> DatasetStats:
+    """
+    Generate players, locations, groups and captures, with everything that is derived from them.
+
+    Each player captures a different number of locations, so that there are roughly the requested number of captures
+    in total. The players are written a chunk at a time, each chunk in its own transaction.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    name = f"synthetic-{seed}"
+    start = start or _local_midnight(timezone.now() - timedelta(days=days))
+    begin = time.perf_counter()
+
+    admin = User.objects.filter(is_superuser=True).order_by("id").first()
+    if admin is None:
+        admin = User.objects.create(
+            username=f"{name}-admin", display_name=f"{name} admin", is_superuser=True, email="admin@example.com"
+        )
+
+    with transaction.atomic():
+        location_list = create_locations(locations, rng, created_by=admin, name=name)
+        group_locations = _create_groups(groups, rng, location_list, created_by=admin, name=name)
+
+    stats = DatasetStats(
+        users=0,
+        locations=len(location_list),
+        groups=len(group_locations),
+        captures=0,
+        group_completions=0,
+        notifications=0,
+        elapsed=0,
+        rate=0,
+    )
+    capture_counts = _plan_capture_counts(rng, users, len(location_list), captures)
+    for first_index in range(0, users, chunk_size):
+        chunk = capture_counts[first_index : first_index + chunk_size]
+        with transaction.atomic():
+            created_captures, completions, notifications = _create_players(
+                rng,
+                first_index=first_index,
+                capture_counts=chunk,
+                locations=location_list,
+                groups=group_locations,
+                profile=profile,
+                start=start,
+                days=days,
+                name=name,
+            )
+
+        stats["users"] += len(chunk)
+        stats["captures"] += created_captures
+        stats["group_completions"] += completions
+        stats["notifications"] += notifications
+        stats["elapsed"] = time.perf_counter() - begin
+        stats["rate"] = stats["captures"] / stats["elapsed"] if stats["elapsed"] else 0
+        if on_progress is not None:
+            on_progress(stats)
+
+    # The scoreboard and the global feed are rebuilt from the database, as they would be after a restore.
+    rebuild_scoreboard()
+    backfill_activity_feed()
+
+    stats["elapsed"] = time.perf_counter() - begin
+    return stats
@@ -616,3 +616,137 @@ class TestBadgeCaptureSubmissionView:
         assert resp.status_code == HTTPStatus.BAD_REQUEST
 
         assert resp.json() == {"detail": ["Unable to find that hexpansion"]}
+
+
+@pytest.mark.django_db
+class TestBadgeCaptureBatchSubmissionView:
+    url = reverse_lazy("api:badge-capture-batch")
+
+    def _proof_for_hexpansion(self, badge_mac: str, hexpansion_sn: int) -> dict[str, str | int]:
+        hmac_bytes = badge_response_calculation(
+            hexpansion_sn.to_bytes(9, "little"),
+            b"\xaa" * 32,
+            badge_mac,
+            settings.HEXPANSION_ROOT_KEY,
+        )
+        return {"sn": hexpansion_sn, "rand": "a" * 64, "hmac": "".join(f"{x:02x}" for x in hmac_bytes)}
+
+    def test_get(self, client: Client) -> None:
+        resp = client.get(self.url)
+
+        assert resp.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+    def test_post__no_data(self, client: Client) -> None:
+        resp = client.post(self.url)
+
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.json() == {
+            "mac_address": ["This field is required."],
+            "badge_secret": ["This field is required."],
+            "captures": ["This field is required."],
+            "app_rev": ["This field is required."],
+            "fw_rev": ["This field is required."],
+        }
+
+    def test_post__no_captures(self, client: Client, user: User) -> None:
+        badge = user.badges.get()
+
+        resp = client.post(
+            self.url,
+            data={
+                "mac_address": badge.mac_address,
+                "badge_secret": badge.secret,
+                "captures": [],
+                "app_rev": "0",
+                "fw_rev": "bees",
+            },
+            content_type="application/json",
+        )
+
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.json() == {"captures": ["This list may not be empty."]}
+
+    def test_post__too_many_captures(self, client: Client, user: User) -> None:
+        badge = user.badges.get()
+
+        resp = client.post(
+            self.url,
+            data={
+                "mac_address": badge.mac_address,
+                "badge_secret": badge.secret,
+                "captures": [{"sn": 1, "rand": "a" * 64, "hmac": "b" * 64}] * 101,
+                "app_rev": "0",
+                "fw_rev": "bees",
+            },
+            content_type="application/json",
+        )
+
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.json() == {"captures": ["Ensure this field has no more than 100 elements."]}
+
+    def test_post__existing_badge__bad_token(self, client: Client, user: User) -> None:
+        badge = user.badges.get()
+
+        resp = client.post(
+            self.url,
+            data={
+                "mac_address": badge.mac_address,
+                "badge_secret": "e" * 64,
+                "captures": [{"sn": 1234567890, "rand": "a" * 64, "hmac": "b" * 64}],
+                "app_rev": "0",
+                "fw_rev": "bees",
+            },
+            content_type="application/json",
+        )
+
+        assert resp.status_code == HTTPStatus.FORBIDDEN
+        assert resp.json() == {"detail": "Incorrect authentication credentials."}
+
+    def test_post__existing_badge__good_token(self, client: Client, user: User, user_2: User) -> None:
+        location_1 = LocationFactory(created_by=user_2)
+        location_2 = LocationFactory(created_by=user_2)
+        badge = user.badges.get()
+
+        resp = client.post(
+            self.url,
+            data={
+                "mac_address": badge.mac_address,
+                "badge_secret": badge.secret,
+                "captures": [
+                    self._proof_for_hexpansion(badge.mac_address, location_1.hexpansion.serial_number.int),
+                    {"sn": 123, "rand": "a" * 64, "hmac": "b" * 64},
+                    {"sn": location_2.hexpansion.serial_number.int, "rand": "a" * 64, "hmac": "b" * 64},
+                    self._proof_for_hexpansion(badge.mac_address, location_2.hexpansion.serial_number.int),
+                    self._proof_for_hexpansion(badge.mac_address, location_1.hexpansion.serial_number.int),
+                ],
+                "app_rev": "0",
+                "fw_rev": "bees",
+            },
+            content_type="application/json",
+        )
+
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json() == {
+            "results": [
+                {
+                    "result": "success",
+                    "repeat": False,
+                    "location_name": location_1.display_name,
+                    "difficulty": LocationDifficulty(location_1.difficulty).label,
+                },
+                {"result": "fail", "message": "Unable to find that hexpansion"},
+                {"result": "fail", "message": "Invalid HMAC - Contact Support"},
+                {
+                    "result": "success",
+                    "repeat": False,
+                    "location_name": location_2.display_name,
+                    "difficulty": LocationDifficulty(location_2.difficulty).label,
+                },
+                {
+                    "result": "success",
+                    "repeat": True,
+                    "location_name": location_1.display_name,
+                    "difficulty": LocationDifficulty(location_1.difficulty).label,
+                },
+            ]
+        }
@@ -0,0 +1,82 @@
+import json
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.api.geojson import render_locations
+from gchqnet.quest.benchmarks import reference_render_locations
+from gchqnet.quest.factories import CoordinatesFactory, LocationFactory
+from gchqnet.quest.models import Location
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.mark.django_db
+class TestRenderLocations:
+    @pytest.fixture(autouse=True)
+    def _locmem_cache(self) -> Iterator[None]:
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def test_matches_serializer(self, user: User) -> None:
+        # Arrange
+        LocationFactory.create_batch(size=5, created_by=user)
+        LocationFactory(created_by=user, coordinates=None)
+        location = LocationFactory(created_by=user, display_name='"quoted" \\ ünïcode', coordinates=None)
+        CoordinatesFactory(lat=Decimal("-0.5"), long=Decimal("179.1234567890123"), created_by=user, location=location)
+
+        # Act
+        resp = render_locations(Location.objects.all())
+
+        # Assert
+        assert resp["Content-Type"] == "application/geo+json"
+        assert json.loads(resp.content) == json.loads(reference_render_locations(Location.objects.all()))
+
+    def test_features_are_cached(self, user: User) -> None:
+        # Arrange
+        LocationFactory.create_batch(size=5, created_by=user)
+        expected = render_locations(Location.objects.all()).content
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            resp = render_locations(Location.objects.all())
+
+        # Assert
+        assert len(ctx.captured_queries) == 1
+        assert resp.content == expected
+
+    def test_location_change_invalidates_feature(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        render_locations(Location.objects.all())
+
+        # Act
+        location.display_name = "new name"
+        location.save()
+        location.coordinates.lat = Decimal("52.5")
+        location.coordinates.save()
+        data = json.loads(render_locations(Location.objects.all()).content)
+
+        # Assert
+        assert data["features"][0]["properties"]["name"] == "new name"
+        assert data["features"][0]["geometry"]["coordinates"][1] == "52.5000000000000"
+
+    def test_coordinates_delete_invalidates_feature(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        render_locations(Location.objects.all())
+
+        # Act
+        location.coordinates.delete()
+        data = json.loads(render_locations(Location.objects.all()).content)
+
+        # Assert
+        assert data["features"] == []
@@ -1,16 +1,20 @@
+from collections.abc import Iterator
 from http import HTTPStatus
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 import pytest
-from django.test import Client
+from django.core.cache import cache
+from django.test import Client, override_settings
 from django.urls import reverse_lazy
 
 from gchqnet.accounts.models.user import User
 from gchqnet.quest.factories import CoordinatesFactory, LocationFactory
-from gchqnet.quest.models.location import LocationDifficulty
+from gchqnet.quest.models.location import Location, LocationDifficulty
 from gchqnet.quest.repository.captures import record_attempted_capture
 
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
 
 @pytest.mark.django_db
 class TestLocationListAPI:
@@ -28,7 +32,7 @@ class TestLocationListAPI:
         resp = client.get(self.url)
 
         assert resp.status_code == HTTPStatus.OK
-        assert resp.json() == {"count": 0, "next": None, "previous": None, "results": []}
+        assert resp.json() == {"next": None, "previous": None, "results": []}
 
     def test_get_unfound_location(self, client: Client, user: User) -> None:
         location = LocationFactory(created_by=user)
@@ -38,7 +42,6 @@ class TestLocationListAPI:
 
         assert resp.status_code == HTTPStatus.OK
         assert resp.json() == {
-            "count": 1,
             "next": None,
             "previous": None,
             "results": [
@@ -68,7 +71,6 @@ class TestLocationListAPI:
 
         assert resp.status_code == HTTPStatus.OK
         assert resp.json() == {
-            "count": 1,
             "next": None,
             "previous": None,
             "results": [
@@ -93,14 +95,37 @@ class TestLocationListAPI:
         assert resp.status_code == HTTPStatus.OK
         data = resp.json()
 
-        assert data["count"] == 21
-        assert data["next"] == "http://testserver/api/locations/?limit=20&offset=20"
+        assert data["next"].startswith("http://testserver/api/locations/?cursor=")
+        assert data["previous"] is None
         assert len(data["results"]) == 20
 
         # Check sorted by ID, we do not want to reveal info about the display names
         results_ids = [e["id"] for e in data["results"]]
         assert results_ids == sorted(results_ids)
 
+    def test_get_next_page(self, client: Client, user: User) -> None:
+        locations = LocationFactory.create_batch(size=5, created_by=user)
+        client.force_login(user)
+
+        first_page = client.get(self.url, {"limit": 3}).json()
+        second_page = client.get(first_page["next"]).json()
+        previous_page = client.get(second_page["previous"]).json()
+
+        assert [e["id"] for e in first_page["results"] + second_page["results"]] == sorted(
+            str(location.id) for location in locations
+        )
+        assert second_page["next"] is None
+        assert previous_page["results"] == first_page["results"]
+        assert previous_page["previous"] is None
+
+    def test_get_invalid_cursor(self, client: Client, user: User) -> None:
+        client.force_login(user)
+
+        resp = client.get(self.url, {"cursor": "foo"})
+
+        assert resp.status_code == HTTPStatus.NOT_FOUND
+        assert resp.json() == {"detail": "Invalid cursor"}
+
 
 @pytest.mark.django_db
 class TestLocationDetailAPI:
@@ -241,3 +266,77 @@ class TestLocationGeoJSONAPI:
                 }
             ],
         }
+
+
+@pytest.mark.django_db(transaction=True)
+class TestLocationGeoJSONConditionalRequests:
+    url = reverse_lazy("api:locations-geojson")
+
+    @pytest.fixture(autouse=True)
+    def _locmem_cache(self) -> Iterator[None]:
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def _capture(self, user: User, location: Location) -> None:
+        record_attempted_capture(
+            user.badges.get(),
+            location.hexpansion,
+            rand=b"1234567890",
+            hmac="a" * 64,
+            app_rev="0.0.0",
+            fw_rev="0.0.0",
+        )
+
+    def test_not_modified(self, client: Client, user: User) -> None:
+        # Arrange
+        self._capture(user, LocationFactory(created_by=user))
+        client.force_login(user)
+        etag = client.get(self.url).headers["ETag"]
+
+        # Act
+        resp = client.get(self.url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_modified_by_capture(self, client: Client, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user, coordinates=None)
+        CoordinatesFactory(lat=52, long=2, created_by=user, location=location)
+        client.force_login(user)
+        etag = client.get(self.url).headers["ETag"]
+        self._capture(user, location)
+
+        # Act
+        resp = client.get(self.url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        assert len(resp.json()["features"]) == 1
+
+    def test_not_modified_by_other_users_capture(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        client.force_login(user)
+        etag = client.get(self.url).headers["ETag"]
+        self._capture(user_2, location)
+
+        # Act
+        resp = client.get(self.url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_etag_is_per_user(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        client.force_login(user)
+        etag = client.get(self.url).headers["ETag"]
+        client.force_login(user_2)
+
+        # Act
+        resp = client.get(self.url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
@@ -0,0 +1,205 @@
+from collections.abc import Iterator
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.models import Leaderboard
+from gchqnet.quest.repository.rankings import set_scoreboard_entry
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def _create_players(scores: list[int]) -> list[User]:
+    users = []
+    for i, score in enumerate(scores):
+        user = User.objects.create(username=f"player-{i}", display_name=f"player {i:02}")
+        set_scoreboard_entry(user, current_score=score, capture_count=0)
+        users.append(user)
+    return users
+
+
+def _names(page: dict) -> list[str]:
+    return [row["display_name"] for row in page["results"]]
+
+
+@pytest.mark.django_db
+class TestGlobalScoreboardAPI:
+    url = reverse_lazy("api:quest_global_scoreboard")
+
+    def test_get(self, client: Client, user: User, superuser: User) -> None:
+        resp = client.get(self.url)
+
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json() == {
+            "next": None,
+            "previous": None,
+            "results": [
+                {"username": "foo-username", "display_name": "foo", "rank": 1, "capture_count": 0, "current_score": 0}
+            ],
+        }
+
+    def test_walk_pages(self, client: Client) -> None:
+        # Arrange
+        _create_players([10, 30, 10, 20, 0, 30, 10])
+
+        # Act
+        pages = [client.get(self.url, {"limit": 3}).json()]
+        while pages[-1]["next"]:
+            pages.append(client.get(pages[-1]["next"]).json())
+
+        # Assert
+        assert [_names(page) for page in pages] == [
+            ["player 01", "player 05", "player 03"],
+            ["player 00", "player 02", "player 06"],
+            ["player 04"],
+        ]
+        assert pages[0]["previous"] is None
+        assert client.get(pages[-1]["previous"]).json()["results"] == pages[1]["results"]
+
+    def test_pages_are_stable_when_scores_change(self, client: Client) -> None:
+        # Arrange
+        users = _create_players([50, 40, 30, 20, 10])
+        first_page = client.get(self.url, {"limit": 2}).json()
+
+        # Act
+        # A player that has already been seen moves below the cursor, and an unseen player moves above it.
+        set_scoreboard_entry(users[0], current_score=5, capture_count=0)
+        set_scoreboard_entry(users[3], current_score=100, capture_count=0)
+        second_page = client.get(first_page["next"]).json()
+
+        # Assert
+        assert _names(first_page) == ["player 00", "player 01"]
+        assert _names(second_page) == ["player 02", "player 04"]
+
+    def test_ordering(self, client: Client) -> None:
+        # Arrange
+        _create_players([10, 30, 20])
+
+        # Act
+        first_page = client.get(self.url, {"limit": 2, "ordering": "-display_name"}).json()
+        second_page = client.get(first_page["next"]).json()
+
+        # Assert
+        assert _names(first_page) + _names(second_page) == ["player 02", "player 01", "player 00"]
+
+    def test_deep_pages_do_not_use_offset(self, client: Client) -> None:
+        # Arrange
+        _create_players(list(range(0, 100, 5)))
+        page = client.get(self.url, {"limit": 5}).json()
+        for _ in range(2):
+            page = client.get(page["next"]).json()
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            client.get(page["next"])
+
+        # Assert
+        assert len(ctx.captured_queries) == 1
+        assert "OFFSET" not in ctx.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestScoreboardConditionalRequests:
+    global_url = reverse_lazy("api:quest_global_scoreboard")
+
+    @pytest.fixture(autouse=True)
+    def _locmem_cache(self) -> Iterator[None]:
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def _private_url(self, leaderboard: Leaderboard) -> str:
+        return reverse("api:quest_private_scoreboards-detail", args=[leaderboard.id])
+
+    def test_global_not_modified(self, client: Client, user: User) -> None:
+        # Arrange
+        etag = client.get(self.global_url).headers["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.get(self.global_url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_MODIFIED
+        assert len(ctx.captured_queries) == 0
+
+    def test_global_modified_by_score_change(self, client: Client, user: User) -> None:
+        # Arrange
+        first = client.get(self.global_url)
+        etag = first.headers["ETag"]
+        set_scoreboard_entry(user, current_score=10, capture_count=1)
+
+        # Act
+        resp = client.get(self.global_url, headers={"If-None-Match": etag})
+
+        # Assert
+        # Last-Modified has a precision of a second, so it would hide a change in the same second.
+        assert "Last-Modified" not in first.headers
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.headers["ETag"] != etag
+        assert resp.json()["results"][0]["current_score"] == 10
+
+    def test_private_not_modified(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
+        leaderboard.members.set([user])
+        client.force_login(user)
+        etag = client.get(self._private_url(leaderboard)).headers["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.get(self._private_url(leaderboard), headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_MODIFIED
+        assert not any("quest_leaderboard" in query["sql"] for query in ctx.captured_queries)
+
+    def test_private_modified_by_new_member(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
+        leaderboard.members.set([user])
+        client.force_login(user)
+        etag = client.get(self._private_url(leaderboard)).headers["ETag"]
+        leaderboard.members.add(user_2)
+
+        # Act
+        resp = client.get(self._private_url(leaderboard), headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        assert len(resp.json()["scores"]) == 2
+
+    def test_private_not_member(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
+        leaderboard.members.set([user])
+        client.force_login(user)
+        etag = client.get(self._private_url(leaderboard)).headers["ETag"]
+        client.force_login(user_2)
+
+        # Act
+        resp = client.get(self._private_url(leaderboard), headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_FOUND
+
+    def test_private_removed_member(self, client: Client, user: User, user_2: User) -> None:
+        # Arrange
+        leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
+        leaderboard.members.set([user, user_2])
+        client.force_login(user_2)
+        etag = client.get(self._private_url(leaderboard)).headers["ETag"]
+        leaderboard.members.remove(user_2)
+
+        # Act
+        resp = client.get(self._private_url(leaderboard), headers={"If-None-Match": etag})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse_lazy
+
+from gchqnet.accounts.models.user import User
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.repository.captures import record_attempted_capture
+
+
+@pytest.mark.django_db
+class TestPlayerCaptureStatsAPI:
+    url = reverse_lazy("api:quest_player_stats")
+
+    def test_get_not_admin(self, client: Client, user: User) -> None:
+        client.force_login(user)
+
+        resp = client.get(self.url)
+
+        assert resp.status_code == HTTPStatus.FORBIDDEN
+
+    def test_get(self, client: Client, user: User, user_2: User, superuser: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=superuser) for _ in range(2)]
+        badge = user.badges.get()
+        for location, validate_hmac in [(locations[0], False), (locations[0], False), (locations[1], True)]:
+            record_attempted_capture(
+                badge,
+                location.hexpansion,
+                rand=b"1234567890",
+                hmac="a" * 64,
+                app_rev="0.0.0",
+                fw_rev="0.0.0",
+                validate_hmac=validate_hmac,
+            )
+        client.force_login(superuser)
+
+        # Act
+        resp = client.get(self.url, {"search": "foo"})
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        results = resp.json()["results"]
+        assert [row["username"] for row in results] == [user.username, user_2.username]
+        assert {key: value for key, value in results[0].items() if key != "last_submission_at"} == {
+            "username": user.username,
+            "display_name": user.display_name,
+            "submission_count": 3,
+            "rejected_submission_count": 1,
+            "repeat_submission_count": 1,
+            "capture_count": 1,
+        }
+        assert results[0]["last_submission_at"] is not None
+        assert results[1]["submission_count"] == 0
+        assert results[1]["last_submission_at"] is None
@@ -0,0 +1,119 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models.user import User
+from gchqnet.achievements.models import BasicAchievement, BasicAchievementAwardType
+from gchqnet.achievements.repository import award_builtin_basic_achievement
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import ActivityEvent, ActivityEventKind
+from gchqnet.quest.models.location import Location
+from gchqnet.quest.repository import backfill_activity_events, get_recent_events_for_users
+from gchqnet.quest.repository.captures import record_attempted_capture
+from gchqnet.quest.repository.found_locations import get_found_locations
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def _capture(user: User, location: Location) -> None:
+    record_attempted_capture(
+        user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+    )
+
+
+@pytest.mark.django_db
+class TestActivityEvents:
+    def test_capture_creates_activity_event(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+
+        # Act
+        _capture(user, location)
+        _capture(user, location)
+
+        # Assert
+        event = ActivityEvent.objects.get(user=user)
+        assert event.type == ActivityEventKind.CAPTURE
+        assert event.location == location
+        assert event.target_name == location.display_name
+        assert event.difficulty == location.difficulty
+        assert event.created_at == event.score_record.capture_event.created_at
+
+    def test_basic_achievement_creates_activity_event(self, user: User) -> None:
+        # Arrange
+        achievement = BasicAchievement.objects.create(
+            display_name="Achievement", difficulty=20, award_type=BasicAchievementAwardType.INTERNAL
+        )
+
+        # Act
+        award_builtin_basic_achievement(achievement.id, user)
+
+        # Assert
+        event = ActivityEvent.objects.get(user=user)
+        assert event.type == ActivityEventKind.BASIC_ACHIEVEMENT
+        assert event.location is None
+        assert (event.target_name, event.difficulty) == ("Achievement", 20)
+
+    def test_backfill(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        for location in locations:
+            _capture(user, location)
+        expected = list(ActivityEvent.objects.filter(user=user).values_list("score_record", "type", "created_at"))
+        ActivityEvent.objects.all().delete()
+
+        # Act
+        created = backfill_activity_events()
+
+        # Assert
+        assert created == 3
+        actual = list(ActivityEvent.objects.filter(user=user).values_list("score_record", "type", "created_at"))
+        assert actual == expected
+        assert backfill_activity_events() == 0
+
+
+@pytest.mark.django_db
+class TestGetRecentEventsForUsers:
+    def test_all_users(self, user: User, user_2: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        _capture(user, locations[0])
+        _capture(user_2, locations[1])
+        _capture(user, locations[2])
+
+        # Act
+        with override_settings(CACHES=LOCMEM_CACHES):
+            cache.clear()
+            get_found_locations(user_2.id)
+            with CaptureQueriesContext(connection) as ctx:
+                events, user_found_locations = get_recent_events_for_users(None, current_user=user_2)
+            cache.clear()
+
+        # Assert
+        # The locations that the current user has found are read from the cache.
+        assert len(ctx.captured_queries) == 1
+        assert [(event["player_username"], event["location_id"]) for event in events] == [
+            (user.username, locations[2].id),
+            (user_2.username, locations[1].id),
+            (user.username, locations[0].id),
+        ]
+        assert user_found_locations == {locations[1].id}
+
+    def test_some_users(self, user: User, user_2: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        for location in locations:
+            _capture(user, location)
+        _capture(user_2, locations[0])
+
+        # Act
+        events, user_found_locations = get_recent_events_for_users(
+            User.objects.filter(id=user.id), current_user=AnonymousUser(), max_num=2
+        )
+
+        # Assert
+        assert [event["location_id"] for event in events] == [locations[2].id, locations[1].id]
+        assert user_found_locations == set()
@@ -0,0 +1,141 @@
+from collections.abc import Iterator
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models.user import User
+from gchqnet.hexpansion.factories import HexpansionFactory
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models.location import Location
+from gchqnet.quest.repository import found_locations as found_locations_module
+from gchqnet.quest.repository.captures import record_attempted_capture
+from gchqnet.quest.repository.found_locations import get_found_locations
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def _locmem_cache() -> Iterator[None]:
+    with override_settings(CACHES=LOCMEM_CACHES):
+        cache.clear()
+        yield
+        cache.clear()
+
+
+def _capture(user: User, location: Location) -> None:
+    record_attempted_capture(
+        user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+    )
+
+
+@pytest.mark.django_db
+class TestFoundLocations:
+    def test_bit_indexes_are_assigned(self, user: User) -> None:
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+
+        assert [location.bit_index for location in locations] == [1, 2, 3]
+
+    def test_bit_index_taken_while_creating(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory.build(created_by=user, hexpansion=HexpansionFactory())
+        LocationFactory(created_by=user, bit_index=location.bit_index)
+
+        # Act
+        location.save()
+
+        # Assert
+        assert location.bit_index == 2
+
+    def test_get_found_locations(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        _capture(user, locations[0])
+        _capture(user, locations[2])
+
+        # Act
+        found_locations = get_found_locations(user.id)
+
+        # Assert
+        assert locations[0].id in found_locations
+        assert locations[1].id not in found_locations
+        assert "not a location" not in found_locations
+        assert len(found_locations) == 2
+        assert found_locations.location_ids() == {locations[0].id, locations[2].id}
+        assert found_locations.unfound_location_ids() == {locations[1].id}
+        assert found_locations.filter([locations[0].id, locations[1].id]) == {locations[0].id}
+
+    def test_difference(self, user: User, user_2: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        _capture(user, locations[0])
+        _capture(user, locations[1])
+        _capture(user_2, locations[1])
+
+        # Act
+        difference = get_found_locations(user.id) - get_found_locations(user_2.id)
+
+        # Assert
+        assert difference.location_ids() == {locations[0].id}
+
+    def test_cached(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        _capture(user, location)
+        get_found_locations(user.id)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            found_locations = get_found_locations(user.id)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert location.id in found_locations
+
+    def test_capture_delete_invalidates(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        _capture(user, location)
+        get_found_locations(user.id)
+
+        # Act
+        user.capture_events.get().delete()
+
+        # Assert
+        assert location.id not in get_found_locations(user.id)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFoundLocationsOnCommit:
+    def test_capture_invalidates_cached_found_locations(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+        get_found_locations(user.id)
+
+        # Act
+        _capture(user, locations[1])
+
+        # Assert
+        assert get_found_locations(user.id).location_ids() == {locations[1].id}
+
+    def test_capture_while_rebuilding(self, user: User, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        build_bits = found_locations_module._build_bits
+
+        def build_bits_then_capture(user_id: int) -> int:
+            bits = build_bits(user_id)
+            _capture(user, location)
+            return bits
+
+        monkeypatch.setattr(found_locations_module, "_build_bits", build_bits_then_capture)
+        assert location.id not in get_found_locations(user.id)
+        monkeypatch.undo()
+
+        # Act
+        found_locations = get_found_locations(user.id)
+
+        # Assert
+        assert location.id in found_locations
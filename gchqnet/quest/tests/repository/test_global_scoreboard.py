@@ -30,18 +30,15 @@ def _generate_capture(user: User) -> Location:
     return location
 
 
-SCOREBOARD_FIELDS = ["id", "username", "display_name", "rank", "capture_count", "current_score"]
-
-
 @pytest.mark.django_db
 class TestGetGlobalScoreboard:
     @pytest.mark.usefixtures("superuser")
     def test_no_capture(self, user: User, user_2: User) -> None:
         scoreboard = get_global_scoreboard()
 
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == [
+        assert list(scoreboard) == [
             {
-                "id": user.id,
+                "user_id": user.id,
                 "username": user.username,
                 "display_name": user.display_name,
                 "rank": 1,
@@ -49,7 +46,7 @@ class TestGetGlobalScoreboard:
                 "current_score": 0,
             },
             {
-                "id": user_2.id,
+                "user_id": user_2.id,
                 "username": user_2.username,
                 "display_name": user_2.display_name,
                 "rank": 1,
@@ -63,9 +60,9 @@ class TestGetGlobalScoreboard:
 
         scoreboard = get_global_scoreboard()
 
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == [
+        assert list(scoreboard) == [
             {
-                "id": user.id,
+                "user_id": user.id,
                 "username": user.username,
                 "display_name": user.display_name,
                 "rank": 1,
@@ -73,7 +70,7 @@ class TestGetGlobalScoreboard:
                 "current_score": int(location.difficulty),
             },
             {
-                "id": user_2.id,
+                "user_id": user_2.id,
                 "username": user_2.username,
                 "display_name": user_2.display_name,
                 "rank": 2,
@@ -91,10 +88,10 @@ class TestGetGlobalScoreboard:
 
         scoreboard = get_global_scoreboard()
 
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == sorted(
+        assert list(scoreboard) == sorted(
             [
                 {
-                    "id": user.id,
+                    "user_id": user.id,
                     "username": user.username,
                     "display_name": user.display_name,
                     "rank": 1 if u1_score >= u2_score else 2,
@@ -102,7 +99,7 @@ class TestGetGlobalScoreboard:
                     "current_score": u1_score,
                 },
                 {
-                    "id": user_2.id,
+                    "user_id": user_2.id,
                     "username": user_2.username,
                     "display_name": user_2.display_name,
                     "rank": 1 if u2_score >= u1_score else 2,
@@ -120,16 +117,16 @@ class TestPrivateScoreboard:
     def test_no_members(self, user: User) -> None:
         leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
         scoreboard = get_private_scoreboard(leaderboard)
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == []
+        assert scoreboard == []
 
     @pytest.mark.usefixtures("superuser")
     def test_one_member(self, user: User) -> None:
         leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
         leaderboard.members.add(user)
         scoreboard = get_private_scoreboard(leaderboard)
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == [
+        assert scoreboard == [
             {
-                "id": user.id,
+                "user_id": user.id,
                 "username": user.username,
                 "display_name": user.display_name,
                 "rank": 1,
@@ -143,9 +140,9 @@ class TestPrivateScoreboard:
         leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
         leaderboard.members.set([user, superuser])
         scoreboard = get_private_scoreboard(leaderboard)
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == [
+        assert scoreboard == [
             {
-                "id": user.id,
+                "user_id": user.id,
                 "username": user.username,
                 "display_name": user.display_name,
                 "rank": 1,
@@ -153,7 +150,7 @@ class TestPrivateScoreboard:
                 "current_score": 0,
             },
             {
-                "id": superuser.id,
+                "user_id": superuser.id,
                 "username": superuser.username,
                 "display_name": superuser.display_name,
                 "rank": 1,
@@ -170,9 +167,9 @@ class TestPrivateScoreboard:
         location = _generate_capture(user)
 
         scoreboard = get_private_scoreboard(leaderboard)
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == [
+        assert scoreboard == [
             {
-                "id": user.id,
+                "user_id": user.id,
                 "username": user.username,
                 "display_name": user.display_name,
                 "rank": 1,
@@ -180,7 +177,7 @@ class TestPrivateScoreboard:
                 "current_score": int(location.difficulty),
             },
             {
-                "id": superuser.id,
+                "user_id": superuser.id,
                 "username": superuser.username,
                 "display_name": superuser.display_name,
                 "rank": 2,
@@ -200,10 +197,10 @@ class TestPrivateScoreboard:
         u2_score = sum(lo.difficulty for lo in u2_locations)
 
         scoreboard = get_private_scoreboard(leaderboard)
-        assert list(scoreboard.values(*SCOREBOARD_FIELDS)) == sorted(
+        assert scoreboard == sorted(
             [
                 {
-                    "id": user.id,
+                    "user_id": user.id,
                     "username": user.username,
                     "display_name": user.display_name,
                     "rank": 1 if u1_score >= u2_score else 2,
@@ -211,7 +208,7 @@ class TestPrivateScoreboard:
                     "current_score": u1_score,
                 },
                 {
-                    "id": superuser.id,
+                    "user_id": superuser.id,
                     "username": superuser.username,
                     "display_name": superuser.display_name,
                     "rank": 1 if u2_score >= u1_score else 2,
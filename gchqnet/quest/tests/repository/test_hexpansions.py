@@ -0,0 +1,93 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models.user import User
+from gchqnet.hexpansion.factories import HexpansionFactory
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models.location import Location, LocationDifficulty
+from gchqnet.quest.repository.hexpansions import get_hexpansion_by_serial_number, get_hexpansions_by_serial_number
+
+
+@pytest.mark.django_db
+class TestGetHexpansionBySerialNumber:
+    def test_installed_hexpansion(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        get_hexpansion_by_serial_number(location.hexpansion.serial_number)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            hexpansion = get_hexpansion_by_serial_number(location.hexpansion.serial_number)
+            assert hexpansion is not None
+            result = (hexpansion.id, hexpansion.human_identifier, hexpansion.location.id)
+            details = (hexpansion.location.display_name, hexpansion.location.difficulty)
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert result == (location.hexpansion.id, location.hexpansion.human_identifier, location.id)
+        assert details == (location.display_name, location.difficulty)
+
+    def test_uninstalled_hexpansion(self, user: User) -> None:
+        # Arrange
+        expected = HexpansionFactory(created_by=user)
+        get_hexpansion_by_serial_number(expected.serial_number)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            hexpansion = get_hexpansion_by_serial_number(expected.serial_number)
+            assert hexpansion is not None
+            with pytest.raises(Location.DoesNotExist):
+                hexpansion.location  # noqa: B018
+
+        # Assert
+        assert len(ctx.captured_queries) == 0
+        assert hexpansion.id == expected.id
+
+    def test_unknown_serial_number(self) -> None:
+        assert get_hexpansion_by_serial_number(uuid.uuid4()) is None
+
+    def test_rebuilt_when_location_changes(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user, difficulty=LocationDifficulty.EASY)
+        get_hexpansion_by_serial_number(location.hexpansion.serial_number)
+
+        # Act
+        location.difficulty = LocationDifficulty.HARD
+        location.save()
+        hexpansion = get_hexpansion_by_serial_number(location.hexpansion.serial_number)
+
+        # Assert
+        assert hexpansion is not None
+        assert hexpansion.location.difficulty == LocationDifficulty.HARD
+
+    def test_rebuilt_when_location_deployed(self, user: User) -> None:
+        # Arrange
+        hexpansion = HexpansionFactory(created_by=user)
+        get_hexpansion_by_serial_number(hexpansion.serial_number)
+
+        # Act
+        location = LocationFactory(created_by=user, hexpansion=hexpansion)
+        result = get_hexpansion_by_serial_number(hexpansion.serial_number)
+
+        # Assert
+        assert result is not None
+        assert result.location.id == location.id
+
+
+@pytest.mark.django_db
+class TestGetHexpansionsBySerialNumber:
+    def test_found_and_missing(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        missing = uuid.uuid4()
+
+        # Act
+        hexpansions = get_hexpansions_by_serial_number([loc.hexpansion.serial_number for loc in locations] + [missing])
+
+        # Assert
+        assert {serial: hexpansion.id for serial, hexpansion in hexpansions.items()} == {
+            location.hexpansion.serial_number: location.hexpansion.id for location in locations
+        }
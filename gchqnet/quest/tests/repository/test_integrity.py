@@ -0,0 +1,202 @@
+import pytest
+from django.core.management import call_command
+
+from gchqnet.accounts.models.user import User
+from gchqnet.achievements.models import (
+    BasicAchievement,
+    BasicAchievementAwardType,
+    BasicAchievementEvent,
+    LocationGroup,
+    LocationGroupProgress,
+)
+from gchqnet.achievements.repository import award_builtin_basic_achievement
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import CaptureEvent, ScoreboardEntry, ScoreRecord, UserScore
+from gchqnet.quest.models.location import Location
+from gchqnet.quest.repository import record_attempted_capture
+from gchqnet.quest.repository.integrity import check_integrity
+from gchqnet.quest.repository.rankings import get_ranked_entries
+
+
+def _capture(user: User, location: Location) -> None:
+    record_attempted_capture(
+        user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+    )
+
+
+def _found(results: list) -> dict[str, int]:
+    return {result["name"]: result["found"] for result in results if result["found"]}
+
+
+@pytest.mark.django_db
+class TestCheckIntegrity:
+    def test_no_issues(self, user: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {}
+
+    def test_missing_score_record(self, user: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        ScoreRecord.objects.all().delete()
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"missing_capture_event_score_records": 1, "activity_events": 1}
+        score_record = ScoreRecord.objects.get()
+        assert (score_record.user, score_record.score) == (user, 10)
+        assert score_record.capture_event == CaptureEvent.objects.get()
+        assert score_record.activity_event
+        assert UserScore.objects.get(user=user).current_score == 10
+
+    def test_missing_achievement_score_record(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user_2, LocationFactory(created_by=user, difficulty=10))
+        achievement = BasicAchievement.objects.create(
+            display_name="Achievement", difficulty=20, award_type=BasicAchievementAwardType.INTERNAL
+        )
+        award_builtin_basic_achievement(achievement.id, user)
+        ScoreRecord.objects.filter(basic_achievement_event__isnull=False).delete()
+
+        # Act
+        check_integrity()
+
+        # Assert
+        score_record = ScoreRecord.objects.get(basic_achievement_event=BasicAchievementEvent.objects.get())
+        assert (score_record.user, score_record.score) == (user, 20)
+
+    def test_wrong_scores(self, user: User) -> None:
+        # Arrange
+        for difficulty in [10, 20, 30]:
+            _capture(user, LocationFactory(created_by=user, difficulty=difficulty))
+        ScoreRecord.objects.update(score=1)
+        UserScore.objects.filter(user=user).update(current_score=3)
+
+        # Act
+        results = check_integrity(chunk_size=2)
+
+        # Assert
+        assert _found(results) == {"capture_event_score_records": 3, "user_scores": 1}
+        assert sorted(ScoreRecord.objects.values_list("score", flat=True)) == [10, 20, 30]
+        assert UserScore.objects.get(user=user).current_score == 60
+
+    def test_wrong_capture_player(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        CaptureEvent.objects.update(created_by=user_2)
+        ScoreRecord.objects.update(user=user_2)
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"capture_players": 1, "capture_event_score_records": 1}
+        assert CaptureEvent.objects.get().created_by == user
+        assert ScoreRecord.objects.get().user == user
+        assert UserScore.objects.get(user=user).current_score == 10
+
+    def test_missing_user_score(self, user: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        UserScore.objects.all().delete()
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"missing_user_scores": 1}
+        assert UserScore.objects.get(user=user).current_score == 10
+
+    def test_wrong_user_score_moves_scoreboard_entry(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        _capture(user_2, LocationFactory(created_by=user, difficulty=20))
+        UserScore.objects.filter(user=user).update(current_score=30)
+        ScoreboardEntry.objects.filter(user=user).update(current_score=30)
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"user_scores": 1}
+        entries = get_ranked_entries().filter(user__in=[user, user_2])
+        assert list(entries.values_list("user", "current_score", "rank")) == [(user_2.id, 20, 1), (user.id, 10, 2)]
+
+    def test_wrong_scoreboard_entry(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        ScoreboardEntry.objects.filter(user=user).update(current_score=50, capture_count=3)
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"scoreboard_entries": 1}
+        entry = ScoreboardEntry.objects.get(user=user)
+        assert (entry.current_score, entry.capture_count) == (10, 1)
+
+    def test_missing_scoreboard_entry(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        ScoreboardEntry.objects.filter(user=user).delete()
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"missing_scoreboard_entries": 1}
+        entries = get_ranked_entries().filter(user__in=[user, user_2])
+        assert list(entries.values_list("user", "current_score", "rank")) == [(user.id, 10, 1), (user_2.id, 0, 2)]
+
+    def test_location_group_progress(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+        group = LocationGroup.objects.create(display_name="group", difficulty=10, created_by=user)
+        group.locations.set(locations)
+        _capture(user, locations[0])
+        LocationGroupProgress.objects.all().delete()
+
+        # Act
+        results = check_integrity()
+
+        # Assert
+        assert _found(results) == {"location_group_progress": 1}
+        progress = LocationGroupProgress.objects.get()
+        assert (progress.user, progress.found_count, progress.total) == (user, 1, 2)
+
+    def test_dry_run(self, user: User) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        ScoreRecord.objects.update(score=1)
+
+        # Act
+        results = check_integrity(dry_run=True)
+
+        # Assert
+        assert _found(results) == {"capture_event_score_records": 1, "user_scores": 1}
+        assert results[5]["sample"] == [f"{ScoreRecord.objects.get().id}: 1 should be 10"]
+        assert all(result["fixed"] == 0 for result in results)
+        assert ScoreRecord.objects.get().score == 1
+
+    def test_command(self, user: User, capsys: pytest.CaptureFixture[str]) -> None:
+        # Arrange
+        _capture(user, LocationFactory(created_by=user, difficulty=10))
+        UserScore.objects.filter(user=user).update(current_score=5)
+
+        # Act
+        call_command("check_integrity")
+
+        # Assert
+        out = capsys.readouterr().out
+        assert "Player scores that are not the total of their score records: 1 found, 1 fixed" in out
+        assert f"{UserScore.objects.get(user=user).id}: 5 should be 10" in out
+        assert "Found 1 issues in 15 checks" in out
+        assert UserScore.objects.get(user=user).current_score == 10
+        assert ScoreboardEntry.objects.get(user=user).current_score == 10
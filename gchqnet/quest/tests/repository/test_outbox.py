@@ -0,0 +1,104 @@
+from collections.abc import Iterator
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models.user import User
+from gchqnet.achievements.models import LocationGroup
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import CaptureEvent, OutboxTask, OutboxTaskKind
+from gchqnet.quest.repository import record_attempted_capture
+from gchqnet.quest.repository.outbox import enqueue_task, process_outbox
+
+
+@pytest.fixture(autouse=True)
+def _deferred_outbox() -> Iterator[None]:
+    with override_settings(OUTBOX_ALWAYS_EAGER=False):
+        yield
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    def test_capture_defers_side_effects(self, user: User) -> None:
+        location = LocationFactory(created_by=user)
+        group = LocationGroup.objects.create(display_name="group", difficulty=10, created_by=user)
+        group.locations.add(location)
+
+        with CaptureQueriesContext(connection) as ctx:
+            record_attempted_capture(
+                user.badges.first(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+            )
+
+        assert sum('INSERT INTO "quest_outboxtask"' in query["sql"] for query in ctx.captured_queries) == 1
+        assert CaptureEvent.objects.filter(created_by=user, location=location).exists()
+        assert not user.notifications.exists()
+        assert set(OutboxTask.objects.values_list("kind", flat=True)) == {
+            OutboxTaskKind.CAPTURE_NOTIFICATION,
+            OutboxTaskKind.LOCATION_GROUPS,
+        }
+
+        assert process_outbox() == 2
+
+        assert user.notifications.filter(verb="captured").count() == 1
+        assert user.notifications.filter(verb="found your first location in").count() == 1
+        assert not OutboxTask.objects.filter(processed_at__isnull=True).exists()
+
+    def test_group_started_before_tasks_processed(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        group = LocationGroup.objects.create(display_name="group", difficulty=10, created_by=user)
+        group.locations.set(locations)
+
+        # Act
+        for location in locations[:2]:
+            record_attempted_capture(
+                user.badges.first(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+            )
+        process_outbox()
+
+        # Assert
+        assert user.notifications.filter(verb="found your first location in").count() == 1
+
+    def test_repeat_capture_does_not_enqueue(self, user: User) -> None:
+        location = LocationFactory(created_by=user)
+
+        for _ in range(2):
+            record_attempted_capture(
+                user.badges.first(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="1", fw_rev="1"
+            )
+
+        assert OutboxTask.objects.count() == 2
+
+    def test_process_in_batches(self, user: User) -> None:
+        location = LocationFactory(created_by=user)
+        for _ in range(5):
+            enqueue_task(OutboxTaskKind.CAPTURE_NOTIFICATION, user_id=user.id, location_id=str(location.id))
+
+        assert process_outbox(batch_size=2) == 2
+        assert process_outbox(batch_size=2) == 2
+        assert process_outbox(batch_size=2) == 1
+        assert process_outbox(batch_size=2) == 0
+        assert user.notifications.count() == 5
+
+    def test_failed_task_is_retried(self, user: User) -> None:
+        enqueue_task(OutboxTaskKind.CAPTURE_NOTIFICATION, user_id=user.id, location_id="not-a-location")
+
+        for _ in range(OutboxTask.MAX_ATTEMPTS):
+            assert process_outbox() == 1
+        assert process_outbox() == 0
+
+        task = OutboxTask.objects.get()
+        assert task.processed_at is None
+        assert task.attempts == OutboxTask.MAX_ATTEMPTS
+        assert task.last_error
+
+    def test_eager(self, user: User) -> None:
+        location = LocationFactory(created_by=user)
+
+        with override_settings(OUTBOX_ALWAYS_EAGER=True):
+            enqueue_task(OutboxTaskKind.CAPTURE_NOTIFICATION, user_id=user.id, location_id=str(location.id))
+
+        assert not OutboxTask.objects.exists()
+        assert user.notifications.count() == 1
@@ -0,0 +1,171 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection, connections
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import ScoreboardEntry
+from gchqnet.quest.repository import rebuild_scoreboard, record_attempted_capture
+from gchqnet.quest.repository.rankings import get_ranked_entries, increment_scoreboard_entry
+
+
+def _capture(user: User, difficulty: int) -> None:
+    location = LocationFactory(created_by=user, difficulty=difficulty)
+    badge = user.badges.first()
+    assert badge
+
+    record_attempted_capture(badge, location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0")
+
+
+def _ranks(*users: User) -> dict[str, tuple[int, int, int]]:
+    return {
+        entry.username: (entry.rank, entry.current_score, entry.capture_count)
+        for entry in get_ranked_entries().filter(user__in=users)
+    }
+
+
+@pytest.mark.django_db
+class TestScoreboardEntry:
+    def test_entry_created_for_new_user(self, user: User) -> None:
+        entry = get_ranked_entries().get(user=user)
+
+        assert entry.username == user.username
+        assert entry.display_name == user.display_name
+        assert entry.rank == 1
+
+    def test_no_entry_for_superuser(self, superuser: User) -> None:
+        assert not ScoreboardEntry.objects.filter(user=superuser).exists()
+
+    def test_promoting_to_superuser_removes_entry(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, 10)
+
+        # Act
+        user.is_superuser = True
+        user.email = "foo@example.com"
+        user.save()
+
+        # Assert
+        assert _ranks(user, user_2) == {user_2.username: (1, 0, 0)}
+
+    def test_display_name_change_is_synced(self, user: User) -> None:
+        user.display_name = "bar"
+        user.save(update_fields=["display_name"])
+
+        assert ScoreboardEntry.objects.get(user=user).display_name == "bar"
+
+    def test_capture_updates_ranks(self, user: User, user_2: User) -> None:
+        # Act
+        _capture(user, 10)
+
+        # Assert
+        assert _ranks(user, user_2) == {
+            user.username: (1, 10, 1),
+            user_2.username: (2, 0, 0),
+        }
+
+    def test_equal_scores_share_rank(self, user: User, user_2: User) -> None:
+        # Act
+        _capture(user, 10)
+        _capture(user_2, 10)
+
+        # Assert
+        assert _ranks(user, user_2) == {
+            user.username: (1, 10, 1),
+            user_2.username: (1, 10, 1),
+        }
+
+    def test_overtaking(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, 10)
+        _capture(user_2, 10)
+
+        # Act
+        _capture(user_2, 20)
+
+        # Assert
+        assert _ranks(user, user_2) == {
+            user.username: (2, 10, 1),
+            user_2.username: (1, 30, 2),
+        }
+
+    def test_deleting_entry_closes_rank_gap(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, 10)
+        assert get_ranked_entries().get(user=user_2).rank == 2
+
+        # Act
+        ScoreboardEntry.objects.get(user=user).delete()
+
+        # Assert
+        assert _ranks(user, user_2) == {user_2.username: (1, 0, 0)}
+
+
+@pytest.mark.django_db
+class TestRebuildScoreboard:
+    def test_rebuild_reconciles_drift(self, user: User, user_2: User) -> None:
+        # Arrange
+        _capture(user, 10)
+        ScoreboardEntry.objects.all().update(current_score=1000, capture_count=3)
+
+        # Act
+        count = rebuild_scoreboard()
+
+        # Assert
+        assert count == User.objects.filter(is_superuser=False).count()
+        assert _ranks(user, user_2) == {
+            user.username: (1, 10, 1),
+            user_2.username: (2, 0, 0),
+        }
+
+    def test_rebuild_creates_missing_entries(self, user: User) -> None:
+        # Arrange
+        ScoreboardEntry.objects.all().delete()
+
+        # Act
+        rebuild_scoreboard()
+
+        # Assert
+        assert _ranks(user) == {user.username: (1, 0, 0)}
+
+    @pytest.mark.usefixtures("user")
+    def test_rebuild_removes_superusers(self, superuser: User) -> None:
+        # Arrange
+        ScoreboardEntry.objects.create(user=superuser, username=superuser.username, display_name="x")
+
+        # Act
+        rebuild_scoreboard()
+
+        # Assert
+        assert not ScoreboardEntry.objects.filter(user=superuser).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor == "sqlite", reason="SQLite only allows one transaction to write at a time")
+class TestConcurrentMoves:
+    def test_interleaved_moves(self, user: User, user_2: User) -> None:
+        # Arrange
+        user_3 = User.objects.create(username="foo3-username", display_name="foo3")
+        ScoreboardEntry.objects.filter(user__in=[user, user_2]).update(current_score=10)
+        barrier = threading.Barrier(2)
+
+        def move(player: User) -> None:
+            try:
+                barrier.wait()
+                increment_scoreboard_entry(player, score_delta=10)
+            finally:
+                connections.close_all()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(move, player) for player in [user, user_2]]:
+                future.result()
+
+        # Assert
+        assert _ranks(user, user_2, user_3) == {
+            user.username: (1, 20, 0),
+            user_2.username: (1, 20, 0),
+            user_3.username: (2, 0, 0),
+        }
@@ -1,11 +1,18 @@
+import uuid
+from typing import Any
+
 import pytest
+from django.db.models.signals import post_save
+from prometheus_client import REGISTRY
 
 from gchqnet.accounts.models.user import User
+from gchqnet.core.timing import PipelineTimer
 from gchqnet.hexpansion.factories import HexpansionFactory
 from gchqnet.quest.factories import LocationFactory
-from gchqnet.quest.models import CaptureEvent, CaptureLog, RawCaptureEvent
+from gchqnet.quest.models import CaptureEvent, CaptureLog, RawCaptureEvent, ScoreRecord, UserScore
 from gchqnet.quest.models.location import LocationDifficulty
-from gchqnet.quest.repository import record_attempted_capture
+from gchqnet.quest.repository import record_attempted_capture, record_attempted_captures
+from gchqnet.quest.repository.captures import CaptureProof
 
 
 @pytest.mark.django_db
@@ -82,6 +89,126 @@ class TestRecordAttemptedCapture:
         event_count = CaptureEvent.objects.filter(created_by=user, location=location).count()
         assert event_count == 1
 
+    def test_repeat_capture_does_not_score_twice(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        badge = user.badges.first()
+
+        # Act
+        for _ in range(3):
+            record_attempted_capture(
+                badge,
+                location.hexpansion,
+                rand=b"1234567890",
+                hmac="a" * 64,
+                app_rev="0.0.0",
+                fw_rev="0.0.0",
+            )
+
+        # Assert
+        score_record = ScoreRecord.objects.get(user=user)
+        assert score_record.capture_event == CaptureEvent.objects.get(created_by=user, location=location)
+        assert score_record.score == location.difficulty
+        assert UserScore.objects.get(user=user).current_score == location.difficulty
+
+    def test_timer_records_stages(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        badge = user.badges.first()
+        timer = PipelineTimer("capture")
+        repeat_timer = PipelineTimer("capture")
+
+        # Act
+        record_attempted_capture(
+            badge,
+            location.hexpansion,
+            rand=b"1234567890",
+            hmac="a" * 64,
+            app_rev="0.0.0",
+            fw_rev="0.0.0",
+            timer=timer,
+        )
+        record_attempted_capture(
+            badge,
+            location.hexpansion,
+            rand=b"1234567890",
+            hmac="a" * 64,
+            app_rev="0.0.0",
+            fw_rev="0.0.0",
+            timer=repeat_timer,
+        )
+
+        # Assert
+        assert list(timer.stages) == [
+            "raw_capture",
+            "location",
+            "verify",
+            "capture_log",
+            "capture_event",
+            "score",
+            "group_progress",
+            "side_effects",
+        ]
+        assert timer.stages["capture_event"]["queries"] == 1
+        assert timer.stages["group_progress"]["queries"] == 1
+        assert timer.stages["verify"]["queries"] == 0
+        assert list(repeat_timer.stages) == ["raw_capture", "location", "verify", "capture_log", "capture_event"]
+        assert repeat_timer.total_queries < timer.total_queries
+
+    def test_metrics(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        badge = user.badges.first()
+
+        def _sample(name: str, labels: dict[str, str]) -> float:
+            return REGISTRY.get_sample_value(name, labels) or 0
+
+        captured = _sample("gchqnet_capture_submissions_total", {"outcome": "captured"})
+        repeat = _sample("gchqnet_capture_submissions_total", {"outcome": "repeat"})
+        score_labels = {"pipeline": "capture", "stage": "score"}
+        score_stage = _sample("gchqnet_pipeline_stage_duration_seconds_count", score_labels)
+        inserts = _sample("django_model_inserts_total", {"model": "capture_event"})
+
+        # Act
+        for _ in range(2):
+            record_attempted_capture(
+                badge,
+                location.hexpansion,
+                rand=b"1234567890",
+                hmac="a" * 64,
+                app_rev="0.0.0",
+                fw_rev="0.0.0",
+            )
+
+        # Assert
+        assert _sample("gchqnet_capture_submissions_total", {"outcome": "captured"}) == captured + 1
+        assert _sample("gchqnet_capture_submissions_total", {"outcome": "repeat"}) == repeat + 1
+        assert _sample("gchqnet_pipeline_stage_duration_seconds_count", score_labels) == score_stage + 1
+        assert _sample("django_model_inserts_total", {"model": "capture_event"}) == inserts + 2
+
+    def test_post_save_sent_for_new_capture(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        badge = user.badges.first()
+        saved = []
+
+        def receiver(sender: type[CaptureEvent], instance: CaptureEvent, created: bool, **kwargs: Any) -> None:  # noqa: FBT001
+            saved.append((instance, created))
+
+        post_save.connect(receiver, sender=CaptureEvent)
+
+        # Act
+        try:
+            for _ in range(2):
+                record_attempted_capture(
+                    badge, location.hexpansion, rand=b"1234567890", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+                )
+        finally:
+            post_save.disconnect(receiver, sender=CaptureEvent)
+
+        # Assert
+        assert saved == [(CaptureEvent.objects.get(), True)]
+
     # def test_first_capture(self, user: User, user_2: User) -> None:
     #     # Arrange
     #     location = LocationFactory(created_by=user)
@@ -130,3 +257,77 @@ class TestRecordAttemptedCapture:
 
         rce_count = RawCaptureEvent.objects.filter(badge=badge, hexpansion=hexpansion).count()
         assert rce_count == 1
+
+
+@pytest.mark.django_db
+class TestRecordAttemptedCaptures:
+    def test_results_in_order(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(3)]
+        uninstalled = HexpansionFactory(created_by=user)
+        badge = user.badges.first()
+        assert badge
+        proofs = [
+            CaptureProof(serial_number=location.hexpansion.serial_number, rand=b"1234567890", hmac="a" * 64)
+            for location in [*locations, locations[0]]
+        ]
+        proofs.insert(1, CaptureProof(serial_number=uuid.uuid4(), rand=b"1234567890", hmac="a" * 64))
+        proofs.append(CaptureProof(serial_number=uninstalled.serial_number, rand=b"1234567890", hmac="a" * 64))
+
+        # Act
+        results = record_attempted_captures(badge, proofs, app_rev="0.0.0", fw_rev="0.0.0")
+
+        # Assert
+        assert [(result["result"], result.get("repeat")) for result in results] == [
+            ("success", False),
+            ("fail", None),
+            ("success", False),
+            ("success", False),
+            ("success", True),
+            ("fail", None),
+        ]
+        assert results[1] == {"result": "fail", "message": "Unable to find that hexpansion"}
+        assert results[5] == {"result": "fail", "message": "Hexpansion not installed"}
+        assert CaptureEvent.objects.filter(created_by=user).count() == 3
+        assert UserScore.objects.get(user=user).current_score == sum(location.difficulty for location in locations)
+
+    def test_invalid_hmac(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        badge = user.badges.first()
+        assert badge
+
+        # Act
+        results = record_attempted_captures(
+            badge,
+            [CaptureProof(serial_number=location.hexpansion.serial_number, rand=b"1234567890", hmac="a" * 64)],
+            app_rev="0.0.0",
+            fw_rev="0.0.0",
+            validate_hmac=True,
+        )
+
+        # Assert
+        assert results == [{"result": "fail", "message": "Invalid HMAC - Contact Support"}]
+        assert not CaptureEvent.objects.filter(created_by=user).exists()
+
+    def test_hexpansions_fetched_in_one_query(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(5)]
+        badge = user.badges.first()
+        assert badge
+        proofs = [
+            CaptureProof(serial_number=location.hexpansion.serial_number, rand=b"1234567890", hmac="a" * 64)
+            for location in locations
+        ]
+        cold_timer = PipelineTimer("capture_batch")
+        warm_timer = PipelineTimer("capture_batch")
+
+        # Act
+        record_attempted_captures(badge, proofs, app_rev="0.0.0", fw_rev="0.0.0", timer=cold_timer)
+        record_attempted_captures(badge, proofs, app_rev="0.0.0", fw_rev="0.0.0", timer=warm_timer)
+
+        # Assert
+        assert cold_timer.stages["hexpansions"]["queries"] == 1
+        assert warm_timer.stages["hexpansions"]["queries"] == 0
+        assert cold_timer.stages["location"]["queries"] == 0
+        assert cold_timer.stages["verify"]["queries"] == 0
@@ -0,0 +1,57 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models.user import User
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import ScoreRecord, UserScore
+from gchqnet.quest.repository import record_attempted_capture
+from gchqnet.quest.repository.scores import increment_score_for_user, update_score_for_user
+
+
+def _capture(user: User, difficulty: int) -> None:
+    location = LocationFactory(created_by=user, difficulty=difficulty)
+    badge = user.badges.first()
+    assert badge
+
+    record_attempted_capture(badge, location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0")
+
+
+@pytest.mark.django_db
+class TestIncrementalScore:
+    def test_no_score_records(self, user: User) -> None:
+        assert update_score_for_user(user) == 0
+
+    def test_new_player_has_user_score(self, user: User) -> None:
+        assert UserScore.objects.get(user=user).current_score == 0
+
+    def test_first_capture_increments_user_score(self, user: User) -> None:
+        with CaptureQueriesContext(connection) as ctx:
+            _capture(user, 10)
+
+        assert UserScore.objects.get(user=user).current_score == 10
+        assert not any("SUM(" in query["sql"] for query in ctx.captured_queries)
+
+    def test_captures_increment_user_score(self, user: User) -> None:
+        _capture(user, 10)
+        _capture(user, 20)
+        _capture(user, 50)
+
+        assert UserScore.objects.get(user=user).current_score == 80
+
+    def test_increment_without_user_score_recalculates(self, user: User) -> None:
+        _capture(user, 15)
+        UserScore.objects.filter(user=user).delete()
+
+        increment_score_for_user(user, 15)
+
+        assert UserScore.objects.get(user=user).current_score == 15
+
+    def test_update_score_reconciles_drift(self, user: User) -> None:
+        _capture(user, 10)
+        _capture(user, 30)
+        UserScore.objects.filter(user=user).update(current_score=1000)
+
+        assert update_score_for_user(user) == 40
+        assert UserScore.objects.get(user=user).current_score == 40
+        assert ScoreRecord.objects.filter(user=user).count() == 2
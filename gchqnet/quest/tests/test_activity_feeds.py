@@ -0,0 +1,134 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.activity_feeds import ActivityFeedEntry, get_activity_feed_backend
+from gchqnet.quest.activity_feeds.memory import MemoryActivityFeedBackend
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models.activity import ActivityEvent
+from gchqnet.quest.repository import get_recent_events_for_users, record_attempted_capture
+from gchqnet.quest.repository.found_locations import get_found_locations
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+MEMORY_BACKEND = {"BACKEND": "gchqnet.quest.activity_feeds.memory.MemoryActivityFeedBackend"}
+FAILING_BACKEND = {"BACKEND": "gchqnet.quest.tests.test_activity_feeds.FailingActivityFeedBackend"}
+
+
+class FailingActivityFeedBackend(MemoryActivityFeedBackend):
+    def append(self, entry: ActivityFeedEntry) -> None:
+        raise ConnectionError("The activity feed backend is unavailable")
+
+
+def _entry(i: int) -> ActivityFeedEntry:
+    return ActivityFeedEntry(
+        player_username=f"user-{i}",
+        player_name=f"User {i}",
+        type="capture",
+        location_id=UUID(int=i),
+        target_name=f"location-{i}",
+        difficulty=10,
+        created_at=datetime(2024, 5, 30, tzinfo=UTC) + timedelta(minutes=i),
+    )
+
+
+class TestMemoryActivityFeedBackend:
+    def test_append_newest_first(self) -> None:
+        backend = MemoryActivityFeedBackend()
+
+        for i in range(3):
+            backend.append(_entry(i))
+
+        assert backend.get_recent(2) == [_entry(2), _entry(1)]
+
+    def test_append_drops_oldest(self) -> None:
+        backend = MemoryActivityFeedBackend(max_length=3)
+
+        for i in range(5):
+            backend.append(_entry(i))
+
+        assert backend.get_recent(10) == [_entry(4), _entry(3), _entry(2)]
+
+    def test_replace(self) -> None:
+        backend = MemoryActivityFeedBackend(max_length=2)
+        backend.append(_entry(0))
+
+        backend.replace([_entry(3), _entry(2), _entry(1)])
+
+        assert backend.get_recent(10) == [_entry(3), _entry(2)]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMemoryBackendActivityFeed:
+    @pytest.fixture(autouse=True)
+    def _memory_backend(self) -> Iterator[None]:
+        with override_settings(ACTIVITY_FEED_BACKEND=MEMORY_BACKEND, CACHES=LOCMEM_CACHES):
+            cache.clear()
+            yield
+            cache.clear()
+
+    def test_captures_are_sent_to_backend(self, user: User) -> None:
+        # Arrange
+        locations = [LocationFactory(created_by=user) for _ in range(2)]
+
+        # Act
+        for location in locations:
+            record_attempted_capture(
+                user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+            )
+
+        # Assert
+        get_found_locations(user.id)
+        with CaptureQueriesContext(connection) as ctx:
+            events, _ = get_recent_events_for_users(None, current_user=user)
+        # The events and the locations that the current user has found are both read from the cache.
+        assert len(ctx.captured_queries) == 0
+        assert [(event["player_username"], event["location_id"]) for event in events] == [
+            (user.username, locations[1].id),
+            (user.username, locations[0].id),
+        ]
+
+    def test_backfill_command(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+        record_attempted_capture(
+            user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+        )
+        get_activity_feed_backend().replace([])
+
+        # Act
+        call_command("backfill_activity_feed")
+
+        # Assert
+        events = get_activity_feed_backend().get_recent(20)
+        assert [(event["player_name"], event["target_name"]) for event in events] == [
+            (user.display_name, location.display_name)
+        ]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFailingActivityFeedBackend:
+    @pytest.fixture(autouse=True)
+    def _failing_backend(self) -> Iterator[None]:
+        with override_settings(ACTIVITY_FEED_BACKEND=FAILING_BACKEND):
+            yield
+
+    def test_capture_is_committed(self, user: User) -> None:
+        # Arrange
+        location = LocationFactory(created_by=user)
+
+        # Act
+        result = record_attempted_capture(
+            user.badges.get(), location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0"
+        )
+
+        # Assert
+        assert result["result"] == "success"
+        assert ActivityEvent.objects.filter(user=user).exists()
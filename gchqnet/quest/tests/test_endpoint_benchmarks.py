@@ -0,0 +1,136 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.endpoint_benchmarks import (
+    Budgets,
+    DatasetSize,
+    EndpointResult,
+    benchmark_endpoints,
+    compare_results,
+    load_budgets,
+)
+from gchqnet.quest.models import ScoreboardEntry
+
+SMALL_DATASET = DatasetSize(users=20, locations=10, groups=2, captures=80)
+
+
+def _queries(results: list[EndpointResult]) -> dict[str, int]:
+    return {result["name"]: result["queries"] for result in results}
+
+
+def _result(name: str, queries: int) -> EndpointResult:
+    return EndpointResult(name=name, status_code=200, queries=queries, time_ms=5, max_time_ms=6, memory_kib=10)
+
+
+@pytest.mark.django_db
+class TestBenchmarkEndpoints:
+    def test_within_query_budgets(self) -> None:
+        # Arrange
+        budgets = load_budgets()
+
+        # Act
+        results = benchmark_endpoints(dataset=SMALL_DATASET, repeat=2)
+
+        # Assert
+        assert {result["name"] for result in results} == set(budgets["endpoints"])
+        assert all(result["status_code"] == 200 for result in results)
+        comparisons = compare_results(results, budgets)
+        assert {c["name"]: c["over_budget"] for c in comparisons if "queries" in c["over_budget"]} == {}
+        assert not User.objects.exists()
+
+    def test_capture_runs_on_commit_callbacks(self) -> None:
+        # Arrange
+        entries = []
+
+        def on_result(result: EndpointResult) -> None:
+            if result["name"] == "badge_capture":
+                entries.extend(ScoreboardEntry.objects.filter(user__username__startswith="benchmark-capture-"))
+
+        # Act
+        benchmark_endpoints(dataset=SMALL_DATASET, repeat=1, on_result=on_result)
+
+        # Assert
+        assert len(entries) == 3
+        assert all(entry.current_score > 0 for entry in entries)
+
+    def test_queries_do_not_grow_with_dataset(self) -> None:
+        # Act
+        small = benchmark_endpoints(dataset=SMALL_DATASET, repeat=1)
+        large = benchmark_endpoints(dataset=DatasetSize(users=60, locations=30, groups=4, captures=400), repeat=1)
+
+        # Assert
+        assert _queries(large) == _queries(small)
+
+
+class TestCompareResults:
+    def test_compare(self) -> None:
+        # Arrange
+        budgets = Budgets(
+            dataset=SMALL_DATASET,
+            endpoints={"a": {"queries": 2, "time_ms": 10, "memory_kib": 100}},
+        )
+
+        # Act
+        comparisons = compare_results([_result("a", 3), _result("b", 1)], budgets, [_result("a", 2)])
+
+        # Assert
+        assert comparisons[0]["over_budget"] == ["queries"]
+        assert comparisons[0]["baseline"] == _result("a", 2)
+        assert comparisons[1]["budget"] is None
+        assert comparisons[1]["over_budget"] == []
+
+
+@pytest.mark.django_db
+class TestBenchmarkEndpointsCommand:
+    def _write_budgets(self, tmp_path: Path, queries: int) -> Path:
+        budgets = load_budgets()
+        budgets["dataset"] = SMALL_DATASET
+        # Time and memory depend on the machine, so only the query budgets are tested.
+        for budget in budgets["endpoints"].values():
+            budget["queries"] = queries
+            budget["time_ms"] = 60_000
+            budget["memory_kib"] = 1024 * 1024
+        path = tmp_path / "budgets.json"
+        path.write_text(json.dumps(budgets))
+        return path
+
+    def test_save_and_compare_baseline(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        # Arrange
+        budgets = self._write_budgets(tmp_path, 100)
+        baseline = tmp_path / "baseline.json"
+        call_command("benchmark_endpoints", repeat=1, budgets=budgets, save_baseline=baseline)
+        capsys.readouterr()
+
+        # Act
+        call_command("benchmark_endpoints", repeat=1, budgets=budgets, baseline=baseline, check=True)
+
+        # Assert
+        out = capsys.readouterr().out
+        assert "badge_player 200" in out
+        assert "queries / 100 (+0)" in out
+        assert "All endpoints are within budget" in out
+        assert {result["name"] for result in json.loads(baseline.read_text())} == set(load_budgets()["endpoints"])
+
+    def test_check_without_root_key(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        # Arrange
+        budgets = self._write_budgets(tmp_path, 100)
+
+        # Act / Assert
+        with override_settings(), pytest.raises(CommandError, match="Not benchmarked: badge_capture"):
+            del settings.HEXPANSION_ROOT_KEY
+            call_command("benchmark_endpoints", repeat=1, budgets=budgets, check=True)
+        assert "Not benchmarked: badge_capture" in capsys.readouterr().out
+
+    def test_check_over_budget(self, tmp_path: Path) -> None:
+        # Arrange
+        budgets = self._write_budgets(tmp_path, 0)
+
+        # Act / Assert
+        with pytest.raises(CommandError, match="Over the query budget: badge_player, badge_otp"):
+            call_command("benchmark_endpoints", repeat=1, budgets=budgets, check=True)
@@ -0,0 +1,100 @@
+import pytest
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from pytest_django.live_server_helper import LiveServer
+
+from gchqnet.accounts.models import Badge, User
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.fleet import arrival_times, simulate_fleet
+from gchqnet.quest.models import CaptureEvent
+
+
+class TestArrivalTimes:
+    @pytest.mark.parametrize(
+        ("curve", "expected"),
+        [
+            ("instant", [0, 0, 0, 0]),
+            ("linear", [0, 2.5, 5, 7.5]),
+            ("opening", [0, 1.34, 2.93, 5]),
+        ],
+    )
+    def test_arrival_times(self, curve: str, expected: list[float]) -> None:
+        # Act
+        times = arrival_times(4, curve, 10)  # type: ignore[arg-type]
+
+        # Assert
+        assert times == pytest.approx(expected, abs=0.01)
+
+
+@pytest.mark.django_db
+class TestSimulateFleet:
+    def test_in_process(self, user: User) -> None:
+        # Arrange
+        for _ in range(4):
+            LocationFactory(created_by=user)
+
+        # Act
+        report = simulate_fleet(
+            badges=5, root_key=settings.HEXPANSION_ROOT_KEY, concurrency=1, captures=3, repeat_ratio=0.5
+        )
+
+        # Assert
+        assert report["error_breakdown"] == {}
+        assert report["requests"] == 25
+        assert report["endpoints"]["capture"]["requests"] == 15
+        assert report["endpoints"]["player"]["p50_ms"] > 0
+        assert Badge.objects.filter(mac_address__startswith="06-").count() == 5
+        assert CaptureEvent.objects.count() == 15 - report["repeat_captures"]
+
+    def test_wrong_root_key(self, user: User) -> None:
+        # Arrange
+        LocationFactory(created_by=user)
+
+        # Act
+        report = simulate_fleet(badges=2, root_key=bytearray(32), concurrency=1, captures=1)
+
+        # Assert
+        assert report["errors"] == 2
+        assert list(report["error_breakdown"]) == ["capture 400: Invalid HMAC - Contact Support"]
+        assert not CaptureEvent.objects.exists()
+
+    def test_no_locations(self) -> None:
+        # Act / Assert
+        with pytest.raises(ValueError, match="no hexpansions"):
+            simulate_fleet(badges=1, root_key=settings.HEXPANSION_ROOT_KEY)
+
+    def test_command(self, user: User, capsys: pytest.CaptureFixture[str]) -> None:
+        # Arrange
+        LocationFactory(created_by=user)
+
+        # Act
+        call_command("simulate_badges", badges=2, concurrency=1, captures=2)
+
+        # Assert
+        out = capsys.readouterr().out
+        assert "8 requests from 2 badges" in out
+        assert "2 were repeats" in out
+        assert "No requests failed" in out
+
+    def test_command_invalid_root_key(self) -> None:
+        # Act / Assert
+        with pytest.raises(CommandError, match="--root-key must be hex"):
+            call_command("simulate_badges", root_key="not hex")
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSimulateFleetHTTP:
+    def test_http(self, live_server: LiveServer, user: User) -> None:
+        # Arrange
+        for _ in range(3):
+            LocationFactory(created_by=user)
+
+        # Act
+        report = simulate_fleet(
+            badges=4, root_key=settings.HEXPANSION_ROOT_KEY, base_url=live_server.url, concurrency=1, captures=3
+        )
+
+        # Assert
+        assert report["error_breakdown"] == {}
+        assert report["requests"] == 20
+        assert CaptureEvent.objects.count() == 12 - report["repeat_captures"]
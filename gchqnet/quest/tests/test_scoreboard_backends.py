@@ -0,0 +1,231 @@
+import os
+from collections.abc import Iterator
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from gchqnet.accounts.models import User
+from gchqnet.quest.factories import LocationFactory
+from gchqnet.quest.models import ScoreboardEntry
+from gchqnet.quest.models.leaderboard import Leaderboard
+from gchqnet.quest.repository import get_global_scoreboard, get_private_scoreboard, record_attempted_capture
+from gchqnet.quest.scoreboard_backends import (
+    BaseScoreboardBackend,
+    LazyScoreboard,
+    ScoreboardPlayer,
+    get_scoreboard_backend,
+)
+from gchqnet.quest.scoreboard_backends.database import DatabaseScoreboardBackend
+from gchqnet.quest.scoreboard_backends.memory import MemoryScoreboardBackend
+from gchqnet.quest.scoreboard_backends.redis import RedisScoreboardBackend
+
+MEMORY_BACKEND = {"BACKEND": "gchqnet.quest.scoreboard_backends.memory.MemoryScoreboardBackend"}
+FAILING_BACKEND = {"BACKEND": "gchqnet.quest.tests.test_scoreboard_backends.FailingScoreboardBackend"}
+
+# The Redis backend is only tested if a Redis server is available.
+TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL")
+
+
+class FailingScoreboardBackend(MemoryScoreboardBackend):
+    def set_player(self, player: ScoreboardPlayer) -> None:
+        raise ConnectionError("The scoreboard backend is unavailable")
+
+    def increment_player(self, user_id: int, *, score_delta: int, capture_delta: int) -> None:
+        raise ConnectionError("The scoreboard backend is unavailable")
+
+
+def _player(user_id: int, score: int, captures: int = 0) -> ScoreboardPlayer:
+    return ScoreboardPlayer(
+        user_id=user_id,
+        username=f"user-{user_id}",
+        display_name=f"User {user_id}",
+        current_score=score,
+        capture_count=captures,
+    )
+
+
+def _capture(user: User, difficulty: int) -> None:
+    location = LocationFactory(created_by=user, difficulty=difficulty)
+    badge = user.badges.first()
+    assert badge
+
+    record_attempted_capture(badge, location.hexpansion, rand=b"1", hmac="a" * 64, app_rev="0.0.0", fw_rev="0.0.0")
+
+
+class TestMemoryScoreboardBackend:
+    def test_dense_rank(self) -> None:
+        backend = MemoryScoreboardBackend()
+        backend.rebuild([_player(1, 10), _player(2, 30), _player(3, 10), _player(4, 0)])
+
+        page = backend.get_page(0, 10)
+
+        assert [(row["user_id"], row["rank"]) for row in page] == [(2, 1), (1, 2), (3, 2), (4, 3)]
+
+    def test_page(self) -> None:
+        backend = MemoryScoreboardBackend()
+        backend.rebuild([_player(i, i * 5) for i in range(10)])
+
+        page = backend.get_page(2, 4)
+
+        assert [(row["user_id"], row["rank"]) for row in page] == [(7, 3), (6, 4)]
+
+    def test_increment_player(self) -> None:
+        backend = MemoryScoreboardBackend()
+        backend.rebuild([_player(1, 10), _player(2, 20)])
+
+        backend.increment_player(1, score_delta=15, capture_delta=1)
+
+        assert backend.get_page(0, 1)[0] == {**_player(1, 25, 1), "rank": 1}
+
+    def test_increment_unknown_player_is_ignored(self) -> None:
+        backend = MemoryScoreboardBackend()
+
+        backend.increment_player(1, score_delta=15, capture_delta=1)
+
+        assert backend.count() == 0
+
+    def test_set_and_remove_player(self) -> None:
+        backend = MemoryScoreboardBackend()
+        backend.set_player(_player(1, 10))
+        backend.set_player(_player(2, 10))
+
+        backend.remove_player(1)
+
+        assert backend.get_players([1, 2]) == [_player(2, 10)]
+
+    def test_lazy_scoreboard(self) -> None:
+        backend = MemoryScoreboardBackend()
+        backend.rebuild([_player(i, i * 5) for i in range(10)])
+
+        scoreboard = LazyScoreboard(backend)
+
+        assert len(scoreboard) == 10
+        assert scoreboard[0]["user_id"] == 9
+        assert scoreboard[-1]["user_id"] == 0
+        assert [row["user_id"] for row in scoreboard[8:20]] == [1, 0]
+        assert len(list(scoreboard)) == 10
+        with pytest.raises(IndexError):
+            scoreboard[10]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMemoryBackendScoreboards:
+    @pytest.fixture(autouse=True)
+    def _memory_backend(self) -> Iterator[None]:
+        with override_settings(SCOREBOARD_BACKEND=MEMORY_BACKEND):
+            yield
+
+    def test_changes_are_sent_to_backend(self, user: User, user_2: User) -> None:
+        # Act
+        _capture(user, 10)
+
+        # Assert
+        scoreboard = {row["user_id"]: row for row in get_global_scoreboard()}
+        assert (scoreboard[user.id]["rank"], scoreboard[user.id]["current_score"]) == (1, 10)
+        assert (scoreboard[user_2.id]["rank"], scoreboard[user_2.id]["current_score"]) == (2, 0)
+
+    def test_private_scoreboard(self, user: User, user_2: User, superuser: User) -> None:
+        # Arrange
+        leaderboard = Leaderboard.objects.create(display_name="foo", owner=user, created_by=user)
+        leaderboard.members.set([user_2, superuser])
+        _capture(superuser, 20)
+        _capture(user_2, 10)
+
+        # Act
+        scoreboard = get_private_scoreboard(leaderboard)
+
+        # Assert
+        assert [(row["user_id"], row["rank"], row["current_score"]) for row in scoreboard] == [
+            (superuser.id, 1, 20),
+            (user_2.id, 2, 10),
+        ]
+
+    def test_rebuild_command_repopulates_backend(self, user: User) -> None:
+        # Arrange
+        _capture(user, 10)
+        get_scoreboard_backend().rebuild([])
+
+        # Act
+        call_command("rebuild_scoreboard")
+
+        # Assert
+        scoreboard = get_global_scoreboard()
+        assert len(scoreboard) == User.objects.filter(is_superuser=False).count()
+        assert scoreboard[0]["user_id"] == user.id
+        assert scoreboard[0]["current_score"] == 10
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFailingScoreboardBackend:
+    @pytest.fixture(autouse=True)
+    def _failing_backend(self) -> Iterator[None]:
+        with override_settings(SCOREBOARD_BACKEND=FAILING_BACKEND):
+            yield
+
+    def test_capture_is_committed(self, user: User) -> None:
+        # Act
+        _capture(user, 10)
+
+        # Assert
+        assert ScoreboardEntry.objects.get(user=user).current_score == 10
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request: pytest.FixtureRequest) -> Iterator[BaseScoreboardBackend]:
+    if request.param == "memory":
+        yield MemoryScoreboardBackend()
+        return
+
+    if not TEST_REDIS_URL:
+        pytest.skip("TEST_REDIS_URL is not set")
+    redis_backend = RedisScoreboardBackend(url=TEST_REDIS_URL, key_prefix="gchqnet:test-scoreboard")
+    yield redis_backend
+    redis_backend.client.delete(*redis_backend.keys)
+
+
+@pytest.mark.django_db
+class TestScoreboardBackendOrder:
+    """The backends must order players in the same way as the database, so that pages do not overlap."""
+
+    def _database_players(self) -> list[ScoreboardPlayer]:
+        # Players with equal scores and captures are split across pages of two.
+        for i, (score, captures, display_name) in enumerate(
+            [(10, 2, "d"), (20, 1, "b"), (10, 1, "c"), (10, 1, "a"), (20, 1, "ab"), (10, 2, "bb"), (0, 0, "e")]
+        ):
+            user = User.objects.create(username=f"order-{i}", display_name=display_name)
+            ScoreboardEntry.objects.filter(user=user).update(current_score=score, capture_count=captures)
+        return list(
+            ScoreboardEntry.objects.values("user_id", "username", "display_name", "current_score", "capture_count")
+        )
+
+    def _pages(self, backend: BaseScoreboardBackend) -> list[tuple[int, int]]:
+        rows = []
+        for start in range(0, backend.count(), 2):
+            rows += [(row["user_id"], row["rank"]) for row in backend.get_page(start, start + 2)]
+        return rows
+
+    def test_rebuild(self, backend: BaseScoreboardBackend) -> None:
+        # Arrange
+        players = self._database_players()
+
+        # Act
+        backend.rebuild(players)
+
+        # Assert
+        assert self._pages(backend) == self._pages(DatabaseScoreboardBackend())
+
+    def test_incremental_changes(self, backend: BaseScoreboardBackend) -> None:
+        # Arrange
+        players = self._database_players()
+        for player in players:
+            backend.set_player({**player, "current_score": 0, "capture_count": 0})
+
+        # Act
+        for player in players:
+            backend.increment_player(
+                player["user_id"], score_delta=player["current_score"], capture_delta=player["capture_count"]
+            )
+
+        # Assert
+        assert self._pages(backend) == self._pages(DatabaseScoreboardBackend())
@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from notifications.models import Notification
+
+from gchqnet.accounts.models import User
+from gchqnet.achievements.models import LocationGroupAchievementEvent, LocationGroupProgress
+from gchqnet.quest.models import CaptureEvent, Location, ScoreRecord, UserScore
+from gchqnet.quest.models.activity import ActivityEvent
+from gchqnet.quest.models.scores import ScoreboardEntry
+from gchqnet.quest.repository.integrity import check_integrity
+from gchqnet.quest.synthetic import delete_dataset, generate_dataset
+
+START = datetime(2026, 5, 30, 9, tzinfo=UTC)
+
+
+def _generate(**kwargs: object) -> dict:
+    return dict(
+        generate_dataset(
+            users=30,
+            locations=12,
+            groups=4,
+            captures=150,
+            start=START,
+            days=3,
+            chunk_size=7,
+            **kwargs,  # type: ignore[arg-type]
+        )
+    )
+
+
+def _snapshot() -> set[tuple[str, str, datetime]]:
+    return set(CaptureEvent.objects.values_list("created_by__username", "location__display_name", "created_at"))
+
+
+@pytest.mark.django_db
+class TestGenerateDataset:
+    def test_generate(self) -> None:
+        # Act
+        stats = _generate()
+
+        # Assert
+        assert (stats["users"], stats["locations"], stats["groups"]) == (30, 12, 4)
+        assert 100 < stats["captures"] < 200
+        assert User.objects.filter(is_superuser=False).count() == 30
+        assert CaptureEvent.objects.count() == stats["captures"]
+        assert LocationGroupAchievementEvent.objects.count() == stats["group_completions"]
+        assert ScoreRecord.objects.count() == stats["captures"] + stats["group_completions"]
+        assert ActivityEvent.objects.count() == ScoreRecord.objects.count()
+        assert Notification.objects.count() == stats["notifications"]
+        assert LocationGroupProgress.objects.exists()
+        assert UserScore.objects.filter(user__is_superuser=False).count() == 30
+        assert ScoreboardEntry.objects.count() == 30
+
+    def test_consistent(self) -> None:
+        # Arrange
+        _generate()
+
+        # Act
+        results = check_integrity(dry_run=True)
+
+        # Assert
+        assert {result["name"]: result["found"] for result in results if result["found"]} == {}
+
+    def test_time_profile(self) -> None:
+        # Act
+        _generate(profile="opening")
+
+        # Assert
+        created_at = list(CaptureEvent.objects.values_list("created_at", flat=True))
+        assert all(START <= timestamp <= START + timedelta(days=3) for timestamp in created_at)
+        assert sum(timestamp < START + timedelta(days=1) for timestamp in created_at) > len(created_at) / 2
+
+    def test_daily_profile(self) -> None:
+        # Act
+        _generate(profile="daily")
+
+        # Assert
+        hours = {
+            timezone.localtime(timestamp).hour
+            for timestamp in CaptureEvent.objects.values_list("created_at", flat=True)
+        }
+        assert not hours & {3, 4, 5, 6}
+
+    def test_seeded(self) -> None:
+        # Arrange
+        with transaction.atomic():
+            _generate(seed=1)
+            expected = _snapshot()
+            transaction.set_rollback(True)
+
+        # Act
+        _generate(seed=1)
+
+        # Assert
+        assert _snapshot() == expected
+
+
+@pytest.mark.django_db
+class TestDeleteDataset:
+    def test_delete(self, superuser: User) -> None:
+        # Arrange
+        _generate()
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            delete_dataset()
+
+        # Assert
+        assert list(User.objects.all()) == [superuser]
+        assert not Location.objects.exists()
+        assert not CaptureEvent.objects.exists()
+        assert not ScoreboardEntry.objects.exists()
+        assert not ScoreRecord.objects.exists()
+        # The captures are deleted with a single query, without being loaded first.
+        capture_deletes = [
+            query["sql"] for query in ctx.captured_queries if 'DELETE FROM "quest_captureevent"' in query["sql"]
+        ]
+        assert capture_deletes == ['DELETE FROM "quest_captureevent"']
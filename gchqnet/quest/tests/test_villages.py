@@ -0,0 +1,235 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import Client, override_settings
+from django.urls import reverse_lazy
+
+from gchqnet.quest.villages import (
+    VILLAGES_CACHE_KEY,
+    VILLAGES_LOCK_KEY,
+    CachedVillages,
+    VillagesUnavailableError,
+    get_villages,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def _villages(name: str) -> dict[str, Any]:
+    return {"type": "FeatureCollection", "features": [{"type": "Feature", "properties": {"name": name}}]}
+
+
+class StubUpstream:
+    """A local HTTP server that stands in for the EMF website."""
+
+    def __init__(self) -> None:
+        self.status = HTTPStatus.OK
+        self.body: Any = _villages("first")
+        self.requests = 0
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                stub.requests += 1
+                content = json.dumps(stub.body).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/villages.geojson"
+
+    def __enter__(self) -> "StubUpstream":
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def upstream(tmp_path: Path) -> Iterator[StubUpstream]:
+    with (
+        StubUpstream() as stub,
+        override_settings(
+            CACHES=LOCMEM_CACHES,
+            VILLAGES_GEOJSON_URL=stub.url,
+            VILLAGES_CACHE_PATH=tmp_path / "villages.geojson",
+            VILLAGES_MAX_AGE=600,
+        ),
+    ):
+        cache.clear()
+        yield stub
+        cache.clear()
+
+
+def _store(data: dict[str, Any], *, age: float) -> None:
+    cache.set(VILLAGES_CACHE_KEY, CachedVillages(data=data, fetched_at=time.time() - age), timeout=None)
+
+
+class TestGetVillages:
+    def test_cold_start_fetches_upstream(self, upstream: StubUpstream, tmp_path: Path) -> None:
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("first")
+        assert upstream.requests == 1
+        assert json.loads((tmp_path / "villages.geojson").read_text())["data"] == _villages("first")
+
+    def test_fresh_is_served_from_cache(self, upstream: StubUpstream) -> None:
+        # Arrange
+        get_villages()
+        upstream.body = _villages("second")
+
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("first")
+        assert upstream.requests == 1
+
+    def test_stale_is_refreshed(self, upstream: StubUpstream) -> None:
+        # Arrange
+        _store(_villages("old"), age=601)
+
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("first")
+        assert upstream.requests == 1
+
+    def test_stale_is_served_while_another_request_refreshes(self, upstream: StubUpstream) -> None:
+        # Arrange
+        _store(_villages("old"), age=601)
+        cache.add(VILLAGES_LOCK_KEY, "refreshing")
+
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("old")
+        assert upstream.requests == 0
+
+    def test_stale_is_served_when_upstream_fails(self, upstream: StubUpstream) -> None:
+        # Arrange
+        _store(_villages("old"), age=601)
+        upstream.status = HTTPStatus.BAD_GATEWAY
+
+        # Act
+        first = get_villages()
+        second = get_villages()
+
+        # Assert
+        assert first == second == _villages("old")
+        # The upstream is not retried until the lock expires.
+        assert upstream.requests == 1
+
+    def test_invalid_upstream_response_is_not_stored(self, upstream: StubUpstream) -> None:
+        # Arrange
+        _store(_villages("old"), age=601)
+        upstream.body = {"error": "maintenance"}
+
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("old")
+
+    def test_last_known_good_is_served_after_cache_is_cleared(self, upstream: StubUpstream) -> None:
+        # Arrange
+        get_villages()
+        cache.clear()
+        upstream.status = HTTPStatus.BAD_GATEWAY
+
+        # Act
+        data = get_villages()
+
+        # Assert
+        assert data == _villages("first")
+        assert upstream.requests == 1
+
+    def test_unavailable(self, upstream: StubUpstream) -> None:
+        # Arrange
+        upstream.status = HTTPStatus.BAD_GATEWAY
+
+        # Act / Assert
+        with pytest.raises(VillagesUnavailableError):
+            get_villages()
+        with pytest.raises(VillagesUnavailableError):
+            get_villages()
+        assert upstream.requests == 1
+
+    def test_concurrent_cold_requests_fetch_once(self, upstream: StubUpstream) -> None:
+        # Arrange
+        results: list[dict[str, Any]] = []
+
+        def _get() -> None:
+            results.append(get_villages())
+
+        threads = [threading.Thread(target=_get) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert results == [_villages("first")] * 8
+        assert upstream.requests == 1
+
+
+@pytest.mark.django_db
+class TestVillagesAPI:
+    url = reverse_lazy("api:locations-villages")
+
+    def test_get(self, client: Client, upstream: StubUpstream) -> None:
+        resp = client.get(self.url)
+
+        assert resp.status_code == HTTPStatus.OK
+        assert resp["Content-Type"] == "application/geo+json"
+        assert resp.json() == _villages("first")
+
+    def test_unavailable(self, client: Client, upstream: StubUpstream) -> None:
+        upstream.status = HTTPStatus.BAD_GATEWAY
+
+        resp = client.get(self.url)
+
+        assert resp.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert resp.json() == {"detail": "The villages are not available."}
+
+
+class TestRefreshVillagesCommand:
+    def test_refresh(self, upstream: StubUpstream) -> None:
+        # Arrange
+        _store(_villages("old"), age=0)
+
+        # Act
+        call_command("refresh_villages")
+
+        # Assert
+        assert get_villages() == _villages("first")
+
+    def test_refresh_fails(self, upstream: StubUpstream) -> None:
+        upstream.status = HTTPStatus.BAD_GATEWAY
+
+        with pytest.raises(CommandError):
+            call_command("refresh_villages")
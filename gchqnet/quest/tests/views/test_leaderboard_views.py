@@ -118,7 +118,7 @@ class TestLeaderboardDetailView:
         assertTemplateUsed(resp, "pages/quest/leaderboard_detail.html")
         assertContains(resp, f"Leaderboard: {leaderboard.display_name}")
 
-        assert list(resp.context["page_obj"]) == [user]
+        assert [row["user_id"] for row in resp.context["page_obj"]] == [user.id]
 
     def test_get_leaderboard_owner(self, client: Client, user: User) -> None:
         # Arrange
@@ -137,7 +137,7 @@ class TestLeaderboardDetailView:
         assertContains(resp, f"Leaderboard: {leaderboard.display_name}")
         assertContains(resp, "Settings")
 
-        assert set(resp.context["page_obj"]) == {user, other_user}
+        assert {row["user_id"] for row in resp.context["page_obj"]} == {user.id, other_user.id}
 
 
 @pytest.mark.django_db
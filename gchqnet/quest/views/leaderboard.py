@@ -18,7 +18,7 @@ from gchqnet.core.mixins import BreadcrumbsMixin
 from gchqnet.quest.forms import LeaderboardCreateForm, LeaderboardInviteAcceptDeclineForm, LeaderboardUpdateForm
 from gchqnet.quest.models import Leaderboard
 from gchqnet.quest.repository import get_private_scoreboard
-from gchqnet.quest.repository.scoreboards import get_recent_events_for_users
+from gchqnet.quest.repository.activity import get_recent_events_for_users
 
 
 class LeaderboardListView(LoginRequiredMixin, BreadcrumbsMixin, ListView):
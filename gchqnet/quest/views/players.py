@@ -14,7 +14,8 @@ from gchqnet.achievements.repository import get_achievements_for_user
 from gchqnet.core.mixins import BreadcrumbsMixin
 from gchqnet.quest.models.captures import CaptureEvent
 from gchqnet.quest.models.location import Location
-from gchqnet.quest.repository.scoreboards import get_recent_events_for_users
+from gchqnet.quest.repository.activity import get_recent_events_for_users
+from gchqnet.quest.repository.found_locations import get_found_locations
 
 
 class BasePlayerDetailView(BreadcrumbsMixin, AccessMixin, DetailView):
@@ -35,12 +36,13 @@ class BasePlayerDetailView(BreadcrumbsMixin, AccessMixin, DetailView):
         return super().get_object(queryset)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-        find_count = self.object.get_capture_count()
+        found_locations = get_found_locations(self.object.id)
+        find_count = len(found_locations)
 
         return super().get_context_data(
             current_user=self.kwargs["current_user"],
             find_count=find_count,
-            to_find_count=Location.objects.count() - find_count,
+            to_find_count=len(found_locations.bit_indexes) - find_count,
             **kwargs,
         )
 
@@ -71,12 +73,8 @@ class PlayerFindsView(BasePlayerDetailView):
         page = paginator.page(page_num)
 
         if self.request.user.is_authenticated:
-            viewer_captures = set(
-                self.request.user.capture_events.filter(
-                    location__in=page.object_list.values("location_id"),  # type: ignore[attr-defined]
-                ).values_list("location_id", flat=True),
-            )
-            finds = ((obj, obj.location_id in viewer_captures) for obj in page.object_list)
+            viewer_found_locations = get_found_locations(self.request.user.id)
+            finds = ((obj, obj.location_id in viewer_found_locations) for obj in page.object_list)
         else:
             finds = ((obj, False) for obj in page.object_list)
 
@@ -144,8 +142,8 @@ class MyProfileUnfoundLocationsView(LoginRequiredMixin, BreadcrumbsMixin, Detail
         return self.request.user
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-        found_locations = self.object.capture_events.values("location")
-        locations_to_find = Location.objects.exclude(id__in=found_locations)
+        found_locations = get_found_locations(self.object.id)
+        locations_to_find = Location.objects.filter(id__in=found_locations.unfound_location_ids())
 
         try:
             page_num = int(self.request.GET.get("page", 1))
@@ -158,7 +156,7 @@ class MyProfileUnfoundLocationsView(LoginRequiredMixin, BreadcrumbsMixin, Detail
         return super().get_context_data(
             active_tab="to_find",
             current_user=True,
-            find_count=Location.objects.count() - paginator.count,
+            find_count=len(found_locations),
             to_find_count=paginator.count,
             locations=page,
             **kwargs,
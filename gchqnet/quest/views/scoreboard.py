@@ -14,7 +14,7 @@ from gchqnet.core.mixins import BreadcrumbsMixin
 from gchqnet.quest.repository import get_global_scoreboard, get_recent_events_for_users
 
 if TYPE_CHECKING:
-    from gchqnet.accounts.models import UserQuerySet
+    from gchqnet.quest.scoreboard_backends import ScoreboardRows
 
 
 class GlobalScoreboardView(BreadcrumbsMixin, ListView):
@@ -44,7 +44,7 @@ class GlobalScoreboardView(BreadcrumbsMixin, ListView):
             return query.strip()
         return query
 
-    def get_queryset(self) -> UserQuerySet:
+    def get_queryset(self) -> ScoreboardRows:
         return get_global_scoreboard(search_query=self.get_search_query())
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
@@ -59,11 +59,7 @@ class GlobalRecentActivityView(BreadcrumbsMixin, TemplateView):
     breadcrumbs = [(reverse_lazy("quest:home"), "Global Leaderboard"), (None, "Recent Activity")]
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-        from gchqnet.accounts.models import User
-
-        player_qs = User.objects.all()
-
-        events, user_found_locations = get_recent_events_for_users(player_qs, current_user=self.request.user)
+        events, user_found_locations = get_recent_events_for_users(None, current_user=self.request.user)
 
         return super().get_context_data(
             events=events,
@@ -0,0 +1,144 @@
+"""
+A proxy for the villages GeoJSON from the EMF website, which is shown as a layer on the maps.
+
+The villages are kept in the shared cache and served from there, even once they are stale. When they are stale,
+one request refreshes them while holding a lock in the cache, and every other request is served the stale copy in
+the meantime. If the refresh fails, the lock is kept until it expires, so that the upstream is not retried by every
+request while it is down.
+
+A last-known-good copy is kept on disk, so that the maps still have villages after the cache has been cleared, even
+if the upstream is down. Villages should normally be refreshed on a schedule by ./manage.py refresh_villages.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, TypedDict
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VILLAGES_CACHE_KEY = "quest:villages"
+VILLAGES_LOCK_KEY = "quest:villages:lock"
+
+# How long a refresh may take before another request can try, and how long to wait after a failed refresh.
+REFRESH_LOCK_TIMEOUT = 10
+UPSTREAM_TIMEOUT = 2
+POLL_INTERVAL = 0.1
+
+_REFRESHING = "refreshing"
+_FAILED = "failed"
+
+
+class CachedVillages(TypedDict):
+    data: dict[str, Any]
+    fetched_at: float
+
+
+class VillagesUnavailableError(Exception):
+    pass
+
+
+def fetch_villages() -> dict[str, Any]:
+    resp = requests.get(settings.VILLAGES_GEOJSON_URL, timeout=UPSTREAM_TIMEOUT)
+    resp.raise_for_status()
+    data = resp.json()
+    if not isinstance(data, dict) or data.get("type") != "FeatureCollection":
+        raise ValueError("The villages are not a GeoJSON feature collection")
+    return data
+
+
+def _read_last_known_good() -> CachedVillages | None:
+    try:
+        entry = json.loads(Path(settings.VILLAGES_CACHE_PATH).read_text())
+        return CachedVillages(data=entry["data"], fetched_at=entry["fetched_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_last_known_good(entry: CachedVillages) -> None:
+    path = Path(settings.VILLAGES_CACHE_PATH)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that a reader never sees a partial copy.
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(entry))
+        tmp_path.replace(path)
+    except OSError:
+        logger.exception("Unable to write the last known good villages to %s", path)
+
+
+def refresh_villages() -> CachedVillages:
+    """Fetch the villages from the upstream, and store them in the cache and on disk."""
+    entry = CachedVillages(data=fetch_villages(), fetched_at=time.time())
+    cache.set(VILLAGES_CACHE_KEY, entry, timeout=None)
+    _write_last_known_good(entry)
+    return entry
+
+
+def _is_stale(entry: CachedVillages) -> bool:
+    return time.time() - entry["fetched_at"] > settings.VILLAGES_MAX_AGE
+
+
+def _refresh_once() -> tuple[bool, CachedVillages | None]:
+    """
+    Refresh the villages, unless another request is already doing so.
+
+    Returns whether the lock was acquired, and the new villages if the refresh succeeded.
+    """
+    if not cache.add(VILLAGES_LOCK_KEY, _REFRESHING, timeout=REFRESH_LOCK_TIMEOUT):
+        return False, None
+
+    # Another request may have finished a refresh just before the lock was acquired.
+    current: CachedVillages | None = cache.get(VILLAGES_CACHE_KEY)
+    if current is not None and not _is_stale(current):
+        cache.delete(VILLAGES_LOCK_KEY)
+        return True, current
+
+    try:
+        entry = refresh_villages()
+    except (requests.RequestException, ValueError):
+        logger.warning("Unable to refresh the villages", exc_info=True)
+        cache.set(VILLAGES_LOCK_KEY, _FAILED, timeout=REFRESH_LOCK_TIMEOUT)
+        return True, None
+
+    cache.delete(VILLAGES_LOCK_KEY)
+    return True, entry
+
+
+def get_villages() -> dict[str, Any]:
+    """
+    Get the villages, refreshing them if they are stale.
+
+    Raises VillagesUnavailableError if there is no copy of the villages and they cannot be fetched.
+    """
+    entry: CachedVillages | None = cache.get(VILLAGES_CACHE_KEY)
+    if entry is None and (entry := _read_last_known_good()) is not None:
+        cache.add(VILLAGES_CACHE_KEY, entry, timeout=None)
+
+    if entry is not None:
+        if _is_stale(entry):
+            _, refreshed = _refresh_once()
+            entry = refreshed or entry
+        return entry["data"]
+
+    # There is nothing to serve, so wait for whichever request is fetching the villages.
+    deadline = time.monotonic() + REFRESH_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        acquired, entry = _refresh_once()
+        if entry is None:
+            entry = cache.get(VILLAGES_CACHE_KEY)
+        if entry is not None:
+            return entry["data"]
+        if acquired or cache.get(VILLAGES_LOCK_KEY) == _FAILED:
+            break
+        time.sleep(POLL_INTERVAL)
+
+    raise VillagesUnavailableError("The villages are not available")